@@ -0,0 +1,63 @@
+"""
+Shared helpers for benchmarks that drive careercraft_appV7.py through
+Streamlit's AppTest harness (streamlit>=1.28).
+"""
+
+import contextlib
+import os
+import statistics
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "careercraft_appV7.py")
+
+# Keep benchmark runs from binding the metrics port or writing snapshots and events
+os.environ.setdefault("METRICS_PORT", "0")
+os.environ.setdefault("METRICS_FILE", "")
+os.environ.setdefault("EVENTS_DIR", "")
+os.environ.setdefault("ANALYTICS_DIR", "")
+# Checkouts without the font build (the OFL sources are not committed) still run
+os.environ.setdefault("FONT_CDN_FALLBACK", "1")
+
+def new_app(timeout=30, **state):
+    """AppTest for the app, starting from a Session built with **state."""
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    import careercraft_nav
+    from careercraft_session import Session
+
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    if state:
+        at.session_state[careercraft_nav.SESSION_KEY] = Session(**state)
+    return at
+
+@contextlib.contextmanager
+def count_deltas():
+    """Count every element delta the script enqueues for the frontend."""
+    from streamlit.delta_generator import DeltaGenerator
+
+    counter = {"deltas": 0}
+    original = DeltaGenerator._enqueue
+
+    def counting(self, *args, **kwargs):
+        counter["deltas"] += 1
+        return original(self, *args, **kwargs)
+
+    DeltaGenerator._enqueue = counting
+    try:
+        yield counter
+    finally:
+        DeltaGenerator._enqueue = original
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+def summarize(values):
+    return {
+        "median": statistics.median(values),
+        "p95": percentile(values, 0.95),
+        "max": max(values),
+    }
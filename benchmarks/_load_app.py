@@ -0,0 +1,27 @@
+"""
+Streamlit entry point for bench_load.py: careercraft_appV7.py with every
+coach provider stubbed to answer after BENCH_COACH_LATENCY seconds, so a
+live worker can be load-tested without API keys or network.
+"""
+
+import os
+import runpy
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Streamlit reruns this file on every click; add the repo root only once
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import careercraft_coach
+
+def stub_reply(user_msg, context):
+    time.sleep(float(os.environ.get("BENCH_COACH_LATENCY", "0.8")))
+    return f"Stubbed advice for: {user_msg}", None
+
+for name in careercraft_coach.COACH_PROVIDERS:
+    careercraft_coach.COACH_PROVIDERS[name] = stub_reply
+careercraft_coach.check_api_status = lambda: {"claude": True, "chatgpt": True, "gemini": True}
+
+runpy.run_path(os.path.join(ROOT, "careercraft_appV7.py"), run_name="__main__")
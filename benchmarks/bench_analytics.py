@@ -0,0 +1,105 @@
+"""
+Streaming analytics: sketch accuracy, merge correctness and query cost.
+
+Splits synthetic coach latencies and questionnaire results across several
+simulated workers, merges their snapshots as the admin view does, and checks
+the merged quantiles against exact values from the raw data. Then times
+summary() after 1k and after 100k results to show query cost does not grow
+with volume. A final AppTest run opens the admin view with ?admin=<token>.
+
+Usage:
+    python benchmarks/bench_analytics.py [--workers 4] [--latencies 400000] [--results 100000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _apptest import ROOT, new_app
+
+sys.path.insert(0, ROOT)
+
+from careercraft_analytics import QUANTILES, Aggregates
+from careercraft_engine import ANSWER_VALUES, QUESTIONS, calculate_career_matches
+
+
+def random_answers(rng):
+    return {q["id"]: rng.choice(ANSWER_VALUES) for q in QUESTIONS}
+
+def summary_time(aggregates, repeats=200):
+    started = time.perf_counter()
+    for _ in range(repeats):
+        aggregates.summary()
+    return (time.perf_counter() - started) / repeats
+
+def admin_view():
+    os.environ["ADMIN_TOKEN"] = "bench-token"
+    at = new_app()
+    at.query_params["admin"] = "bench-token"
+    at.run()
+    if at.exception:
+        raise SystemExit(f"admin view failed: {at.exception}")
+    return len(at.dataframe)
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming analytics accuracy and query cost.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latencies", type=int, default=400_000)
+    parser.add_argument("--results", type=int, default=100_000)
+    args = parser.parse_args()
+    rng = random.Random(0)
+    np_rng = np.random.default_rng(0)
+
+    latencies = np_rng.lognormal(mean=0.3, sigma=0.8, size=args.latencies)
+    workers = [Aggregates() for _ in range(args.workers)]
+    started = time.perf_counter()
+    for i, seconds in enumerate(latencies.tolist()):
+        workers[i % args.workers].add_coach("Claude", "live", seconds)
+    per_add = (time.perf_counter() - started) / args.latencies
+
+    answers = [random_answers(rng) for _ in range(args.results)]
+    started = time.perf_counter()
+    for i, a in enumerate(answers):
+        workers[i % args.workers].add_results(a)
+    per_result = (time.perf_counter() - started) / args.results
+
+    # Merge through JSON, exactly as snapshots on disk are merged
+    merged = Aggregates()
+    for worker in workers:
+        merged.merge(Aggregates.from_dict(json.loads(json.dumps(worker.to_dict()))))
+    summary = merged.summary()
+
+    print(f"{args.workers} workers, {args.latencies:,} coach latencies, {args.results:,} results")
+    print(f"record cost: {per_add * 1e6:.2f} us/latency, {per_result * 1e6:.2f} us/result")
+    print(f"{'coach latency':14s} {'exact':>8s} {'sketch':>8s} {'rel err':>8s}")
+    for q in QUANTILES:
+        exact = float(np.quantile(latencies, q, method="lower"))
+        estimate = summary["coach"]["Claude"][q]
+        print(f"{'p' + str(int(q * 100)):14s} {exact:8.3f} {estimate:8.3f} {abs(estimate - exact) / exact:8.3%}")
+
+    career_id = calculate_career_matches(answers[0])[0]["career"]["id"]
+    exact_matches = sorted(
+        next(m["match"] for m in calculate_career_matches(a) if m["career"]["id"] == career_id) for a in answers
+    )
+    for q in QUANTILES:
+        exact = exact_matches[int(q * (len(exact_matches) - 1))]
+        if summary["matches"][career_id][q] != exact:
+            raise SystemExit(f"{career_id} p{q}: merged {summary['matches'][career_id][q]} != exact {exact}")
+    print(f"match % quantiles for {career_id} equal the exact values after merging")
+
+    small = Aggregates()
+    for a in answers[:1000]:
+        small.add_results(a)
+    print(f"summary(): {summary_time(small) * 1e3:.3f} ms at 1k results, "
+          f"{summary_time(merged) * 1e3:.3f} ms at {args.results // 1000}k")
+    print(f"admin view through AppTest: {admin_view()} tables rendered")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Scoring throughput: JSON API requests/sec vs Streamlit UI sessions/sec.
+
+Starts careercraft_api.py under uvicorn, drives POST /v1/matches from client
+threads over keep-alive connections for a fixed time, then runs complete UI
+sessions (landing, seven answers, results) through AppTest for comparison.
+Both paths produce the same matches for the same answers.
+
+Usage:
+    python benchmarks/bench_api_throughput.py [--seconds 5] [--clients 4] [--workers 2] [--sessions 5]
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _apptest import ROOT, new_app, percentile
+from bench_render_deltas import COMPLETE_ANSWERS
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def wait_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit("API did not start")
+
+def api_throughput(port, seconds, clients):
+    body = json.dumps({"answers": COMPLETE_ANSWERS, "top": 3})
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop = time.monotonic() + seconds
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        own = []
+        while time.monotonic() < stop:
+            started = time.perf_counter()
+            conn.request("POST", "/v1/matches", body=body, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            response.read()
+            own.append(time.perf_counter() - started)
+            if response.status != 200:
+                errors[0] += 1
+        with lock:
+            latencies.extend(own)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return len(latencies) / seconds, latencies, errors[0]
+
+def ui_session():
+    at = new_app()
+    at.run()
+    at.button(key="start_check").click().run()
+    for i, (question_id, value) in enumerate(COMPLETE_ANSWERS.items()):
+        at.button(key=f"q_{question_id}_{value}").click().run()
+        at.button(key="q_results" if i == len(COMPLETE_ANSWERS) - 1 else "q_next").click().run()
+    if at.exception or not at.markdown:
+        raise SystemExit(f"UI session failed: {at.exception}")
+
+def main():
+    parser = argparse.ArgumentParser(description="API requests/sec vs UI sessions/sec.")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--sessions", type=int, default=5)
+    args = parser.parse_args()
+
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "careercraft_api.py"), "--port", str(port), "--workers", str(args.workers)],
+        cwd=ROOT,
+    )
+    try:
+        wait_ready(port)
+        rate, latencies, errors = api_throughput(port, args.seconds, args.clients)
+    finally:
+        server.terminate()
+        server.wait()
+
+    started = time.perf_counter()
+    for _ in range(args.sessions):
+        ui_session()
+    ui_rate = args.sessions / (time.perf_counter() - started)
+
+    print(f"API  POST /v1/matches  {rate:10.0f} req/s  "
+          f"p50 {percentile(latencies, 0.5) * 1000:.2f} ms  p99 {percentile(latencies, 0.99) * 1000:.2f} ms  "
+          f"({args.workers} workers, {args.clients} clients, {errors} errors)")
+    print(f"UI   full session      {ui_rate:10.2f} sessions/s  (landing, 7 answers, results; 1 process)")
+    print(f"one API scoring call costs {ui_rate / rate:.5f} of a UI session ({rate / ui_rate:,.0f}x)")
+
+if __name__ == "__main__":
+    main()
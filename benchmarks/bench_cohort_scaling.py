@@ -0,0 +1,81 @@
+"""
+Cohort scoring throughput from 1 to N cores with the shared-memory scorer.
+
+Scores the same random answer matrix single-process (top_matches), then at
+1, 2, 4 ... N workers both with SharedScorer and with a plain process pool
+that pickles row slices and results (what careercraft_batch --workers does
+without --shared-memory), checking every result matches. Pools are warmed
+up before timing so process start-up is not counted. Speedup over the single
+process needs as many free cores as workers; with fewer, the shared/pickled
+ratio still shows what sharing saves.
+
+Usage:
+    python benchmarks/bench_cohort_scaling.py [--rows 2000000] [--max-workers N] [--repeats 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from careercraft_batch import QUESTIONS, VALUES, SharedScorer, top_matches
+
+def best_of(fn, repeats):
+    best = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def pickled_top_matches(pool, workers, answers, k):
+    bounds = np.linspace(0, len(answers), workers + 1, dtype=int)
+    parts = list(pool.map(top_matches, [answers[a:b] for a, b in zip(bounds[:-1], bounds[1:])], [k] * workers))
+    return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+
+def worker_counts(limit):
+    count = 1
+    while count < limit:
+        yield count
+        count *= 2
+    yield limit
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared-memory cohort scoring, 1..N cores.")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--top", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    answers = rng.choice(VALUES, size=(args.rows, len(QUESTIONS)))
+    answers[rng.random(answers.shape) < 0.05] = np.nan
+
+    baseline, (order, match) = best_of(lambda: top_matches(answers, args.top), args.repeats)
+    print(f"{args.rows:,} rows, top {args.top}, {os.cpu_count()} CPUs visible")
+    if args.max_workers > (os.cpu_count() or 1):
+        print(f"note: {args.max_workers} workers on {os.cpu_count()} CPU(s); speedups above that are not measurable here")
+    print(f"{'mode':22s} {'seconds':>8s} {'rows/s':>12s} {'speedup':>8s} {'vs pickled':>10s}")
+    print(f"{'single process':22s} {baseline:8.3f} {args.rows / baseline:12,.0f} {1.0:8.2f}")
+    for workers in worker_counts(args.max_workers):
+        with ProcessPoolExecutor(workers) as pool:
+            pickled_top_matches(pool, workers, answers[:workers], args.top)
+            pickled, _ = best_of(lambda: pickled_top_matches(pool, workers, answers, args.top), args.repeats)
+        with SharedScorer(workers) as scorer:
+            scorer.top_matches(answers[:workers], args.top)
+            elapsed, (got_order, got_match) = best_of(lambda: scorer.top_matches(answers, args.top), args.repeats)
+        if not (np.array_equal(order, got_order) and np.array_equal(match, got_match)):
+            raise SystemExit(f"{workers} workers: results differ from single-process scoring")
+        print(f"{f'pickled, {workers} workers':22s} {pickled:8.3f} {args.rows / pickled:12,.0f} {baseline / pickled:8.2f}")
+        print(f"{f'shared, {workers} workers':22s} {elapsed:8.3f} {args.rows / elapsed:12,.0f} "
+              f"{baseline / elapsed:8.2f} {pickled / elapsed:10.2f}")
+
+if __name__ == "__main__":
+    main()
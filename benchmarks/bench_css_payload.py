@@ -0,0 +1,51 @@
+"""
+Bytes sent over the websocket per rerun for the stylesheet, before and after
+moving it to a hashed static file.
+
+Sizes are the serialized ForwardMsg for one markdown element when Streamlit is
+installed, otherwise the UTF-8 body size.
+
+Usage:
+    python benchmarks/bench_css_payload.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Checkouts without the font build (the OFL sources are not committed) still run
+os.environ.setdefault("FONT_CDN_FALLBACK", "1")
+
+import careercraft_assets
+
+def message_bytes(body):
+    try:
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    except ImportError:
+        return len(body.encode("utf-8")), "utf-8 body"
+    msg = ForwardMsg()
+    msg.delta.new_element.markdown.body = body
+    msg.delta.new_element.markdown.allow_html = True
+    return msg.ByteSize(), "ForwardMsg"
+
+def main():
+    with open(careercraft_assets.STYLESHEET_SOURCE, encoding="utf-8") as f:
+        source = careercraft_assets.font_faces_css() + f.read()
+    filename, css = careercraft_assets.build_stylesheet()
+    link = careercraft_assets.font_preload_tags() + careercraft_assets.stylesheet_link(filename or "careercraft.unbuilt.css")
+
+    rows = [
+        ("before: inline <style>", f"\n<style>\n{source}</style>\n"),
+        ("inline minified (no static serving)", f"<style>{css}</style>"),
+        ("after: hashed <link>", link),
+    ]
+    before = None
+    for name, body in rows:
+        size, unit = message_bytes(body)
+        before = before or size
+        print(f"{name:38s} {size:7d} bytes/rerun ({unit}, {size / before:6.1%})")
+    print(f"static file {filename}: {len(css.encode('utf-8'))} bytes, fetched once per browser")
+
+if __name__ == "__main__":
+    main()
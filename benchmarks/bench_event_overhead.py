@@ -0,0 +1,66 @@
+"""
+Per-event cost of careercraft_events.emit() on the request path.
+
+Times emit() with the background flusher running, against the naive
+alternative of formatting and writing each event synchronously through a
+logging file handler. Then waits for the flusher and checks every emitted
+event reached disk (or was counted as dropped).
+
+Usage:
+    python benchmarks/bench_event_overhead.py [--events 50000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import careercraft_events
+
+def per_event(fn, count):
+    started = time.perf_counter()
+    for i in range(count):
+        fn("answer", "bench-session", question="technical", value=80)
+    return (time.perf_counter() - started) / count
+
+def sync_logger(path):
+    logger = logging.getLogger("bench.sync-events")
+    logger.propagate = False
+    logger.addHandler(logging.FileHandler(path))
+    logger.setLevel(logging.INFO)
+
+    def write(name, sid=None, **fields):
+        logger.info(json.dumps({"ts": round(time.time(), 3), "event": name, "sid": sid, **fields},
+                               separators=(",", ":")))
+    return write
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-event overhead of the event pipeline.")
+    parser.add_argument("--events", type=int, default=50_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        careercraft_events.start_pipeline(scratch, interval=0.2)
+        buffered = per_event(careercraft_events.emit, args.events)
+        synchronous = per_event(sync_logger(os.path.join(scratch, "sync.jsonl")), args.events)
+
+        time.sleep(1.0)
+        path = os.path.join(scratch, f"events-{os.getpid()}.jsonl")
+        with open(path) as f:
+            written = sum(1 for _ in f)
+        dropped = careercraft_events.DROPPED.series.get((), 0)
+
+    print(f"emit() into ring buffer   {buffered * 1e6:7.3f} us/event")
+    print(f"synchronous JSON logging  {synchronous * 1e6:7.3f} us/event  ({synchronous / buffered:.0f}x)")
+    print(f"flushed {written:,} of {args.events:,} events, {dropped:,} dropped "
+          f"(buffer {careercraft_events.BUFFER_SIZE:,})")
+    if written + dropped != args.events:
+        raise SystemExit("events went missing")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Cold-start import cost of the coach module, lazy vs the old eager SDK imports.
+
+Each sample is a fresh interpreter so nothing is cached in sys.modules.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    "lazy (careercraft_coach)": "import careercraft_coach",
+    "eager (coach + SDKs)": (
+        "import careercraft_coach\n"
+        "for name in ('anthropic', 'openai', 'google.generativeai'):\n"
+        "    try:\n"
+        "        __import__(name)\n"
+        "    except ImportError:\n"
+        "        pass"
+    ),
+}
+
+TIMER = "import time\nstarted = time.perf_counter()\n{body}\nprint(time.perf_counter() - started)"
+
+def sample(body):
+    out = subprocess.run(
+        [sys.executable, "-c", TIMER.format(body=body)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    medians = {}
+    for name, body in CASES.items():
+        times = [sample(body) for _ in range(args.runs)]
+        medians[name] = statistics.median(times)
+        print(f"{name:28s} median {medians[name] * 1000:8.1f} ms  "
+              f"min {min(times) * 1000:8.1f} ms  max {max(times) * 1000:8.1f} ms")
+    lazy, eager = medians.values()
+    print(f"{'startup saving':28s} {(eager - lazy) * 1000:8.1f} ms per worker cold start")
+
+if __name__ == "__main__":
+    main()
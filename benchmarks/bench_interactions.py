@@ -0,0 +1,81 @@
+"""
+Script execution time per interaction, full rerun vs fragment rerun.
+
+Before fragments every answer click and coach submit re-executed the whole
+script; that cost is measured here with AppTest on the question and results
+pages. After fragments only the fragment body runs. AppTest always reruns
+the whole script, but the app times each fragment body separately in
+careercraft_script_run_seconds{scope="questions"|"coach"}, so the same runs
+also yield the after side: the fragment's share of each full rerun. That
+leaves out Streamlit's fixed per-run overhead, which both sides pay.
+--metrics-url additionally prints the live quantiles from a running app.
+
+Usage:
+    python benchmarks/bench_interactions.py [--runs 20] [--metrics-url http://127.0.0.1:9464/metrics]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _apptest import new_app, summarize
+from bench_render_deltas import COMPLETE_ANSWERS
+import careercraft_telemetry
+
+# name: (fragment scope, starting session state)
+INTERACTIONS = {
+    "answer click": ("questions", {"page": "home", "step": "questions", "question_idx": 3}),
+    "coach submit": ("coach", {"page": "home", "step": "results", "answers": COMPLETE_ANSWERS}),
+}
+
+def scope_seconds(scope):
+    _, total = careercraft_telemetry.SCRIPT_SECONDS.series.get((("scope", scope),), (None, 0.0))
+    return total
+
+def rerun_times(scope, state, runs):
+    """(full rerun times, fragment body times) over the same AppTest runs."""
+    at = new_app(**state)
+    at.run()
+    full, fragment = [], []
+    for _ in range(runs):
+        before = scope_seconds(scope)
+        started = time.perf_counter()
+        at.run()
+        full.append(time.perf_counter() - started)
+        fragment.append(scope_seconds(scope) - before)
+    if not any(fragment):
+        raise SystemExit(f"fragment scope {scope!r} never ran")
+    return full, fragment
+
+def fragment_quantiles(url):
+    text = urllib.request.urlopen(url, timeout=5).read().decode("utf-8")
+    pattern = re.compile(r'careercraft_script_run_seconds_quantile\{scope="(\w+)",quantile="([\d.]+)"\} ([\d.]+)')
+    quantiles = {}
+    for scope, q, value in pattern.findall(text):
+        quantiles.setdefault(scope, {})[q] = float(value)
+    return quantiles
+
+def main():
+    parser = argparse.ArgumentParser(description="Script time per interaction.")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--metrics-url", help="/metrics of a running app for fragment timings")
+    args = parser.parse_args()
+
+    for name, (scope, state) in INTERACTIONS.items():
+        full, fragment = rerun_times(scope, state, args.runs)
+        for label, times in ((f"{name} (full rerun)", full), (f"{name} (fragment {scope})", fragment)):
+            stats = summarize(times)
+            print(f"{label:36s} median {stats['median'] * 1000:7.1f} ms  p95 {stats['p95'] * 1000:7.1f} ms")
+        print(f"{'':36s} {summarize(full)['median'] / summarize(fragment)['median']:.1f}x less script time")
+    if args.metrics_url:
+        for scope, values in sorted(fragment_quantiles(args.metrics_url).items()):
+            print(f"{'live scope=' + scope:32s} p50 {values.get('0.5', 0) * 1000:7.1f} ms  "
+                  f"p95 {values.get('0.95', 0) * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""
+Load test: how many simultaneous sessions one worker process can carry.
+
+Starts one live `streamlit run` worker and drives it over its websocket
+with many clients at once, each speaking the browser's protobuf protocol
+for a scripted visit: landing, start, seven random answers, results, one
+coach question. Each client is one browser session on the same worker, so
+the sessions share its threads, GIL and memory the way real users do.
+Answer buttons sit in a fragment, so those clicks rerun the fragment alone,
+as they do in a browser. The worker runs benchmarks/_load_app.py, the app
+with coach providers stubbed by a fixed sleep, so no API keys or network
+are needed.
+
+For each concurrency level it reports per-step latency percentiles (click
+sent to script finished), script runs per session (full and fragment, from
+the worker's script_finished messages), completed sessions/s, the worker's
+CPU use and memory (from /proc, so Linux only) and its session state (from
+its /metrics endpoint). The clients run in this process and share the
+host's CPUs with the worker; the CPU figure is the worker's alone. A level
+fails if any visit errors, and the script exits non-zero.
+
+Usage:
+    python benchmarks/bench_load.py [--users 1,4,8,16] [--visits 2] [--coach-latency 0.8]
+"""
+
+import argparse
+import asyncio
+import collections
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _apptest import ROOT, percentile
+
+sys.path.insert(0, ROOT)
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+from careercraft_engine import ANSWER_VALUES, QUESTIONS
+
+LOAD_APP = os.path.join(ROOT, "benchmarks", "_load_app.py")
+STEPS = ("landing", "start", "answer", "next", "results", "coach")
+COACH_QUESTIONS = (
+    "Which skill should I build this quarter?",
+    "How do I explain a career change in interviews?",
+    "Is a certificate worth it for my top match?",
+)
+FINAL = (
+    ForwardMsg.FINISHED_SUCCESSFULLY,
+    ForwardMsg.FINISHED_WITH_COMPILE_ERROR,
+    ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+)
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_worker(coach_latency):
+    """One `streamlit run` process; returns (process, app port, metrics port)."""
+    port, metrics_port = free_port(), free_port()
+    env = dict(os.environ, BENCH_COACH_LATENCY=str(coach_latency), METRICS_PORT=str(metrics_port))
+    # A file, not a pipe: nobody reads the log while the worker runs, and a full pipe would stall it
+    log = tempfile.TemporaryFile()
+    worker = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", LOAD_APP,
+         "--server.headless", "true", "--server.port", str(port), "--server.address", "127.0.0.1",
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=log,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if worker.poll() is not None:
+            log.seek(0)
+            raise SystemExit(f"worker exited with {worker.returncode}: {log.read().decode()[-2000:]}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return worker, port, metrics_port
+        except OSError:
+            time.sleep(0.2)
+    worker.kill()
+    raise SystemExit("worker did not become healthy within 60s")
+
+def worker_usage(pid):
+    """(CPU seconds, RSS bytes, peak RSS bytes) of the worker, from /proc."""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    with open(f"/proc/{pid}/statm") as f:
+        rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    with open(f"/proc/{pid}/status") as f:
+        peak = next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmHWM:"))
+    return cpu, rss, peak
+
+def session_metrics(metrics_port):
+    """(live sessions, session state bytes) from the worker's /metrics."""
+    with urllib.request.urlopen(f"http://127.0.0.1:{metrics_port}/metrics", timeout=5) as response:
+        text = response.read().decode()
+    sessions = re.search(r"^careercraft_sessions (\S+)$", text, re.M)
+    total = re.search(r'^careercraft_session_memory_bytes\{stat="total"\} (\S+)$', text, re.M)
+    return (int(float(sessions.group(1))) if sessions else None,
+            int(float(total.group(1))) if total else None)
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+class LiveSession:
+    """One browser session: sends reruns with widget states, reads deltas back."""
+
+    def __init__(self, ws, timeout):
+        self.ws = ws
+        self.timeout = timeout
+        self.query_string = ""
+        self.page_script_hash = ""
+        self.widgets = {}          # key (or element type, for unkeyed widgets) -> (id, fragment id, element)
+        self.full_runs = 0
+        self.fragment_runs = 0
+
+    def widget(self, key):
+        try:
+            return self.widgets[key]
+        except KeyError:
+            raise RuntimeError(f"no widget {key!r} on the page") from None
+
+    async def rerun(self, click=None, values=()):
+        """Rerun as the browser would after a click; returns once the script finishes.
+
+        values are (key, field, value) widget states sent along with the click,
+        e.g. ("text_area", "string_value", "How do I start?").
+        """
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = self.query_string
+        state.page_script_hash = self.page_script_hash
+        for key, field, value in values:
+            widget_state = state.widget_states.widgets.add()
+            widget_state.id = self.widget(key)[0]
+            setattr(widget_state, field, value)
+        if click is not None:
+            widget_id, fragment_id, _ = self.widget(click)
+            widget_state = state.widget_states.widgets.add()
+            widget_state.id = widget_id
+            widget_state.trigger_value = True
+            state.fragment_id = fragment_id
+        await self.ws.send(msg.SerializeToString())
+        await self.read_until_finished()
+
+    async def read_until_finished(self):
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await asyncio.wait_for(self.ws.recv(), self.timeout))
+            kind = msg.WhichOneof("type")
+            if kind == "new_session":
+                self.page_script_hash = msg.new_session.page_script_hash
+                if not msg.new_session.fragment_ids_this_run:
+                    self.widgets = {}
+            elif kind == "page_info_changed":
+                self.query_string = msg.page_info_changed.query_string
+            elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                self.add_element(msg.delta.new_element, msg.delta.fragment_id)
+            elif kind == "script_finished":
+                if msg.script_finished == ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY:
+                    self.fragment_runs += 1
+                else:
+                    self.full_runs += 1
+                if msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise RuntimeError("script failed to compile")
+                if msg.script_finished in FINAL:
+                    return
+
+    def add_element(self, element, fragment_id):
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            raise RuntimeError(f"{element.exception.type}: {element.exception.message}")
+        widget_id = getattr(getattr(element, kind), "id", "")
+        if not widget_id:
+            return
+        # Widget ids end in the user's key, or "None" for unkeyed widgets
+        key = widget_id.rsplit("-", 1)[-1]
+        self.widgets[kind if key == "None" else key] = (widget_id, fragment_id, getattr(element, kind))
+
+async def visit(url, rng, timings, timeout):
+    """One scripted session; returns its LiveSession for the run counts."""
+    async with connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        session = LiveSession(ws, timeout)
+
+        async def timed(step, **rerun):
+            started = time.perf_counter()
+            try:
+                await session.rerun(**rerun)
+            except Exception as e:
+                raise RuntimeError(f"{step}: {e or type(e).__name__}") from None
+            timings[step].append(time.perf_counter() - started)
+
+        await timed("landing")
+        await timed("start", click="start_check")
+        for i, question in enumerate(QUESTIONS):
+            await timed("answer", click=f"q_{question['id']}_{rng.choice(ANSWER_VALUES)}")
+            last = i == len(QUESTIONS) - 1
+            await timed("results" if last else "next", click="q_results" if last else "q_next")
+        coaches = session.widget("radio")[2].options
+        await timed("coach", click="coach_btn", values=[
+            ("radio", "string_value", rng.choice(coaches)),
+            ("text_area", "string_value", rng.choice(COACH_QUESTIONS)),
+        ])
+        return session
+
+# =============================================================================
+# LEVELS
+# =============================================================================
+
+async def run_level(url, users, visits, seed, timeout):
+    timings = collections.defaultdict(list)
+    failures = []
+    runs = [0, 0]
+
+    async def user(n):
+        rng = random.Random(seed * 1000 + n)
+        for _ in range(visits):
+            try:
+                session = await visit(url, rng, timings, timeout)
+            except Exception as e:
+                failures.append(str(e) or type(e).__name__)
+                continue
+            runs[0] += session.full_runs
+            runs[1] += session.fragment_runs
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user(n) for n in range(users)))
+    wall = time.perf_counter() - started
+    sessions = users * visits - len(failures)
+    return {
+        "timings": timings,
+        "failures": failures,
+        "sessions": sessions,
+        "wall": wall,
+        "full_runs": runs[0] / max(sessions, 1),
+        "fragment_runs": runs[1] / max(sessions, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent websocket sessions against one live worker.")
+    parser.add_argument("--users", default="1,4,8,16", help="Comma-separated concurrency levels")
+    parser.add_argument("--visits", type=int, default=2, help="Full visits per simulated user")
+    parser.add_argument("--coach-latency", type=float, default=0.8, help="Seconds each stubbed coach call sleeps")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for any one script run")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    worker, port, metrics_port = start_worker(args.coach_latency)
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    failed = False
+    try:
+        # One untimed visit so imports and first-run caches are paid before the clock starts
+        asyncio.run(visit(url, random.Random(args.seed), collections.defaultdict(list), args.timeout))
+        print(f"{os.cpu_count()} CPUs visible; one worker (pid {worker.pid}); coach stub "
+              f"{args.coach_latency:.2f}s; {args.visits} visit(s) per user")
+        for users in (int(u) for u in args.users.split(",")):
+            cpu_before = worker_usage(worker.pid)[0]
+            level = asyncio.run(run_level(url, users, args.visits, args.seed, args.timeout))
+            cpu_after, rss, peak_rss = worker_usage(worker.pid)
+            live, session_bytes = session_metrics(metrics_port)
+            mib = 1024 * 1024
+            print(f"\n== {users} concurrent user(s): {level['sessions']} sessions in {level['wall']:.1f}s "
+                  f"({level['sessions'] / level['wall']:.2f}/s), worker CPU "
+                  f"{(cpu_after - cpu_before) / level['wall']:.0%} of one core")
+            print(f"   script runs/session: {level['full_runs']:.1f} full + {level['fragment_runs']:.1f} fragment; "
+                  f"worker RSS {rss / mib:.0f} MiB (peak {peak_rss / mib:.0f}); "
+                  f"{live} live sessions holding {session_bytes or 0:,} B of state")
+            print(f"   {'step':8s} {'count':>6s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'max ms':>8s}")
+            for step in STEPS:
+                values = level["timings"].get(step)
+                if values:
+                    print(f"   {step:8s} {len(values):6d} {percentile(values, 0.5) * 1000:8.1f} "
+                          f"{percentile(values, 0.95) * 1000:8.1f} {percentile(values, 0.99) * 1000:8.1f} "
+                          f"{max(values) * 1000:8.1f}")
+            if level["failures"]:
+                failed = True
+                print(f"   FAIL: {len(level['failures'])} failed visit(s), first: {level['failures'][0]}")
+    finally:
+        worker.terminate()
+        try:
+            worker.wait(10)
+        except subprocess.TimeoutExpired:
+            worker.kill()
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
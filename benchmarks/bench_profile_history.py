@@ -0,0 +1,110 @@
+"""
+Profile history size and range-query cost.
+
+Fills a scratch database with snapshots for many accounts (each answer set a
+small random walk from the last, as on a retake), then reports bytes per
+snapshot against the same data as JSON, append throughput, and the time for
+a "last N snapshots" range query as one account's history grows: it should
+stay flat because only the rows back to the preceding keyframe are read.
+A final AppTest run completes the questionnaire as a signed-in session and
+checks the snapshot lands.
+
+Usage:
+    python benchmarks/bench_profile_history.py [--accounts 500] [--snapshots 40]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _apptest import ROOT, new_app, percentile
+from bench_render_deltas import COMPLETE_ANSWERS
+
+sys.path.insert(0, ROOT)
+
+from careercraft_engine import ANSWER_VALUES, QUESTIONS, calculate_career_matches
+from careercraft_history import TOP_K, ProfileHistory
+
+
+def walk(rng, answers):
+    answers = dict(answers)
+    for _ in range(rng.randint(0, 2)):
+        answers[rng.choice(QUESTIONS)["id"]] = rng.choice(ANSWER_VALUES)
+    return answers
+
+def as_json(answers):
+    matches = [[m["career"]["id"], m["match"]] for m in calculate_career_matches(answers)[:TOP_K]]
+    return len(json.dumps({"answers": answers, "matches": matches}, separators=(",", ":")))
+
+def query_times(history, account, last, repeats=50):
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        history.history(account, start=history.latest(account)["taken"] - last + 0.5)
+        times.append(time.perf_counter() - started)
+    return percentile(times, 0.5)
+
+def form_snapshot(path):
+    os.environ["PROFILE_DB_PATH"] = path
+    at = new_app(account_id="bench-account")
+    at.run()
+    at.button(key="start_check").click().run()
+    for i, (question_id, value) in enumerate(COMPLETE_ANSWERS.items()):
+        at.button(key=f"q_{question_id}_{value}").click().run()
+        at.button(key="q_results" if i == len(COMPLETE_ANSWERS) - 1 else "q_next").click().run()
+    if at.exception:
+        raise SystemExit(f"questionnaire failed: {at.exception}")
+    import careercraft_history
+
+    history = careercraft_history.get_history()
+    # The app queues snapshots for the background writer; write them now
+    history.flush()
+    latest = history.latest("bench-account")
+    return latest is not None and latest["answers"] == COMPLETE_ANSWERS
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile history size and range-query cost.")
+    parser.add_argument("--accounts", type=int, default=500)
+    parser.add_argument("--snapshots", type=int, default=40)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        history = ProfileHistory(os.path.join(scratch, "profiles.db"))
+        json_bytes, appends = 0, 0
+        started = time.perf_counter()
+        for a in range(args.accounts):
+            answers = {q["id"]: rng.choice(ANSWER_VALUES) for q in QUESTIONS}
+            for s in range(args.snapshots):
+                answers = walk(rng, answers)
+                history.record(f"acct{a}", answers, now=s * 86400.0)
+                json_bytes += as_json(answers)
+                appends += 1
+        elapsed = time.perf_counter() - started
+        conn = history._db.connection()
+        stored, keyframes = conn.execute("SELECT SUM(LENGTH(data)), SUM(keyframe) FROM snapshots").fetchone()
+        print(f"{appends:,} snapshots for {args.accounts} accounts, appended at {appends / elapsed:,.0f}/s")
+        print(f"payload {stored / appends:.1f} B/snapshot ({keyframes} keyframes) vs JSON {json_bytes / appends:.1f} B")
+
+        print(f"{'history length':>15s} {'last 5 (ms)':>12s} {'last 30 (ms)':>13s}")
+        answers = {q["id"]: rng.choice(ANSWER_VALUES) for q in QUESTIONS}
+        grown = 0
+        for length in (40, 400, 4000):
+            while grown < length:
+                answers = walk(rng, answers)
+                history.record("long", answers, now=grown * 86400.0)
+                grown += 1
+            print(f"{length:15,d} {query_times(history, 'long', 5 * 86400) * 1000:12.3f} "
+                  f"{query_times(history, 'long', 30 * 86400) * 1000:13.3f}")
+
+        ok = form_snapshot(os.path.join(scratch, "form.db"))
+        print(f"signed-in questionnaire through AppTest: snapshot {'stored' if ok else 'MISSING'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Element deltas sent to the frontend and script time per page render.
+
+Run it on two revisions to compare, e.g. before and after the template layer:
+
+    python benchmarks/bench_render_deltas.py [--runs 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _apptest import count_deltas, new_app, summarize
+
+COMPLETE_ANSWERS = {
+    "technical": 80, "people_energy": 60, "people_style": 40, "analysis": 95,
+    "structure": 60, "learning": 80, "client_facing": 20,
+}
+
+PAGES = {
+    "landing": {"page": "home", "step": "landing"},
+    "questions": {"page": "home", "step": "questions", "question_idx": 3},
+    "results": {"page": "home", "step": "results", "answers": COMPLETE_ANSWERS},
+    "about": {"page": "about"},
+    "usecases": {"page": "usecases"},
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Deltas and render time per page.")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'page':10s} {'deltas':>7s} {'median ms':>10s} {'p95 ms':>8s}")
+    for name, state in PAGES.items():
+        times = []
+        deltas = 0
+        for _ in range(args.runs):
+            at = new_app(**state)
+            with count_deltas() as counter:
+                started = time.perf_counter()
+                at.run()
+                times.append(time.perf_counter() - started)
+            if at.exception:
+                raise SystemExit(f"{name}: {at.exception}")
+            deltas = counter["deltas"]
+        stats = summarize(times)
+        print(f"{name:10s} {deltas:7d} {stats['median'] * 1000:10.1f} {stats['p95'] * 1000:8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Script runs per click, asserted to be exactly one.
+
+Drives a whole visit through AppTest (nav, personas, questionnaire, results,
+signup) and counts what each click would cost a live session. AppTest always
+reruns the whole script, even for a button inside an st.fragment, so the
+count is modelled: a click on a fragment's widget costs one fragment run,
+plus a full run if it changed the page or step (the fragment has to hand
+over with st.rerun()). Any other click costs the full runs counted from
+careercraft_script_run_seconds. Fragment membership is recorded by noting
+which buttons are drawn while a timed fragment scope is executing. Exits
+non-zero if any click costs more than one run.
+
+Usage:
+    python benchmarks/bench_reruns.py
+"""
+
+import functools
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _apptest import new_app
+import careercraft_nav
+from careercraft_engine import QUESTIONS
+import careercraft_telemetry
+
+_scope = threading.local()
+fragment_keys = {}
+
+def track_fragment_widgets():
+    """Record the fragment scope every button is drawn in."""
+    import streamlit as st
+
+    timed = careercraft_telemetry.timed
+
+    def tracking_timed(scope):
+        def decorator(fn):
+            inner = timed(scope)(fn)
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                previous, _scope.name = getattr(_scope, "name", None), scope
+                try:
+                    return inner(*args, **kwargs)
+                finally:
+                    _scope.name = previous
+            return wrapper
+        return decorator
+
+    button = st.button
+
+    def tracking_button(label, key=None, *args, **kwargs):
+        scope = getattr(_scope, "name", None)
+        if key is not None and scope not in (None, "app"):
+            fragment_keys[key] = scope
+        return button(label, key, *args, **kwargs)
+
+    careercraft_telemetry.timed = tracking_timed
+    st.button = tracking_button
+
+def app_runs():
+    counts, _ = careercraft_telemetry.SCRIPT_SECONDS.series.get((("scope", "app"),), (None, 0.0))
+    return sum(counts) if counts else 0
+
+def where(at):
+    session = at.session_state[careercraft_nav.SESSION_KEY]
+    return session.page, session.step, session.show_signup
+
+def visit():
+    yield "nav_about"
+    yield "nav_usecases"
+    yield "tile_darius"
+    yield "persona_next"
+    yield "persona_prev"
+    yield "nav_home"
+    yield "start_check"
+    yield "q_exit"
+    yield "start_check"
+    yield "q_next"              # nothing answered yet: stays on question 1
+    for i, question in enumerate(QUESTIONS):
+        yield f"q_{question['id']}_80"
+        if i == 1:
+            yield "q_back"
+            yield "q_next"
+        yield "q_results" if i == len(QUESTIONS) - 1 else "q_next"
+    yield "results_signup"
+    yield "signup_cancel"
+    yield "start_over"
+
+def main():
+    track_fragment_widgets()
+    at = new_app()
+    at.run()
+    failures = 0
+    for key in visit():
+        scope = fragment_keys.get(key)
+        before, runs_before = where(at), app_runs()
+        fragment_keys.clear()
+        at.button(key=key).click().run()
+        if at.exception:
+            raise SystemExit(f"{key}: {at.exception}")
+        if scope:
+            runs = 1 + (where(at) != before)
+            detail = f"fragment {scope}" + (" + full handoff" if runs > 1 else "")
+        else:
+            runs = app_runs() - runs_before
+            detail = "full"
+        status = "ok" if runs == 1 else "FAIL"
+        failures += runs != 1
+        print(f"{key:28s} {runs} run(s) {detail:34s} {status}")
+    if failures:
+        raise SystemExit(f"{failures} click(s) cost more than one script run")
+    print("every click cost exactly one script run")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Memory per session: the old loose session_state values vs the slotted Session.
+
+Builds N finished sessions (all seven answers, a coach answer) each way and
+measures what tracemalloc sees them allocate. The coach text is copied per
+session, as it would be when decoded from a provider response.
+
+Usage:
+    python benchmarks/bench_session_memory.py [--sessions 5000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from careercraft_session import Session, memory_stats
+from bench_render_deltas import COMPLETE_ANSWERS
+
+COACH_TEXT = (
+    "Start by talking to two Product Managers about their week. Then pick one small project "
+    "you can finish in a month, and note which parts you enjoyed.\n\n"
+) * 4
+
+def loose(i):
+    # What st.session_state held per session before: separate keys, a dict of answers
+    return {
+        "page": "home",
+        "step": "results",
+        "question_idx": 6,
+        "answers": dict(COMPLETE_ANSWERS),
+        "coach_response": (COACH_TEXT + str(i))[:-1],
+        "coach_provider": "".join(["Cla", "ude"]),
+        "coach_error": None,
+        "show_signup": False,
+        "persona_idx": 0,
+    }
+
+def compact(i):
+    return Session(
+        page="home", step="results", question_idx=6, answers=COMPLETE_ANSWERS,
+        coach_response=(COACH_TEXT + str(i))[:-1], coach_provider="".join(["Cla", "ude"]),
+    )
+
+def measure(build, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return sessions, (after - before) / count
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes per session, loose dict vs Session.")
+    parser.add_argument("--sessions", type=int, default=5000)
+    args = parser.parse_args()
+
+    _, loose_bytes = measure(loose, args.sessions)
+    sessions, compact_bytes = measure(compact, args.sessions)
+    print(f"{'layout':12s} {'bytes/session':>14s}")
+    print(f"{'loose dict':12s} {loose_bytes:14.0f}")
+    print(f"{'Session':12s} {compact_bytes:14.0f}  ({compact_bytes / loose_bytes:.0%})")
+    stats = memory_stats()
+    print(f"gauge: {stats['sessions']} sessions, {stats['total']} bytes total, "
+          f"{stats['mean']:.0f} mean, {stats['max']} max")
+    del sessions
+
+if __name__ == "__main__":
+    main()
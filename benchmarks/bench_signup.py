@@ -0,0 +1,108 @@
+"""
+Sign-up latency and password-hashing throughput under concurrent load.
+
+Drives AccountStore.signup from many client threads (one per simulated
+Streamlit session) against a scratch SQLite file, for each hash pool size.
+While that runs a ticker thread sleeps 1 ms at a time and records its
+longest gap: that is how long an unrelated session's script thread could be
+held up by hashing. A final AppTest run submits the real sign-up form and
+checks the account reaches the database.
+
+Usage:
+    python benchmarks/bench_signup.py [--clients 16] [--signups 96] [--pools 1,2,4]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _apptest import ROOT, new_app, percentile
+
+sys.path.insert(0, ROOT)
+
+from careercraft_accounts import AccountError, AccountStore
+
+def ticker(stop, gaps):
+    last = time.perf_counter()
+    while not stop.is_set():
+        time.sleep(0.001)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+def load(path, pool, clients, signups):
+    store = AccountStore(path, hash_workers=pool, backlog=signups)
+    latencies, rejected = [], []
+    lock = threading.Lock()
+    per_client = signups // clients
+
+    def client(c):
+        own, own_rejected = [], 0
+        for i in range(per_client):
+            started = time.perf_counter()
+            try:
+                store.signup(f"user{c}-{i}@example.com", "correct horse battery", "Bench", "User").result()
+            except AccountError:
+                own_rejected += 1
+                continue
+            own.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(own)
+            rejected.append(own_rejected)
+
+    stop, gaps = threading.Event(), []
+    tick = threading.Thread(target=ticker, args=(stop, gaps))
+    tick.start()
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(c,)) for c in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    tick.join()
+    store.close()
+    return latencies, sum(rejected), elapsed, max(gaps)
+
+def form_signup(path):
+    os.environ["ACCOUNTS_DB_PATH"] = path
+    at = new_app(show_signup=True)
+    at.run()
+    at.text_input(key="signup_first").input("Ada")
+    at.text_input(key="signup_email").input("ada@example.com")
+    at.text_input(key="signup_pass").input("analytical engine")
+    at.button(key="signup_submit").click().run()
+    if at.exception or not at.success:
+        raise SystemExit(f"sign-up form failed: {at.exception or [e.value for e in at.error]}")
+    import careercraft_accounts
+
+    careercraft_accounts.get_accounts().flush()
+    return careercraft_accounts.get_accounts().get("ada@example.com") is not None
+
+def main():
+    parser = argparse.ArgumentParser(description="Sign-up latency and hashing throughput.")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--signups", type=int, default=96)
+    parser.add_argument("--pools", default="1,2,4")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        print(f"{args.signups} sign-ups from {args.clients} concurrent sessions, {os.cpu_count()} CPUs")
+        print(f"{'pool':>4s} {'hashes/s':>9s} {'p50 ms':>8s} {'p95 ms':>8s} {'max ms':>8s} {'stall ms':>9s} {'rejected':>9s}")
+        for pool in (int(p) for p in args.pools.split(",")):
+            path = os.path.join(scratch, f"pool{pool}.db")
+            latencies, rejected, elapsed, stall = load(path, pool, args.clients, args.signups)
+            print(f"{pool:4d} {len(latencies) / elapsed:9.1f} {percentile(latencies, 0.5) * 1000:8.1f} "
+                  f"{percentile(latencies, 0.95) * 1000:8.1f} {max(latencies) * 1000:8.1f} "
+                  f"{stall * 1000:9.1f} {rejected:9d}")
+        stored = form_signup(os.path.join(scratch, "form.db"))
+        print(f"sign-up form through AppTest: account {'stored' if stored else 'MISSING'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+CareerCraft – accounts
+Sign-up backed by a WAL-mode SQLite user table shared by every worker on
+the host. Passwords are hashed with scrypt on a small bounded thread pool
+(hashlib releases the GIL while it works), so a burst of sign-ups neither
+blocks other sessions' script threads nor saturates every core. New
+accounts are queued and written in batches by a background thread, and a
+sign-up is only confirmed once its batch has committed, so the table's
+unique email index decides between workers taking the same address.
+"""
+
+import hashlib
+import os
+import re
+import secrets
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+import careercraft_db
+import careercraft_telemetry
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "accounts.db")
+HASH_WORKERS = 2            # concurrent scrypt computations per process
+HASH_BACKLOG = 64           # queued hashes beyond which sign-ups are turned away
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 2 ** 14, 8, 1   # ~16 MiB and ~60 ms per hash
+FLUSH_INTERVAL = 0.5
+BATCH_SIZE = 128
+SIGNUP_TIMEOUT = 30.0       # seconds a sign-up form waits for its hash and write
+MIN_PASSWORD = 8
+
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+HASH_SECONDS = careercraft_telemetry.Histogram(
+    "careercraft_password_hash_seconds", "scrypt time per password hash",
+    careercraft_telemetry.SCRIPT_BUCKETS,
+)
+SIGNUPS = careercraft_telemetry.Counter("careercraft_signups_total", "Sign-up attempts by outcome")
+careercraft_telemetry.METRICS.extend([HASH_SECONDS, SIGNUPS])
+
+class AccountError(Exception):
+    """A sign-up the user can fix or retry; the message is safe to show."""
+
+# =============================================================================
+# PASSWORDS
+# =============================================================================
+
+def hash_password(password, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    """scrypt$n$r$p$salt$hash, with the parameters kept so they can be raised later."""
+    started = time.perf_counter()
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode("utf-8"), salt=salt, n=n, r=r, p=p, maxmem=64 * 1024 * 1024, dklen=32)
+    HASH_SECONDS.observe((("op", "hash"),), time.perf_counter() - started)
+    return f"scrypt${n}${r}${p}${salt.hex()}${digest.hex()}"
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class AccountStore:
+    """Users in a SQLite file; hashing on a bounded pool, inserts written behind."""
+
+    def __init__(self, path=DEFAULT_PATH, hash_workers=HASH_WORKERS, backlog=HASH_BACKLOG,
+                 flush_interval=FLUSH_INTERVAL, batch_size=BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self._pool = ThreadPoolExecutor(hash_workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(hash_workers + backlog)
+        self._lock = threading.Lock()
+        self._flushing = threading.Lock()
+        self._pending = {}   # email -> (account, future confirming its sign-up)
+        self._db = careercraft_db.SQLiteFile(path)
+        conn = self._db.connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS accounts ("
+            "id TEXT PRIMARY KEY, email TEXT NOT NULL UNIQUE, first_name TEXT, last_name TEXT, "
+            "password TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        conn.commit()
+        self._writer = careercraft_db.WriteBehind("account-store", self.flush, flush_interval)
+
+    def _submit(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise AccountError("We're handling a lot of sign-ups right now. Please try again in a moment.")
+        future = self._pool.submit(fn, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def get(self, email):
+        """The account for an email as a dict, including one still waiting to be written."""
+        email = email.strip().lower()
+        with self._lock:
+            pending = self._pending.get(email)
+        if pending is not None:
+            return dict(pending[0])
+        row = self._db.connection().execute(
+            "SELECT id, email, first_name, last_name, password, created FROM accounts WHERE email = ?", (email,)
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("id", "email", "first_name", "last_name", "password", "created"), row))
+
+    def _exists(self, email):
+        return self._db.connection().execute("SELECT 1 FROM accounts WHERE email = ?", (email,)).fetchone() is not None
+
+    def signup(self, email, password, first_name="", last_name=""):
+        """Validate, then hash on the pool; the future resolves to the new account once it is written.
+
+        Raises AccountError straight away for bad input, a taken email or a
+        full hashing backlog, so the form can answer without waiting. The
+        future raises AccountError if another worker took the address first.
+        """
+        email = (email or "").strip().lower()
+        if not EMAIL_RE.match(email):
+            SIGNUPS.inc((("outcome", "invalid"),))
+            raise AccountError("Please enter a valid email address.")
+        if len(password or "") < MIN_PASSWORD:
+            SIGNUPS.inc((("outcome", "invalid"),))
+            raise AccountError(f"Passwords need at least {MIN_PASSWORD} characters.")
+        if self.get(email) is not None:
+            SIGNUPS.inc((("outcome", "exists"),))
+            raise AccountError("An account with that email already exists.")
+        confirmed = Future()
+        try:
+            hashed = self._submit(self._create, email, password, first_name.strip(), last_name.strip(), confirmed)
+        except AccountError:
+            SIGNUPS.inc((("outcome", "busy"),))
+            raise
+        def failed(future):
+            # Hashing or the pending check failed: there is no write to wait for
+            if future.exception() is not None:
+                confirmed.set_exception(future.exception())
+        hashed.add_done_callback(failed)
+        return confirmed
+
+    def create(self, email, password, first_name="", last_name="", timeout=SIGNUP_TIMEOUT):
+        """signup() and wait for the write; returns the new account.
+
+        Raises AccountError for anything signup() refuses, and also when the
+        hash or the write takes longer than timeout seconds.
+        """
+        try:
+            return self.signup(email, password, first_name, last_name).result(timeout=timeout)
+        except FutureTimeout:
+            SIGNUPS.inc((("outcome", "timeout"),))
+            raise AccountError("Creating your account is taking longer than usual. Please try again in a moment.") from None
+
+    def _create(self, email, password, first_name, last_name, confirmed):
+        account = {
+            # Chosen here rather than by SQLite so the caller has it before the write
+            "id": secrets.token_urlsafe(12),
+            "email": email,
+            "first_name": first_name,
+            "last_name": last_name,
+            "password": hash_password(password),
+            "created": time.time(),
+        }
+        # Checked again: another sign-up for the same address may have
+        # finished hashing first
+        with self._lock:
+            taken = email in self._pending or self._exists(email)
+            if not taken:
+                self._pending[email] = (account, confirmed)
+        if taken:
+            SIGNUPS.inc((("outcome", "exists"),))
+            raise AccountError("An account with that email already exists.")
+        # Someone is waiting on this write: flush now, and sign-ups that
+        # arrive while it runs go into the next batch
+        self._writer.wake()
+
+    def flush(self):
+        """Insert queued accounts, batch_size per transaction, then confirm or refuse
+        each sign-up; returns the number settled."""
+        settled = 0
+        with self._flushing:
+            while True:
+                with self._lock:
+                    batch = list(self._pending.values())[:self.batch_size]
+                if not batch:
+                    return settled
+                conn = self._db.connection()
+                with conn:
+                    written = [
+                        conn.execute(
+                            "INSERT OR IGNORE INTO accounts (id, email, first_name, last_name, password, created) "
+                            "VALUES (:id, :email, :first_name, :last_name, :password, :created)",
+                            account,
+                        ).rowcount == 1
+                        for account, _ in batch
+                    ]
+                with self._lock:
+                    for account, _ in batch:
+                        del self._pending[account["email"]]
+                for (account, confirmed), ok in zip(batch, written):
+                    if ok:
+                        SIGNUPS.inc((("outcome", "created"),))
+                        confirmed.set_result({k: v for k, v in account.items() if k != "password"})
+                    else:
+                        # Another worker on the host took the address between our check and this write
+                        SIGNUPS.inc((("outcome", "exists"),))
+                        confirmed.set_exception(AccountError("An account with that email already exists."))
+                settled += len(batch)
+
+    def close(self):
+        self._pool.shutdown()
+        self.flush()
+
+# =============================================================================
+# SELECTION
+# =============================================================================
+
+@careercraft_db.process_wide
+def get_accounts(path=None):
+    """The process-wide account store."""
+    return AccountStore(path or DEFAULT_PATH)
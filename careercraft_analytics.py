@@ -0,0 +1,283 @@
+"""
+CareerCraft – live analytics
+Running distributions, updated as sessions reach results or ask the coach:
+match % per career, answer counts per question, and coach latency per
+provider. Every structure is a fixed-size mergeable summary, so each worker
+keeps its own, writes a snapshot to a shared directory every few seconds,
+and the admin view sums the snapshots; no query ever touches raw events.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+import uuid
+
+from careercraft_engine import ANSWER_VALUES, CAREERS, QUESTIONS, calculate_career_matches
+import careercraft_telemetry
+
+SNAPSHOT_INTERVAL = 10.0
+QUANTILES = (0.5, 0.9, 0.99)
+
+_CAREER_IDS = [career["id"] for career in CAREERS]
+
+# =============================================================================
+# SKETCHES
+# =============================================================================
+
+class IntHistogram:
+    """Exact counts for integers in [0, size); quantiles and merges are O(size)."""
+
+    def __init__(self, size, counts=None):
+        self.counts = list(counts) if counts else [0] * size
+
+    def add(self, value, count=1):
+        self.counts[value] += count
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        return self
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def quantile(self, q):
+        total = self.count
+        if not total:
+            return None
+        rank, seen = q * (total - 1), 0
+        for value, count in enumerate(self.counts):
+            seen += count
+            if seen > rank:
+                return value
+        return len(self.counts) - 1
+
+    def mean(self):
+        total = self.count
+        return sum(v * c for v, c in enumerate(self.counts)) / total if total else None
+
+class QuantileSketch:
+    """Relative-error quantile sketch (DDSketch-style) for positive values.
+
+    Values land in logarithmic buckets, so any quantile is within `accuracy`
+    of the true value, the bucket count is bounded by the value range rather
+    than the number of observations, and merging two sketches adds buckets.
+    """
+
+    def __init__(self, accuracy=0.01, buckets=None, zeros=0):
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {int(k): v for k, v in (buckets or {}).items()}
+        self.zeros = zeros
+
+    def add(self, value, count=1):
+        if value <= 0:
+            self.zeros += count
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def merge(self, other):
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zeros += other.zeros
+        return self
+
+    @property
+    def count(self):
+        return self.zeros + sum(self.buckets.values())
+
+    def quantile(self, q):
+        total = self.count
+        if not total:
+            return None
+        rank = q * (total - 1)
+        seen = self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return None
+
+    def to_dict(self):
+        return {"accuracy": self.accuracy, "buckets": self.buckets, "zeros": self.zeros}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["accuracy"], data["buckets"], data["zeros"])
+
+# =============================================================================
+# AGGREGATES
+# =============================================================================
+
+class Aggregates:
+    """One process's (or a merged) set of summaries."""
+
+    def __init__(self):
+        self.results = 0
+        self.matches = {career_id: IntHistogram(101) for career_id in _CAREER_IDS}
+        self.answers = {q["id"]: IntHistogram(len(ANSWER_VALUES)) for q in QUESTIONS}
+        self.coach = {}          # provider -> QuantileSketch of seconds
+        self.coach_requests = {}  # (provider, source) -> count
+
+    def add_results(self, answers):
+        self.results += 1
+        for match in calculate_career_matches(answers):
+            self.matches[match["career"]["id"]].add(match["match"])
+        for question_id, value in answers.items():
+            self.answers[question_id].add(ANSWER_VALUES.index(value))
+
+    def add_coach(self, provider, source, seconds):
+        self.coach.setdefault(provider, QuantileSketch()).add(seconds)
+        self.coach_requests[(provider, source)] = self.coach_requests.get((provider, source), 0) + 1
+
+    def merge(self, other):
+        self.results += other.results
+        for career_id, histogram in other.matches.items():
+            if career_id in self.matches:
+                self.matches[career_id].merge(histogram)
+        for question_id, histogram in other.answers.items():
+            if question_id in self.answers:
+                self.answers[question_id].merge(histogram)
+        for provider, sketch in other.coach.items():
+            self.coach.setdefault(provider, QuantileSketch(sketch.accuracy)).merge(sketch)
+        for key, count in other.coach_requests.items():
+            self.coach_requests[key] = self.coach_requests.get(key, 0) + count
+        return self
+
+    def to_dict(self):
+        return {
+            "results": self.results,
+            "matches": {k: h.counts for k, h in self.matches.items()},
+            "answers": {k: h.counts for k, h in self.answers.items()},
+            "coach": {k: s.to_dict() for k, s in self.coach.items()},
+            "coach_requests": [[p, s, n] for (p, s), n in self.coach_requests.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        aggregates = cls()
+        aggregates.results = data["results"]
+        # Careers or questions dropped since the snapshot was written are ignored
+        for career_id, counts in data["matches"].items():
+            if career_id in aggregates.matches:
+                aggregates.matches[career_id] = IntHistogram(101, counts)
+        for question_id, counts in data["answers"].items():
+            if question_id in aggregates.answers and len(counts) == len(ANSWER_VALUES):
+                aggregates.answers[question_id] = IntHistogram(len(ANSWER_VALUES), counts)
+        aggregates.coach = {k: QuantileSketch.from_dict(s) for k, s in data["coach"].items()}
+        aggregates.coach_requests = {(p, s): n for p, s, n in data["coach_requests"]}
+        return aggregates
+
+    def summary(self):
+        """Quantiles and counts for display; cost depends only on catalogue size."""
+        return {
+            "results": self.results,
+            "matches": {
+                career_id: {"count": h.count, "mean": h.mean(), **{q: h.quantile(q) for q in QUANTILES}}
+                for career_id, h in self.matches.items()
+            },
+            "answers": {
+                question_id: dict(zip(ANSWER_VALUES, h.counts)) for question_id, h in self.answers.items()
+            },
+            "coach": {
+                provider: {"count": s.count, **{q: s.quantile(q) for q in QUANTILES}}
+                for provider, s in self.coach.items()
+            },
+            "coach_requests": dict(self.coach_requests),
+        }
+
+# =============================================================================
+# PROCESS STATE
+# =============================================================================
+
+_lock = threading.Lock()
+_local = Aggregates()
+_started = False
+# Names this worker's snapshot file. The pid alone is not enough: a new worker
+# that reuses a dead one's pid would overwrite the totals it left behind.
+_worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+
+def record_results(answers):
+    with _lock:
+        _local.add_results(answers)
+
+def record_coach(provider, source, seconds):
+    with _lock:
+        _local.add_coach(provider, source, seconds)
+
+def local_snapshot():
+    with _lock:
+        return Aggregates.from_dict(json.loads(json.dumps(_local.to_dict())))
+
+def _write_snapshot(directory):
+    with _lock:
+        data = json.dumps(_local.to_dict(), separators=(",", ":"))
+    path = os.path.join(directory, f"analytics-{_worker_id}.json")
+    with open(path + ".tmp", "w") as f:
+        f.write(data)
+    os.replace(path + ".tmp", path)
+
+def _snapshot_forever(directory, interval):
+    while True:
+        time.sleep(interval)
+        try:
+            _write_snapshot(directory)
+        except OSError:
+            pass
+
+def start_snapshots(directory="analytics", interval=SNAPSHOT_INTERVAL):
+    """Write this process's aggregates to directory periodically; "" disables it.
+
+    Each worker owns one file, named by a per-process id, and rewrites it
+    whole, so totals from workers that have since exited keep counting.
+    """
+    global _started
+    with _lock:
+        if _started or not directory:
+            return
+        _started = True
+    os.makedirs(directory, exist_ok=True)
+    threading.Thread(
+        target=_snapshot_forever, args=(directory, float(interval)), name="analytics-snapshot", daemon=True,
+    ).start()
+
+def merged(directory="analytics"):
+    """Every worker's last snapshot summed, with this process's live state in place of its file."""
+    total = local_snapshot()
+    own = f"analytics-{_worker_id}.json"
+    if directory and os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if not name.endswith(".json") or name == own:
+                continue
+            try:
+                with open(os.path.join(directory, name)) as f:
+                    total.merge(Aggregates.from_dict(json.load(f)))
+            except (OSError, ValueError, KeyError):
+                continue
+    return total
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+def _match_series():
+    with _lock:
+        histograms = {career_id: list(h.counts) for career_id, h in _local.matches.items()}
+    series = {}
+    for career_id, counts in histograms.items():
+        histogram = IntHistogram(101, counts)
+        if histogram.count:
+            for q in QUANTILES:
+                series[(("career", career_id), ("quantile", str(q)))] = histogram.quantile(q)
+    return series
+
+MATCH_QUANTILES = careercraft_telemetry.Gauge(
+    "careercraft_match_percent_quantile", "Match % quantiles per career in this process", _match_series,
+)
+careercraft_telemetry.METRICS.append(MATCH_QUANTILES)
@@ -0,0 +1,240 @@
+"""
+CareerCraft – JSON API
+Matching, strengths/gaps and the coach as plain HTTP endpoints for partner
+apps, without a Streamlit session. A bare ASGI app, served by uvicorn, on top
+of the same engine, pre-generated answers and coach providers as the UI.
+
+    python careercraft_api.py --port 8600 --workers 4
+
+Endpoints (JSON in and out):
+    GET  /health
+    GET  /metrics                  Prometheus text
+    GET  /v1/questions
+    POST /v1/matches               {"answers": {...}} or {"code": "1oa4"}
+    POST /v1/strengths-gaps        same body
+    POST /v1/coach                 same body + "question", optional "provider"
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import socket
+import sys
+
+from careercraft_coach import FALLBACK_COACH, check_api_status, get_coach_response, get_fallback_response
+from careercraft_engine import (
+    ANSWER_OPTIONS,
+    ANSWER_VALUES,
+    QUESTIONS,
+    build_coach_context,
+    calculate_career_matches,
+    decode_answers,
+    encode_answers,
+    get_strengths_and_gaps,
+)
+import careercraft_pregen
+import careercraft_telemetry
+
+MAX_BODY = 64 * 1024
+MAX_QUESTION = 2000
+SCORE_CACHE_SIZE = 8192
+
+_QUESTION_IDS = {q["id"] for q in QUESTIONS}
+
+log = logging.getLogger("careercraft.api")
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+# =============================================================================
+# SCORING
+# =============================================================================
+
+def parse_answers(body):
+    """Answers from {"code": ...} or {"answers": {...}}; partial sets are allowed."""
+    if "code" in body:
+        answers = decode_answers(body["code"])
+        if answers is None:
+            raise ApiError(400, "code is not a valid answer code")
+        return answers
+    answers = body.get("answers")
+    if not isinstance(answers, dict) or not answers:
+        raise ApiError(400, "answers must be a non-empty object keyed by question id")
+    unknown = set(answers) - _QUESTION_IDS
+    if unknown:
+        raise ApiError(400, f"unknown question ids: {', '.join(sorted(unknown))}")
+    # Type first: a list or object value is unhashable and would raise in the set lookup
+    bad = [k for k, v in answers.items() if not isinstance(v, int) or isinstance(v, bool) or v not in ANSWER_VALUES]
+    if bad:
+        raise ApiError(400, f"answers must be one of {ANSWER_VALUES}: {', '.join(sorted(bad))}")
+    # Question order, as the UI builds it, so ties in strengths/gaps break the same way
+    return {q["id"]: answers[q["id"]] for q in QUESTIONS if q["id"] in answers}
+
+def score(answers):
+    code = encode_answers(answers)
+    return _score_code(code) if code else _score(answers)
+
+@functools.lru_cache(maxsize=SCORE_CACHE_SIZE)
+def _score_code(code):
+    return _score(decode_answers(code))
+
+def _score(answers):
+    strengths, gaps = get_strengths_and_gaps(answers)
+    matches = [
+        {
+            "id": m["career"]["id"],
+            "title": m["career"]["title"],
+            "subtitle": m["career"]["subtitle"],
+            "range": m["career"]["range"],
+            "match": m["match"],
+        }
+        for m in calculate_career_matches(answers)
+    ]
+    return {"code": encode_answers(answers), "matches": matches, "strengths": strengths, "gaps": gaps}
+
+# =============================================================================
+# HANDLERS
+# =============================================================================
+
+def questions(_body):
+    return {"questions": QUESTIONS, "options": ANSWER_OPTIONS}
+
+def matches(body):
+    result = score(parse_answers(body))
+    limit = body.get("top", len(result["matches"]))
+    if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+        raise ApiError(400, "top must be a positive integer")
+    return {"code": result["code"], "matches": result["matches"][:limit]}
+
+def strengths_gaps(body):
+    result = score(parse_answers(body))
+    return {"code": result["code"], "strengths": result["strengths"], "gaps": result["gaps"]}
+
+async def coach(body):
+    result = score(parse_answers(body))
+    question = body.get("question")
+    if not isinstance(question, str) or not question.strip() or len(question) > MAX_QUESTION:
+        raise ApiError(400, f"question must be a non-empty string of at most {MAX_QUESTION} characters")
+    provider = body.get("provider", FALLBACK_COACH)
+    available = {"Claude": "claude", "ChatGPT": "chatgpt", "Gemini": "gemini"}
+    if not isinstance(provider, str) or provider != FALLBACK_COACH and (
+        provider not in available or not check_api_status()[available[provider]]
+    ):
+        raise ApiError(400, f"provider {provider!r} is not available")
+
+    context = build_coach_context(result["strengths"], result["gaps"], result["matches"][0]["title"])
+    response = careercraft_pregen.lookup(provider, context, question)
+    error = None
+    if response is None:
+        # Provider SDKs block; keep the event loop free for other requests
+        response, error = await asyncio.to_thread(get_coach_response, provider, question, context)
+    if not response:
+        careercraft_telemetry.record_fallback(provider, (error or "empty response").split(":")[0])
+        response, provider = get_fallback_response(question, context), FALLBACK_COACH
+    return {"response": response, "provider": provider, "error": error}
+
+ROUTES = {
+    ("GET", "/health"): lambda _body: {"status": "ok"},
+    ("GET", "/v1/questions"): questions,
+    ("POST", "/v1/matches"): matches,
+    ("POST", "/v1/strengths-gaps"): strengths_gaps,
+    ("POST", "/v1/coach"): coach,
+}
+
+# =============================================================================
+# ASGI
+# =============================================================================
+
+async def _read_body(receive):
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY:
+            raise ApiError(413, "request body too large")
+        chunks.append(chunk)
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+async def _send(send, status, body, content_type=b"application/json"):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while (await receive())["type"] != "lifespan.shutdown":
+            await send({"type": "lifespan.startup.complete"})
+        await send({"type": "lifespan.shutdown.complete"})
+        return
+    if scope["type"] != "http":
+        return
+
+    method, path = scope["method"], scope["path"].rstrip("/") or "/"
+    if method == "GET" and path == "/metrics":
+        body = careercraft_telemetry.render_prometheus().encode("utf-8")
+        await _send(send, 200, body, b"text/plain; version=0.0.4; charset=utf-8")
+        return
+    try:
+        handler = ROUTES.get((method, path))
+        if handler is None:
+            allowed = any(p == path for _, p in ROUTES)
+            raise ApiError(405 if allowed else 404, "method not allowed" if allowed else "not found")
+        raw = await _read_body(receive) if method == "POST" else b""
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            raise ApiError(400, "body must be JSON")
+        if not isinstance(body, dict):
+            raise ApiError(400, "body must be a JSON object")
+        result = handler(body)
+        if asyncio.iscoroutine(result):
+            result = await result
+        status = 200
+    except ApiError as e:
+        status, result = e.status, {"error": str(e)}
+    except Exception:
+        log.exception("%s %s failed", method, path)
+        status, result = 500, {"error": "internal error"}
+    await _send(send, status, json.dumps(result, separators=(",", ":")).encode("utf-8"))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the CareerCraft JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+    import uvicorn
+    from uvicorn.supervisors import Multiprocess
+
+    config = uvicorn.Config("careercraft_api:app", host=args.host, port=args.port, workers=args.workers,
+                            access_log=False, log_level="warning")
+    if args.workers == 1:
+        uvicorn.Server(config).run()
+        return 0
+    # uvicorn's own bind leaves proto=0, so asyncio never sets TCP_NODELAY on
+    # accepted connections and each response waits out the client's delayed
+    # ACK (~40 ms). Bind with the real protocol number instead.
+    family, kind, proto, _, address = socket.getaddrinfo(args.host, args.port, type=socket.SOCK_STREAM)[0]
+    sock = socket.socket(family, kind, proto)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(address)
+    sock.set_inheritable(True)
+    try:
+        supervisor = Multiprocess(config, sockets=[sock])
+    except TypeError:
+        # Older uvicorn takes the server entry point explicitly
+        supervisor = Multiprocess(config, target=uvicorn.Server(config).run, sockets=[sock])
+    supervisor.run()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,25 +5,33 @@ Fixed: Navigation, HTML rendering, data section, button styling
 
 import streamlit as st
 from datetime import datetime
-
-# Optional LLM imports
-try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+import os
+import time
+
+from careercraft_engine import (
+    ANSWER_OPTIONS,
+    CAREERS,
+    QUESTIONS,
+    build_coach_context,
+)
+from careercraft_coach import (
+    FALLBACK_COACH,
+    check_api_status,
+    get_coach_response,
+    get_fallback_response,
+)
+from careercraft_config import get_secret
+import careercraft_accounts
+import careercraft_analytics
+import careercraft_assets
+import careercraft_events
+from careercraft_content import PERSONAS, about_fragments, persona_fragments, results_fragments
+import careercraft_media
+import careercraft_nav as nav
+import careercraft_pregen
+import careercraft_session
+import careercraft_telemetry
+import careercraft_templates as tpl
 
 # Page config
 st.set_page_config(
@@ -33,1376 +41,59 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-# =============================================================================
-# DATA
-# =============================================================================
-
-QUESTIONS = [
-    {
-        "id": "technical",
-        "question": "How comfortable are you with data, spreadsheets, and technical tools?",
-        "dimension": "Technical aptitude",
-        "low_label": "I prefer to avoid them",
-        "high_label": "I work with them daily",
-    },
-    {
-        "id": "people_energy",
-        "question": "How energized are you after a day of meetings and collaboration versus deep solo work?",
-        "dimension": "Social energy",
-        "low_label": "Solo work energizes me",
-        "high_label": "Collaboration energizes me",
-    },
-    {
-        "id": "people_style",
-        "question": "When working with others, do you prefer supporting the team or taking the lead?",
-        "dimension": "Interaction style",
-        "low_label": "I prefer supporting",
-        "high_label": "I naturally lead",
-    },
-    {
-        "id": "analysis",
-        "question": "When making decisions, do you rely more on data or intuition?",
-        "dimension": "Decision-making",
-        "low_label": "Intuition and experience",
-        "high_label": "Data and analysis",
-    },
-    {
-        "id": "structure",
-        "question": "Do you prefer clear processes and plans or figuring things out as you go?",
-        "dimension": "Work structure",
-        "low_label": "Flexible and adaptive",
-        "high_label": "Structured and planned",
-    },
-    {
-        "id": "learning",
-        "question": "How quickly do you typically pick up new skills and domains?",
-        "dimension": "Learning velocity",
-        "low_label": "I take my time to master",
-        "high_label": "I learn very quickly",
-    },
-    {
-        "id": "client_facing",
-        "question": "How much do you enjoy working directly with clients or external stakeholders?",
-        "dimension": "External orientation",
-        "low_label": "Prefer internal work",
-        "high_label": "Love client interaction",
-    },
-]
-
-ANSWER_OPTIONS = [
-    {"label": "1", "value": 20},
-    {"label": "2", "value": 40},
-    {"label": "3", "value": 60},
-    {"label": "4", "value": 80},
-    {"label": "5", "value": 95},
-]
-
-CAREERS = [
-    {
-        "id": "pm", "title": "Product Manager", "subtitle": "Shape what gets built", 
-        "range": "$95k-$180k", "median": 137000,
-        "fit": {"technical": 60, "people_energy": 80, "people_style": 75, "analysis": 70, "structure": 60, "learning": 80, "client_facing": 70},
-    },
-    {
-        "id": "dev", "title": "Software Developer", "subtitle": "Build and create",
-        "range": "$80k-$200k", "median": 132000,
-        "fit": {"technical": 95, "people_energy": 40, "people_style": 45, "analysis": 80, "structure": 70, "learning": 90, "client_facing": 30},
-    },
-    {
-        "id": "data", "title": "Data Analyst", "subtitle": "Find insights in numbers",
-        "range": "$65k-$130k", "median": 86000,
-        "fit": {"technical": 85, "people_energy": 45, "people_style": 40, "analysis": 95, "structure": 80, "learning": 70, "client_facing": 50},
-    },
-    {
-        "id": "ux", "title": "UX Designer", "subtitle": "Design for humans",
-        "range": "$70k-$150k", "median": 98000,
-        "fit": {"technical": 50, "people_energy": 70, "people_style": 55, "analysis": 60, "structure": 50, "learning": 80, "client_facing": 75},
-    },
-    {
-        "id": "marketing", "title": "Marketing Manager", "subtitle": "Tell compelling stories",
-        "range": "$75k-$160k", "median": 140000,
-        "fit": {"technical": 40, "people_energy": 85, "people_style": 70, "analysis": 50, "structure": 50, "learning": 70, "client_facing": 85},
-    },
-    {
-        "id": "consultant", "title": "Consultant", "subtitle": "Solve business problems",
-        "range": "$80k-$170k", "median": 99000,
-        "fit": {"technical": 60, "people_energy": 80, "people_style": 75, "analysis": 75, "structure": 70, "learning": 90, "client_facing": 95},
-    },
-    {
-        "id": "analyst", "title": "Business Analyst", "subtitle": "Bridge tech and business",
-        "range": "$70k-$130k", "median": 95000,
-        "fit": {"technical": 70, "people_energy": 65, "people_style": 50, "analysis": 85, "structure": 75, "learning": 75, "client_facing": 60},
-    },
-    {
-        "id": "manager", "title": "People Manager", "subtitle": "Lead and develop teams",
-        "range": "$90k-$170k", "median": 120000,
-        "fit": {"technical": 45, "people_energy": 90, "people_style": 95, "analysis": 55, "structure": 70, "learning": 65, "client_facing": 60},
-    },
-]
-
-# Personas - focused on problems CareerCraft solves
-PERSONAS = [
-    {
-        "id": "maya",
-        "name": "Maya",
-        "archetype": "The Undecided Graduate",
-        "age": "19-22",
-        "stage": "Student / Recent Grad",
-        "problem": "Too many options, no clear direction",
-        "story": "Maya is finishing her business degree but isn't sure what career to pursue. She's interested in several fields but doesn't know which one suits her best or pays well.",
-        "pain_points": [
-            "Doesn't know which careers match her strengths",
-            "Can't compare salaries across different paths",
-            "Generic career quizzes haven't helped",
-            "No way to see what skills she should develop"
-        ],
-        "how_we_help": "CareerCheck identifies Maya's strengths and matches her to careers with real salary data. Skills Lab shows exactly which skills to develop and their value. Pathways recommends courses and certifications ranked by earning potential. Sessions gives her a structured pack to discuss options with her uni career advisor.",
-        "outcome": "From confused to confident with a 12-month plan",
-        "stats": ["75% of students change their major", "67% need help with career decisions", "Only 27% feel prepared for job market"]
-    },
-    {
-        "id": "darius",
-        "name": "Darius",
-        "archetype": "The Strategic Climber",
-        "age": "26-30",
-        "stage": "Early Career (3-5 years)",
-        "problem": "Wants to grow income but can't compare paths",
-        "story": "Darius earns $85K but sees peers earning $120K+. He wants to break into the property market but can't figure out whether to push for promotion, switch companies, or change fields entirely.",
-        "pain_points": [
-            "Can't compare earning potential across different moves",
-            "Doesn't know which skills would boost his salary most",
-            "No clear data on what top performers did differently",
-            "Making decisions based on guesswork and LinkedIn posts"
-        ],
-        "how_we_help": "Skills Lab shows Darius exactly which of his current skills are undervalued in his role but command premiums in adjacent fields. Careers lets him compare salary ceilings across paths. Pathways identifies the fastest credential to close his income gap. Sessions creates a mentor brief so he can get targeted advice from senior colleagues.",
-        "outcome": "From guessing to data-driven career moves",
-        "stats": ["Property prices are 8x average income", "Right skills can add $20K+ to salary", "Strategic moves double income growth rate"]
-    },
-    {
-        "id": "rachel",
-        "name": "Rachel",
-        "archetype": "The Career Pivoter",
-        "age": "36-44",
-        "stage": "Mid-Career (12-18 years)",
-        "problem": "Wants to change careers without starting over",
-        "story": "Rachel is a Marketing Director who's ready for a change. She has valuable skills but doesn't know which industries would value them or how to transition without a huge pay cut.",
-        "pain_points": [
-            "Doesn't know where her skills transfer to",
-            "Worried about taking a pay cut to switch",
-            "Can't find realistic transition paths",
-            "Every option seems to require starting from scratch"
-        ],
-        "how_we_help": "Skills Lab maps Rachel's 15 years of experience into transferable skills and shows which industries pay more for them. Careers reveals roles she'd never considered where her skills are in demand. Pathways shows bridge credentials that legitimise her pivot without a full degree. Sessions prepares her for informational interviews with a clear story of her value.",
-        "outcome": "From stuck to seeing a clear path forward",
-        "stats": ["Average career changer is 39", "73% of skills transfer across industries", "Targeted pivots maintain 85% of income"]
-    },
-    {
-        "id": "emmanuel",
-        "name": "Emmanuel",
-        "archetype": "The New Australian",
-        "age": "28-34",
-        "stage": "Skilled Professional (5-10 years)",
-        "problem": "Overseas experience not recognised properly",
-        "story": "Emmanuel moved to Australia with an accounting degree and experience, but earns 40% less than local peers. He's unsure whether to keep climbing in accounting or pivot to a higher-growth field.",
-        "pain_points": [
-            "Australian employers undervalue his overseas experience",
-            "Doesn't know which local qualifications are worth getting",
-            "Can't tell if pivoting to tech would pay off",
-            "Limited network to get insider career advice"
-        ],
-        "how_we_help": "Skills Lab quantifies Emmanuel's transferable skills and identifies roles where international experience is actually valued more. Careers shows him fields with the fastest salary catch-up for migrants. Pathways ranks Australian certifications by their actual impact on earnings. Sessions creates a networking brief he can share with professional mentors to get strategic introductions.",
-        "outcome": "From undervalued to strategically positioned",
-        "stats": ["Migrants earn 25% less on average", "Right certifications close the gap by 60%", "17% of business owners are migrants"]
-    },
-]
-
 # =============================================================================
 # CSS
 # =============================================================================
 
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Fraunces:ital,opsz,wght@0,9..144,400;0,9..144,600;0,9..144,700;1,9..144,400&family=DM+Sans:wght@400;500;600&display=swap');
-    
-    #MainMenu, footer, header, .stDeployButton {display: none !important;}
-    
-    .stApp {
-        background: #FAF9F6;
-        font-family: 'DM Sans', -apple-system, sans-serif;
-    }
-    
-    .main .block-container {
-        padding: 1.5rem 1rem 4rem;
-        max-width: 700px;
-    }
-    
-    h1, h2, h3, h4 {
-        font-family: 'Fraunces', Georgia, serif !important;
-        color: #1a1a1a !important;
-        font-weight: 600 !important;
-    }
-    
-    p, span, div, label, li {
-        color: #2d2d2d;
-    }
-    
-    /* Navigation */
-    .nav-row {
-        display: flex;
-        align-items: center;
-        gap: 1rem;
-        padding-bottom: 1rem;
-        border-bottom: 1px solid #e8e5e0;
-        margin-bottom: 1.5rem;
-    }
-    
-    .logo {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        margin-right: auto;
-    }
-    
-    .logo-mark {
-        width: 32px;
-        height: 32px;
-        background: #4A6741;
-        border-radius: 8px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        color: white;
-        font-family: 'Fraunces', serif;
-        font-weight: 600;
-        font-size: 1rem;
-    }
-    
-    .logo-text {
-        font-family: 'Fraunces', serif;
-        font-size: 1.2rem;
-        font-weight: 600;
-        color: #1a1a1a;
-    }
-    
-    /* Progress bar */
-    .progress-container {
-        margin-bottom: 2rem;
-    }
-    
-    .progress-text {
-        font-size: 0.8rem;
-        color: #666;
-        margin-bottom: 0.4rem;
-        font-weight: 500;
-    }
-    
-    .progress-bar {
-        height: 4px;
-        background: #e8e5e0;
-        border-radius: 2px;
-        overflow: hidden;
-    }
-    
-    .progress-fill {
-        height: 100%;
-        background: #4A6741;
-        border-radius: 2px;
-        transition: width 0.3s ease;
-    }
-    
-    /* Question */
-    .question-text {
-        font-family: 'Fraunces', Georgia, serif;
-        font-size: 1.5rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        line-height: 1.4;
-        margin-bottom: 1.75rem;
-    }
-    
-    .scale-labels {
-        display: flex;
-        justify-content: space-between;
-        margin-bottom: 0.75rem;
-        font-size: 0.8rem;
-        color: #666;
-    }
-    
-    /* Hero */
-    .hero {
-        text-align: center;
-        padding: 2rem 0;
-    }
-    
-    .hero-badge {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.4rem;
-        background: white;
-        border: 1px solid #e8e5e0;
-        padding: 0.4rem 0.9rem;
-        border-radius: 999px;
-        font-size: 0.8rem;
-        color: #666;
-        margin-bottom: 1.25rem;
-    }
-    
-    .hero-dot {
-        width: 6px;
-        height: 6px;
-        background: #4A6741;
-        border-radius: 50%;
-    }
-    
-    .hero-title {
-        font-family: 'Fraunces', Georgia, serif;
-        font-size: 2rem;
-        font-weight: 700;
-        color: #1a1a1a;
-        line-height: 1.25;
-        margin-bottom: 0.9rem;
-    }
-    
-    .hero-title em {
-        font-style: italic;
-        color: #4A6741;
-    }
-    
-    .hero-sub {
-        font-size: 1rem;
-        color: #555;
-        line-height: 1.55;
-        max-width: 500px;
-        margin: 0 auto 1.75rem;
-    }
-    
-    /* Cards */
-    .card {
-        background: white;
-        border-radius: 12px;
-        padding: 1.25rem;
-        margin-bottom: 0.9rem;
-        border: 1px solid #e8e5e0;
-    }
-    
-    .card-title {
-        font-family: 'Fraunces', serif;
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        margin-bottom: 0.75rem;
-    }
-    
-    .card-body {
-        font-size: 0.9rem;
-        color: #444;
-        line-height: 1.6;
-    }
-    
-    /* Data grid */
-    .data-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
-        gap: 0.75rem;
-        margin: 1rem 0;
-    }
-    
-    .data-card {
-        background: white;
-        border-radius: 10px;
-        padding: 1rem;
-        border: 1px solid #e8e5e0;
-        text-align: center;
-    }
-    
-    .data-value {
-        font-family: 'Fraunces', serif;
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: #4A6741;
-        margin-bottom: 0.25rem;
-    }
-    
-    .data-label {
-        font-size: 0.75rem;
-        color: #666;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    /* Pills */
-    .result-label {
-        font-size: 0.65rem;
-        text-transform: uppercase;
-        letter-spacing: 0.08em;
-        color: #666;
-        margin-bottom: 0.5rem;
-        font-weight: 600;
-    }
-    
-    .pill {
-        display: inline-block;
-        padding: 0.25rem 0.65rem;
-        border-radius: 999px;
-        font-size: 0.8rem;
-        font-weight: 500;
-        margin-right: 0.35rem;
-        margin-bottom: 0.35rem;
-    }
-    
-    .pill-green { background: #e8f5e3; color: #2d5a27; }
-    .pill-amber { background: #fef3e2; color: #8a5a00; }
-    
-    /* Direction cards */
-    .direction-card {
-        background: white;
-        border-radius: 12px;
-        padding: 1rem 1.1rem;
-        margin-bottom: 0.6rem;
-        border-left: 3px solid;
-        position: relative;
-    }
-    
-    .direction-primary { border-color: #4A6741; background: linear-gradient(135deg, #f5faf4 0%, white 100%); }
-    .direction-secondary { border-color: #2563eb; background: linear-gradient(135deg, #f0f7ff 0%, white 100%); }
-    .direction-tertiary { border-color: #d97706; background: linear-gradient(135deg, #fffbf0 0%, white 100%); }
-    
-    .direction-type {
-        font-size: 0.6rem;
-        text-transform: uppercase;
-        letter-spacing: 0.07em;
-        font-weight: 600;
-        margin-bottom: 0.2rem;
-    }
-    
-    .direction-primary .direction-type { color: #2d5a27; }
-    .direction-secondary .direction-type { color: #1d4ed8; }
-    .direction-tertiary .direction-type { color: #b45309; }
-    
-    .direction-title {
-        font-family: 'Fraunces', serif;
-        font-size: 1.05rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        margin-bottom: 0.2rem;
-    }
-    
-    .direction-meta {
-        font-size: 0.8rem;
-        color: #555;
-    }
-    
-    .direction-match {
-        position: absolute;
-        top: 0.8rem;
-        right: 0.8rem;
-        font-size: 0.7rem;
-        font-weight: 600;
-        padding: 0.2rem 0.5rem;
-        border-radius: 999px;
-    }
-    
-    .direction-primary .direction-match { background: #e8f5e3; color: #2d5a27; }
-    .direction-secondary .direction-match, .direction-tertiary .direction-match { background: #fef3e2; color: #8a5a00; }
-    
-    /* Timeline */
-    .timeline-card {
-        background: #1a1a1a;
-        border-radius: 12px;
-        padding: 1.25rem;
-        margin: 1rem 0;
-    }
-    
-    .timeline-header {
-        font-size: 0.6rem;
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-        color: #999;
-        margin-bottom: 1rem;
-        font-weight: 600;
-    }
-    
-    .timeline {
-        position: relative;
-        padding-left: 1.4rem;
-    }
-    
-    .timeline::before {
-        content: '';
-        position: absolute;
-        left: 4px;
-        top: 0;
-        bottom: 0;
-        width: 2px;
-        background: linear-gradient(180deg, #4A6741, #2563eb, #d97706, #eab308);
-        border-radius: 1px;
-    }
-    
-    .tl-item {
-        position: relative;
-        margin-bottom: 0.9rem;
-        padding: 0.65rem;
-        background: rgba(255,255,255,0.05);
-        border-radius: 8px;
-    }
-    
-    .tl-item::before {
-        content: '';
-        position: absolute;
-        left: -1.15rem;
-        top: 0.75rem;
-        width: 8px;
-        height: 8px;
-        border-radius: 50%;
-    }
-    
-    .tl-week1::before { background: #4A6741; }
-    .tl-week2::before { background: #2563eb; }
-    .tl-week3::before { background: #d97706; }
-    .tl-6months::before { background: #2563eb; }
-    .tl-8months::before { background: #d97706; }
-    .tl-12months::before { background: #eab308; }
-    
-    .tl-label {
-        font-size: 0.55rem;
-        text-transform: uppercase;
-        letter-spacing: 0.07em;
-        font-weight: 600;
-        margin-bottom: 0.15rem;
-    }
-    
-    .tl-week1 .tl-label { color: #86efac; }
-    .tl-week2 .tl-label { color: #93c5fd; }
-    .tl-week3 .tl-label { color: #fcd34d; }
-    .tl-6months .tl-label { color: #93c5fd; }
-    .tl-8months .tl-label { color: #fcd34d; }
-    .tl-12months .tl-label { color: #fef08a; }
-    
-    .tl-title {
-        font-family: 'Fraunces', serif;
-        font-size: 0.9rem;
-        color: #f5f5f5;
-        line-height: 1.35;
-    }
-    
-    /* Coach section */
-    .coach-section {
-        background: white;
-        border-radius: 12px;
-        padding: 1.25rem;
-        margin: 1rem 0;
-        border: 1px solid #e8e5e0;
-    }
-    
-    .coach-title {
-        font-family: 'Fraunces', serif;
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        margin-bottom: 0.35rem;
-    }
-    
-    .coach-subtitle {
-        font-size: 0.85rem;
-        color: #666;
-        margin-bottom: 1rem;
-    }
-    
-    .coach-response {
-        background: #f8f8f6;
-        border: 1px solid #e8e5e0;
-        border-radius: 10px;
-        padding: 1.1rem;
-        margin-top: 0.9rem;
-        font-size: 0.9rem;
-        line-height: 1.65;
-        color: #2d2d2d;
-    }
-    
-    .coach-provider {
-        font-size: 0.7rem;
-        color: #888;
-        margin-top: 0.5rem;
-        font-weight: 500;
-    }
-    
-    /* Persona cards */
-    .persona-card {
-        background: white;
-        border-radius: 16px;
-        padding: 1.75rem;
-        margin-bottom: 1.5rem;
-        border: 1px solid #e8e5e0;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.04);
-    }
-    
-    .persona-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: flex-start;
-        margin-bottom: 1rem;
-        padding-bottom: 1rem;
-        border-bottom: 1px solid #f0ede8;
-    }
-    
-    .persona-name {
-        font-family: 'Fraunces', serif;
-        font-size: 1.4rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        margin-bottom: 0.15rem;
-    }
-    
-    .persona-archetype {
-        font-size: 0.95rem;
-        color: #4A6741;
-        font-weight: 500;
-    }
-    
-    .persona-meta {
-        text-align: right;
-    }
-    
-    .persona-age {
-        font-size: 0.85rem;
-        color: #666;
-        margin-bottom: 0.2rem;
-    }
-    
-    .persona-stage {
-        font-size: 0.75rem;
-        color: #888;
-        background: #f5f5f5;
-        padding: 0.25rem 0.6rem;
-        border-radius: 999px;
-        display: inline-block;
-    }
-    
-    .persona-story {
-        font-size: 0.95rem;
-        color: #444;
-        line-height: 1.65;
-        margin-bottom: 1.25rem;
-    }
-    
-    .persona-tension {
-        background: linear-gradient(135deg, #fef3e2 0%, #fff 100%);
-        border-left: 3px solid #d97706;
-        padding: 0.9rem 1rem;
-        border-radius: 0 8px 8px 0;
-        margin-bottom: 1.25rem;
-    }
-    
-    .persona-tension-label {
-        font-size: 0.65rem;
-        text-transform: uppercase;
-        letter-spacing: 0.07em;
-        color: #b45309;
-        font-weight: 600;
-        margin-bottom: 0.35rem;
-    }
-    
-    .persona-tension-text {
-        font-size: 0.9rem;
-        color: #444;
-        line-height: 1.5;
-        font-style: italic;
-    }
-    
-    .persona-section-label {
-        font-size: 0.7rem;
-        text-transform: uppercase;
-        letter-spacing: 0.07em;
-        color: #888;
-        font-weight: 600;
-        margin-bottom: 0.5rem;
-        margin-top: 1rem;
-    }
-    
-    .persona-constraint {
-        font-size: 0.85rem;
-        color: #555;
-        margin-bottom: 0.4rem;
-        padding-left: 1rem;
-        position: relative;
-        line-height: 1.45;
-    }
-    
-    .persona-constraint::before {
-        content: '';
-        position: absolute;
-        left: 0;
-        top: 0.45rem;
-        width: 5px;
-        height: 5px;
-        background: #d97706;
-        border-radius: 50%;
-    }
-    
-    .persona-jtbd {
-        background: linear-gradient(135deg, #f5faf4 0%, #fff 100%);
-        border-left: 3px solid #4A6741;
-        padding: 1rem;
-        border-radius: 0 8px 8px 0;
-        margin: 1rem 0;
-    }
-    
-    .persona-jtbd-label {
-        font-size: 0.65rem;
-        text-transform: uppercase;
-        letter-spacing: 0.07em;
-        color: #2d5a27;
-        font-weight: 600;
-        margin-bottom: 0.35rem;
-    }
-    
-    .persona-jtbd-text {
-        font-size: 0.95rem;
-        color: #2d2d2d;
-        line-height: 1.55;
-    }
-    
-    .persona-message {
-        background: #1a1a1a;
-        color: #f5f5f5;
-        padding: 1rem 1.25rem;
-        border-radius: 10px;
-        margin-top: 1.25rem;
-    }
-    
-    .persona-message-label {
-        font-size: 0.6rem;
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-        color: #86efac;
-        font-weight: 600;
-        margin-bottom: 0.35rem;
-    }
-    
-    .persona-message-text {
-        font-family: 'Fraunces', serif;
-        font-size: 1.05rem;
-        line-height: 1.45;
-    }
-    
-    .persona-stats {
-        display: flex;
-        gap: 0.5rem;
-        flex-wrap: wrap;
-        margin-top: 1rem;
-    }
-    
-    .persona-stat {
-        background: #f8f8f6;
-        border: 1px solid #e8e5e0;
-        border-radius: 6px;
-        padding: 0.4rem 0.7rem;
-        font-size: 0.75rem;
-        color: #555;
-    }
-    
-    /* About styles */
-    .about-body {
-        font-size: 0.95rem;
-        color: #444;
-        line-height: 1.7;
-        margin-bottom: 1rem;
-    }
-    
-    .pitch-item {
-        display: flex;
-        gap: 0.75rem;
-        margin-bottom: 1.1rem;
-    }
-    
-    .pitch-num {
-        width: 26px;
-        height: 26px;
-        min-width: 26px;
-        background: #4A6741;
-        color: white;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 0.8rem;
-        font-weight: 600;
-        margin-top: 0.1rem;
-    }
-    
-    .pitch-text {
-        font-size: 0.9rem;
-        color: #2d2d2d;
-        line-height: 1.55;
-    }
-    
-    .pitch-text strong {
-        color: #1a1a1a;
-    }
-    
-    /* Community card */
-    .community-card {
-        background: linear-gradient(135deg, #f0f7ff 0%, #f5faf4 100%);
-        border: 1px solid #d1e3f0;
-        border-radius: 12px;
-        padding: 1.25rem;
-        margin: 1rem 0;
-    }
-    
-    .community-title {
-        font-family: 'Fraunces', serif;
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        margin-bottom: 0.5rem;
-    }
-    
-    .community-body {
-        font-size: 0.9rem;
-        color: #444;
-        line-height: 1.6;
-    }
-    
-    /* Section header */
-    .section-header {
-        text-align: center;
-        margin-bottom: 1.5rem;
-    }
-    
-    .section-title {
-        font-family: 'Fraunces', serif;
-        font-size: 1.6rem;
-        font-weight: 700;
-        color: #1a1a1a;
-        margin-bottom: 0.35rem;
-    }
-    
-    .section-subtitle {
-        font-size: 0.95rem;
-        color: #666;
-    }
-    
-    /* CTA card */
-    .cta-card {
-        background: linear-gradient(135deg, #f5faf4 0%, #f0f7ff 100%);
-        border: 1px solid #e8e5e0;
-        border-radius: 12px;
-        padding: 1.25rem;
-        text-align: center;
-        margin: 1rem 0;
-    }
-    
-    .cta-title {
-        font-family: 'Fraunces', serif;
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        margin-bottom: 0.35rem;
-    }
-    
-    .cta-body {
-        font-size: 0.9rem;
-        color: #555;
-        line-height: 1.5;
-    }
-    
-    /* Footer */
-    .footer-note {
-        text-align: center;
-        font-size: 0.75rem;
-        color: #888;
-        margin-top: 1.25rem;
-        font-style: italic;
-    }
-    
-    /* Streamlit overrides */
-    .stButton > button {
-        background: #4A6741 !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 8px !important;
-        padding: 0.6rem 1.2rem !important;
-        font-weight: 600 !important;
-        font-family: 'DM Sans', sans-serif !important;
-        font-size: 0.9rem !important;
-        transition: all 0.2s ease !important;
-        min-height: 42px !important;
-    }
-    
-    .stButton > button:hover {
-        background: #3d5636 !important;
-        transform: translateY(-1px) !important;
-    }
-    
-    /* Secondary button style */
-    div[data-testid="column"]:has(button[kind="secondary"]) button,
-    .secondary-btn button {
-        background: white !important;
-        color: #2d2d2d !important;
-        border: 1.5px solid #d1d1d1 !important;
-    }
-    
-    div[data-testid="column"]:has(button[kind="secondary"]) button:hover,
-    .secondary-btn button:hover {
-        border-color: #4A6741 !important;
-        color: #4A6741 !important;
-        background: #f5faf4 !important;
-    }
-    
-    .stTextArea textarea, .stTextInput input {
-        border-radius: 8px !important;
-        border: 1.5px solid #d1d1d1 !important;
-        padding: 0.7rem !important;
-        background: white !important;
-        color: #2d2d2d !important;
-        font-family: 'DM Sans', sans-serif !important;
-    }
-    
-    .stTextArea textarea:focus, .stTextInput input:focus {
-        border-color: #4A6741 !important;
-        box-shadow: 0 0 0 1px #4A6741 !important;
-    }
-    
-    /* Radio buttons */
-    .stRadio > div {
-        gap: 0.5rem;
-    }
-    
-    /* Video styling */
-    .stVideo {
-        border-radius: 12px;
-        overflow: hidden;
-        border: 1px solid #e8e5e0;
-    }
-    
-    .stVideo video {
-        border-radius: 12px;
-    }
-    
-    /* Scroll animations - elements visible by default */
-    .scroll-fade {
-        opacity: 1;
-        transform: translateY(0);
-        transition: opacity 0.6s ease-out, transform 0.6s ease-out;
-    }
-    
-    .video-section {
-        margin: 2rem 0;
-    }
-    
-    .video-section-bottom {
-        margin-top: 3rem;
-        padding-top: 2rem;
-        border-top: 1px solid #e8e5e0;
-    }
-    
-    .video-caption {
-        text-align: center;
-        font-size: 0.85rem;
-        color: #666;
-        margin-top: 0.5rem;
-        font-style: italic;
-    }
-    
-    /* Dots indicator for Typeform-style navigation */
-    .dots-container {
-        display: flex;
-        justify-content: center;
-        gap: 0.5rem;
-        margin-top: 1.5rem;
-    }
-    
-    .dot {
-        width: 10px;
-        height: 10px;
-        border-radius: 50%;
-        background: #d1d1d1;
-        transition: all 0.3s ease;
-    }
-    
-    .dot.active {
-        background: #4A6741;
-        transform: scale(1.2);
-    }
-    
-    /* Slide animation for persona cards */
-    @keyframes slideIn {
-        from {
-            opacity: 0;
-            transform: translateX(30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-    
-    .persona-card {
-        animation: slideIn 0.4s ease-out;
-    }
-    
-    /* Use Cases - Tile-based design */
-    .tile-grid {
-        display: flex;
-        gap: 0.5rem;
-        margin-bottom: 1rem;
-    }
-    
-    /* Use case card */
-    .usecase-card {
-        background: white;
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border: 1px solid #e8e5e0;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.04);
-    }
-    
-    .usecase-header {
-        margin-bottom: 1.25rem;
-        padding-bottom: 1rem;
-        border-bottom: 1px solid #f0ede8;
-    }
-    
-    .usecase-name {
-        font-family: 'Fraunces', serif;
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: #1a1a1a;
-        margin-bottom: 0.25rem;
-    }
-    
-    .usecase-archetype {
-        font-size: 1rem;
-        color: #4A6741;
-        font-weight: 600;
-        margin-bottom: 0.35rem;
-    }
-    
-    .usecase-meta {
-        font-size: 0.85rem;
-        color: #666;
-    }
-    
-    .usecase-problem {
-        background: #fff8f0;
-        border-left: 4px solid #e67e22;
-        padding: 1rem 1.25rem;
-        border-radius: 0 10px 10px 0;
-        margin-bottom: 1.25rem;
-    }
-    
-    .usecase-label {
-        font-size: 0.7rem;
-        text-transform: uppercase;
-        letter-spacing: 0.08em;
-        font-weight: 700;
-        color: #555;
-        margin-bottom: 0.5rem;
-    }
-    
-    .usecase-problem .usecase-label {
-        color: #d35400;
-    }
-    
-    .usecase-problem-text {
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        line-height: 1.4;
-    }
-    
-    .usecase-story {
-        font-size: 0.95rem;
-        color: #333;
-        line-height: 1.7;
-        margin-bottom: 1.25rem;
-    }
-    
-    .usecase-section {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        border: 1px solid #f0ede8;
-        margin-bottom: 1.25rem;
-    }
-    
-    .usecase-pain-point {
-        font-size: 0.9rem;
-        color: #333;
-        padding: 0.5rem 0 0.5rem 1.25rem;
-        position: relative;
-        border-bottom: 1px solid #f5f5f5;
-    }
-    
-    .usecase-pain-point:last-child {
-        border-bottom: none;
-    }
-    
-    .usecase-pain-point::before {
-        content: '✗';
-        position: absolute;
-        left: 0;
-        color: #e74c3c;
-        font-weight: 600;
-    }
-    
-    .usecase-solution {
-        background: #f0faf0;
-        border-left: 4px solid #4A6741;
-        padding: 1rem 1.25rem;
-        border-radius: 0 10px 10px 0;
-        margin-bottom: 1rem;
-    }
-    
-    .usecase-solution-label {
-        font-size: 0.7rem;
-        text-transform: uppercase;
-        letter-spacing: 0.08em;
-        font-weight: 700;
-        color: #2d5a27;
-        margin-bottom: 0.5rem;
-    }
-    
-    .usecase-solution-text {
-        font-size: 0.95rem;
-        color: #1a1a1a;
-        line-height: 1.6;
-    }
-    
-    .usecase-outcome {
-        background: #f5faf4;
-        border: 2px solid #4A6741;
-        padding: 1rem 1.25rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-    }
-    
-    .usecase-outcome-label {
-        font-size: 0.65rem;
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-        font-weight: 700;
-        color: #2d5a27;
-        margin-bottom: 0.35rem;
-    }
-    
-    .usecase-outcome-text {
-        font-family: 'Fraunces', serif;
-        font-size: 1.1rem;
-        color: #1a1a1a;
-        line-height: 1.4;
-        font-weight: 600;
-    }
-    
-    .usecase-stats {
-        display: flex;
-        gap: 0.5rem;
-        flex-wrap: wrap;
-        margin-top: 1rem;
-    }
-    
-    .usecase-stat {
-        background: #f8f8f6;
-        border: 1px solid #e8e5e0;
-        border-radius: 6px;
-        padding: 0.4rem 0.75rem;
-        font-size: 0.8rem;
-        color: #333;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# =============================================================================
-# HELPERS
-# =============================================================================
-
-def get_secret(key, default=None):
-    try:
-        return dict(st.secrets).get(key, default)
-    except:
-        return default
-
-def calculate_career_matches(answers):
-    matches = []
-    for career in CAREERS:
-        total_diff = 0
-        for q in QUESTIONS:
-            user_val = answers.get(q["id"], 50)
-            career_val = career["fit"].get(q["id"], 50)
-            total_diff += abs(user_val - career_val)
-        max_diff = len(QUESTIONS) * 80
-        match_pct = max(0, 100 - int((total_diff / max_diff) * 100))
-        matches.append({"career": career, "match": match_pct})
-    return sorted(matches, key=lambda x: x["match"], reverse=True)
-
-def get_strengths_and_gaps(answers):
-    if not answers:
-        return ["Problem solving", "Communication"], ["Technical skills"]
-    dimension_names = {
-        "technical": "Technical skills",
-        "people_energy": "Collaboration",
-        "people_style": "Leadership",
-        "analysis": "Analytical thinking",
-        "structure": "Organization",
-        "learning": "Learning agility",
-        "client_facing": "Client relations",
-    }
-    sorted_answers = sorted(answers.items(), key=lambda x: x[1], reverse=True)
-    strengths = [dimension_names.get(k, k) for k, v in sorted_answers[:2] if v >= 60]
-    gaps = [dimension_names.get(k, k) for k, v in sorted_answers if v <= 40][:2]
-    if not strengths:
-        strengths = [dimension_names.get(sorted_answers[0][0], "Problem solving")]
-    if not gaps:
-        gaps = [dimension_names.get(sorted_answers[-1][0], "Growth area")]
-    return strengths, gaps
-
-# =============================================================================
-# AI COACHES
-# =============================================================================
-
-COACH_SYSTEM = """You are a thoughtful career coach. Help people think through career decisions with:
-1. What matters most right now
-2. How to frame the next 3-6 months
-3. 1-3 concrete, low-risk experiments
-Keep responses under 200 words. Be warm but direct."""
-
-def get_fallback_response(user_msg, context):
-    return """Based on your profile, here's how I'd approach this:
-
-Start with conversations, not courses. Before investing in any training, talk to 2-3 people actually doing the work you're considering. Ask them: What surprised you about this role? What do you wish you'd known?
-
-Run a small experiment. Pick one thing you can try in the next 2 weeks that tests your interest. Could be a side project, volunteering for a task at work, or taking a free introductory course.
-
-Your strengths are your foundation. Build from what already works for you rather than trying to fix every gap at once. Look for roles that let you use your existing strengths while gradually building new skills.
-
-The goal isn't to have perfect clarity - it's to learn enough to take the next small step with confidence.
-
-What specific aspect would you like to explore further?"""
-
-def get_claude_response(user_msg, context):
-    api_key = get_secret("ANTHROPIC_API_KEY")
-    if not api_key:
-        return None, "ANTHROPIC_API_KEY not configured"
-    if not ANTHROPIC_AVAILABLE:
-        return None, "anthropic package not installed"
-    try:
-        client = anthropic.Anthropic(api_key=api_key)
-        resp = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=350,
-            system=COACH_SYSTEM,
-            messages=[{"role": "user", "content": f"{context}\n\nUser question: {user_msg}"}]
-        )
-        return resp.content[0].text.strip(), None
-    except Exception as e:
-        return None, f"Claude error: {str(e)}"
+st.markdown(careercraft_assets.stylesheet_tag(), unsafe_allow_html=True)
 
-def get_chatgpt_response(user_msg, context):
-    api_key = get_secret("OPENAI_API_KEY")
-    if not api_key:
-        return None, "OPENAI_API_KEY not configured"
-    if not OPENAI_AVAILABLE:
-        return None, "openai package not installed"
-    try:
-        client = OpenAI(api_key=api_key)
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            max_tokens=350,
-            messages=[
-                {"role": "system", "content": COACH_SYSTEM},
-                {"role": "user", "content": f"{context}\n\nUser question: {user_msg}"}
-            ]
-        )
-        return resp.choices[0].message.content.strip(), None
-    except Exception as e:
-        return None, f"ChatGPT error: {str(e)}"
-
-def get_gemini_response(user_msg, context):
-    api_key = get_secret("GOOGLE_API_KEY")
-    if not api_key:
-        return None, "GOOGLE_API_KEY not configured"
-    if not GEMINI_AVAILABLE:
-        return None, "google-generativeai package not installed"
-    try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        prompt = f"{COACH_SYSTEM}\n\n{context}\n\nUser question: {user_msg}"
-        resp = model.generate_content(prompt)
-        return resp.text.strip(), None
-    except Exception as e:
-        return None, f"Gemini error: {str(e)}"
-
-def check_api_status():
-    status = {}
-    status["claude"] = bool(get_secret("ANTHROPIC_API_KEY")) and ANTHROPIC_AVAILABLE
-    status["chatgpt"] = bool(get_secret("OPENAI_API_KEY")) and OPENAI_AVAILABLE
-    status["gemini"] = bool(get_secret("GOOGLE_API_KEY")) and GEMINI_AVAILABLE
-    return status
+careercraft_telemetry.start_exporters(
+    port=get_secret("METRICS_PORT", 9464),
+    path=get_secret("METRICS_FILE", "metrics/coach.prom"),
+)
+careercraft_events.start_pipeline(get_secret("EVENTS_DIR", "events"))
+careercraft_analytics.start_snapshots(get_secret("ANALYTICS_DIR", "analytics"))
+careercraft_session.start_sweeper(
+    ttl=get_secret("SESSION_IDLE_TTL_SECONDS", careercraft_session.DEFAULT_IDLE_TTL),
+    store=nav.session_store(),
+)
 
 # =============================================================================
 # SESSION STATE
 # =============================================================================
 
-if "page" not in st.session_state:
-    st.session_state.page = "home"
-if "step" not in st.session_state:
-    st.session_state.step = "landing"
-if "question_idx" not in st.session_state:
-    st.session_state.question_idx = 0
-if "answers" not in st.session_state:
-    st.session_state.answers = {}
-if "coach_response" not in st.session_state:
-    st.session_state.coach_response = None
-if "coach_provider" not in st.session_state:
-    st.session_state.coach_provider = None
-if "coach_error" not in st.session_state:
-    st.session_state.coach_error = None
-if "show_signup" not in st.session_state:
-    st.session_state.show_signup = False
+nav.init_state()
+nav.apply_handoff()
+nav.apply_permalink()
 
 # =============================================================================
 # NAVIGATION
 # =============================================================================
 
-def navigate_to(page, step="landing"):
-    st.session_state.page = page
-    st.session_state.step = step
-    st.session_state.show_signup = False
-
 def render_nav():
-    st.markdown('''
-    <div class="logo" style="margin-bottom: 0.75rem;">
-        <div class="logo-mark">C</div>
-        <div class="logo-text">CareerCraft</div>
-    </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(tpl.LOGO.fill(), unsafe_allow_html=True)
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        if st.button("Home", key="nav_home", use_container_width=True,
-                    type="primary" if st.session_state.page == "home" and not st.session_state.show_signup else "secondary"):
-            navigate_to("home")
-            st.rerun()
+        st.button("Home", key="nav_home", use_container_width=True,
+                  type="primary" if nav.state().page == "home" and not nav.state().show_signup else "secondary",
+                  on_click=nav.go_to, args=("home",))
     
     with col2:
-        if st.button("About", key="nav_about", use_container_width=True,
-                    type="primary" if st.session_state.page == "about" and not st.session_state.show_signup else "secondary"):
-            navigate_to("about")
-            st.rerun()
+        st.button("About", key="nav_about", use_container_width=True,
+                  type="primary" if nav.state().page == "about" and not nav.state().show_signup else "secondary",
+                  on_click=nav.go_to, args=("about",))
     
     with col3:
-        if st.button("Use Cases", key="nav_usecases", use_container_width=True,
-                    type="primary" if st.session_state.page == "usecases" and not st.session_state.show_signup else "secondary"):
-            navigate_to("usecases")
-            st.rerun()
+        st.button("Use Cases", key="nav_usecases", use_container_width=True,
+                  type="primary" if nav.state().page == "usecases" and not nav.state().show_signup else "secondary",
+                  on_click=nav.go_to, args=("usecases",))
     
     with col4:
-        if st.button("Sign up", key="nav_signup", use_container_width=True,
-                    type="primary" if st.session_state.show_signup else "secondary"):
-            st.session_state.show_signup = True
-            st.rerun()
+        st.button("Sign up", key="nav_signup", use_container_width=True,
+                  type="primary" if nav.state().show_signup else "secondary",
+                  on_click=nav.open_signup)
     
     st.markdown("<hr style='margin: 0.75rem 0 1.5rem; border: none; border-top: 1px solid #e8e5e0;'>", unsafe_allow_html=True)
 
@@ -1468,115 +159,91 @@ def render_signup():
     col1, col2 = st.columns(2)
     with col1:
         if st.button("Create free account", key="signup_submit", use_container_width=True):
-            if email and password:
-                st.success("Account created! Welcome to CareerCraft.")
-                st.session_state.show_signup = False
+            create_account(email, password, first_name, last_name)
     with col2:
-        if st.button("Cancel", key="signup_cancel", use_container_width=True, type="secondary"):
-            st.session_state.show_signup = False
-            st.rerun()
+        st.button("Cancel", key="signup_cancel", use_container_width=True, type="secondary",
+                  on_click=nav.close_signup)
     
     st.markdown('</div>', unsafe_allow_html=True)
     st.markdown('<p class="footer-note">Free during beta. No credit card required.</p>', unsafe_allow_html=True)
 
+def create_account(email, password, first_name, last_name):
+    """Hash on the account pool and wait for the write; other sessions keep running meanwhile."""
+    accounts = careercraft_accounts.get_accounts(get_secret("ACCOUNTS_DB_PATH"))
+    try:
+        with st.spinner("Creating your account..."):
+            account = accounts.create(email, password, first_name, last_name)
+    except careercraft_accounts.AccountError as e:
+        st.error(str(e))
+        return
+    nav.state().account_id = account["id"]
+    nav.event("signup", from_step=nav.state().step)
+    nav.state().show_signup = False
+    if nav.state().step == "results":
+        # Signing up from the results page keeps the answers that led there
+        nav.record_profile()
+    st.success(f"Account created! Welcome to CareerCraft{', ' + account['first_name'] if account['first_name'] else ''}.")
+
 # =============================================================================
 # HOME PAGE
 # =============================================================================
 
+def render_video(slug):
+    tag = careercraft_media.video_tag(slug)
+    if tag:
+        st.markdown(tag, unsafe_allow_html=True)
+    elif os.path.exists(careercraft_media.VIDEOS[slug]["source"]):
+        st.video(careercraft_media.VIDEOS[slug]["source"])
+
 def render_home_landing():
     # Hero
-    st.markdown('''
-    <div class="hero">
-        <div class="hero-badge">
-            <span class="hero-dot"></span>
-            Free assessment, 3 minutes
-        </div>
-        <h1 class="hero-title">Get <em>clarity</em> on your career.</h1>
-        <p class="hero-sub">
-            Answer 7 questions. Get matched to careers with real salary data.
-            Talk to AI coaches. Walk away with a 4-week plan.
-        </p>
-    </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(tpl.LANDING_HERO.fill(), unsafe_allow_html=True)
     
     # First video - under hero
-    st.video("Untitled video (1).mp4")
-    st.markdown('<p class="video-caption">See how CareerCraft matches you to careers</p>', unsafe_allow_html=True)
+    render_video("intro")
+    st.markdown(tpl.VIDEO_CAPTION.fill(caption="See how CareerCraft matches you to careers"), unsafe_allow_html=True)
     
     # Data grid
-    st.markdown('''
-    <div class="data-grid">
-        <div class="data-card">
-            <div class="data-value">7</div>
-            <div class="data-label">Questions</div>
-        </div>
-        <div class="data-card">
-            <div class="data-value">8+</div>
-            <div class="data-label">Career Matches</div>
-        </div>
-        <div class="data-card">
-            <div class="data-value">3</div>
-            <div class="data-label">AI Coaches</div>
-        </div>
-    </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(tpl.LANDING_DATA_GRID.fill(), unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("Start CareerCheck", use_container_width=True, key="start_check"):
-            st.session_state.step = "questions"
-            st.session_state.question_idx = 0
-            st.session_state.answers = {}
-            st.rerun()
+        st.button("Start CareerCheck", use_container_width=True, key="start_check",
+                  on_click=nav.start_questionnaire)
     
-    st.markdown('<p class="footer-note">No signup required to start.</p>', unsafe_allow_html=True)
+    st.markdown(tpl.FOOTER_NOTE.fill(text="No signup required to start."), unsafe_allow_html=True)
     
     # Features section
-    st.markdown('''
-    <div class="card" style="margin-top: 1.5rem;">
-        <div class="card-title">What you'll get</div>
-        <div class="pitch-item">
-            <div class="pitch-num">1</div>
-            <div class="pitch-text"><strong>Personalised career matches</strong> based on your work style, not just your resume</div>
-        </div>
-        <div class="pitch-item">
-            <div class="pitch-num">2</div>
-            <div class="pitch-text"><strong>Real salary data</strong> from 800+ occupations so you know what to expect</div>
-        </div>
-        <div class="pitch-item">
-            <div class="pitch-num">3</div>
-            <div class="pitch-text"><strong>AI career coaches</strong> to help you think through your next move</div>
-        </div>
-        <div class="pitch-item">
-            <div class="pitch-num">4</div>
-            <div class="pitch-text"><strong>A 4-week action plan</strong> with concrete steps to get started</div>
-        </div>
-    </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(tpl.LANDING_FEATURES.fill(), unsafe_allow_html=True)
     
     # Second video - bottom of page
-    st.markdown('<div class="card-title" style="text-align: center; margin-top: 2rem;">Your results, explained</div>', unsafe_allow_html=True)
-    st.video("VIDEO 1.mp4")
-    st.markdown('<p class="video-caption">How we turn your answers into actionable insights</p>', unsafe_allow_html=True)
+    st.markdown(tpl.VIDEO_TITLE.fill(title="Your results, explained"), unsafe_allow_html=True)
+    render_video("results-explained")
+    st.markdown(tpl.VIDEO_CAPTION.fill(caption="How we turn your answers into actionable insights"), unsafe_allow_html=True)
     
     # Final CTA
-    st.markdown('''
-    <div class="cta-card" style="margin-top: 1.5rem;">
-        <div class="cta-title">Ready to find your path?</div>
-        <div class="cta-body">Takes 3 minutes. No signup required.</div>
-    </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(tpl.CTA_CARD.fill(
+        style="margin-top: 1.5rem;",
+        title="Ready to find your path?",
+        body="Takes 3 minutes. No signup required.",
+    ), unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("Start CareerCheck", use_container_width=True, key="start_check_bottom"):
-            st.session_state.step = "questions"
-            st.session_state.question_idx = 0
-            st.session_state.answers = {}
-            st.rerun()
+        st.button("Start CareerCheck", use_container_width=True, key="start_check_bottom",
+                  on_click=nav.start_questionnaire)
 
+@st.fragment
+@careercraft_telemetry.timed("questions")
 def render_home_questions():
-    idx = st.session_state.question_idx
+    # Only the answer buttons live in here: they are the frequent clicks and
+    # never change the step or question. The Back/Exit and Next/See results
+    # row is drawn outside the fragment (render_question_nav), so each of
+    # those clicks costs a single full run. Hand over if the step has changed.
+    if nav.state().step != "questions":
+        st.rerun()
+    
+    idx = nav.state().question_idx
     total = len(QUESTIONS)
     question = QUESTIONS[idx]
     
@@ -1599,131 +266,89 @@ def render_home_questions():
     </div>
     ''', unsafe_allow_html=True)
     
-    current_value = st.session_state.answers.get(question["id"], None)
+    current_value = nav.state().answer(question["id"])
     
     cols = st.columns(5)
     for i, option in enumerate(ANSWER_OPTIONS):
         with cols[i]:
             is_selected = current_value == option["value"]
             btn_type = "primary" if is_selected else "secondary"
-            if st.button(option["label"], key=f"q_{question['id']}_{option['value']}", 
-                        type=btn_type, use_container_width=True):
-                st.session_state.answers[question["id"]] = option["value"]
-                st.rerun()
+            st.button(option["label"], key=f"q_{question['id']}_{option['value']}",
+                      type=btn_type, use_container_width=True,
+                      on_click=nav.answer, args=(question["id"], option["value"]))
     
+    nav.save_state()
+
+def render_question_nav():
+    # Outside the fragment, so Next and See results can't follow answers given
+    # inside it: they stay enabled and ask for an answer when one is missing.
+    idx = nav.state().question_idx
     st.markdown("<br>", unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col1:
         if idx > 0:
-            if st.button("Back", type="secondary", use_container_width=True, key="q_back"):
-                st.session_state.question_idx -= 1
-                st.rerun()
+            st.button("Back", type="secondary", use_container_width=True, key="q_back",
+                      on_click=nav.previous_question)
         else:
-            if st.button("Exit", type="secondary", use_container_width=True, key="q_exit"):
-                st.session_state.step = "landing"
-                st.rerun()
+            st.button("Exit", type="secondary", use_container_width=True, key="q_exit",
+                      on_click=nav.exit_questions)
     
     with col3:
-        can_continue = current_value is not None
-        is_last = idx == total - 1
-        
-        if is_last:
-            if st.button("See results", disabled=not can_continue, use_container_width=True, key="q_results"):
-                st.session_state.step = "results"
-                st.rerun()
+        if idx == len(QUESTIONS) - 1:
+            st.button("See results", use_container_width=True, key="q_results",
+                      on_click=nav.finish_questions)
         else:
-            if st.button("Next", disabled=not can_continue, use_container_width=True, key="q_next"):
-                st.session_state.question_idx += 1
-                st.rerun()
+            st.button("Next", use_container_width=True, key="q_next",
+                      on_click=nav.next_question)
 
 def render_home_results():
-    answers = st.session_state.answers
-    matches = calculate_career_matches(answers)
-    strengths, gaps = get_strengths_and_gaps(answers)
+    # Everything above the coach depends only on the answers, so it is cached per answer code
+    results = results_fragments(nav.state().answers)
+    strengths, gaps, top_career = results["strengths"], results["gaps"], results["top_career"]
     
-    top_match = matches[0]
-    second_match = matches[1]
-    third_match = matches[2]
-    
-    st.markdown('''
-    <div class="section-header">
-        <div class="section-title">Your Results</div>
-        <div class="section-subtitle">Based on your 7 answers</div>
-    </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(results["header"], unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown('<div class="result-label">Your Strengths</div>', unsafe_allow_html=True)
-        pills = "".join([f'<span class="pill pill-green">{s}</span>' for s in strengths])
-        st.markdown(pills, unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(results["strengths_card"], unsafe_allow_html=True)
     
     with col2:
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown('<div class="result-label">Growth Areas</div>', unsafe_allow_html=True)
-        pills = "".join([f'<span class="pill pill-amber">{s}</span>' for s in gaps])
-        st.markdown(pills, unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(results["gaps_card"], unsafe_allow_html=True)
     
-    st.markdown('<div class="card">', unsafe_allow_html=True)
-    st.markdown('<div class="result-label">Career Matches</div>', unsafe_allow_html=True)
-    
-    st.markdown(f'''
-    <div class="direction-card direction-primary">
-        <div class="direction-type">Best match</div>
-        <div class="direction-title">{top_match['career']['title']}</div>
-        <div class="direction-meta">{top_match['career']['range']} | {top_match['career']['subtitle']}</div>
-        <div class="direction-match">{top_match['match']}%</div>
-    </div>
-    <div class="direction-card direction-secondary">
-        <div class="direction-type">Strong fit</div>
-        <div class="direction-title">{second_match['career']['title']}</div>
-        <div class="direction-meta">{second_match['career']['range']} | {second_match['career']['subtitle']}</div>
-        <div class="direction-match">{second_match['match']}%</div>
-    </div>
-    <div class="direction-card direction-tertiary">
-        <div class="direction-type">Consider</div>
-        <div class="direction-title">{third_match['career']['title']}</div>
-        <div class="direction-meta">{third_match['career']['range']} | {third_match['career']['subtitle']}</div>
-        <div class="direction-match">{third_match['match']}%</div>
-    </div>
-    ''', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(results["matches"], unsafe_allow_html=True)
     
     # Timeline - Extended with 6, 8, 12 month milestones
-    top_career = top_match['career']['title']
-    st.markdown(f'''
-    <div class="timeline-card">
-        <div class="timeline-header">Your 12-Month Roadmap</div>
-        <div class="timeline">
-            <div class="tl-item tl-week1">
-                <div class="tl-label">Next 4 weeks</div>
-                <div class="tl-title">Talk to 2 {top_career}s, start 1 small project, sample 1 short course or YouTube playlist.</div>
-            </div>
-            <div class="tl-item tl-6months">
-                <div class="tl-label">By 6 months</div>
-                <div class="tl-title">Commit to one pathway: a specific course, project, or role shift you are actively working towards.</div>
-            </div>
-            <div class="tl-item tl-8months">
-                <div class="tl-label">By 8 months</div>
-                <div class="tl-title">Ship something real that others can see - a portfolio piece, case study, internal project, or certification.</div>
-            </div>
-            <div class="tl-item tl-12months">
-                <div class="tl-label">By 12 months</div>
-                <div class="tl-title">Review your skills, income, and satisfaction. Decide whether to double down on {top_career} or pivot with what you've learned.</div>
-            </div>
-        </div>
-    </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(results["roadmap"], unsafe_allow_html=True)
     
     # AI Coaches
-    st.markdown('<div class="coach-section">', unsafe_allow_html=True)
-    st.markdown('<div class="coach-title">Talk to a Career Coach</div>', unsafe_allow_html=True)
-    st.markdown('<div class="coach-subtitle">Get personalized advice powered by AI</div>', unsafe_allow_html=True)
+    render_coach_panel(strengths, gaps, top_career)
+    
+    # Save results CTA
+    st.markdown(tpl.CTA_CARD.fill(
+        style="",
+        title="Save your results and join the community",
+        body="Create an account to track progress, get updated recommendations, and connect with others on similar journeys.",
+    ), unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.button("Create free account", use_container_width=True, key="results_signup",
+                  on_click=nav.open_signup)
+    
+    share = nav.share_url()
+    if share:
+        # The live URL carries this session's key; this link carries only the answers
+        st.caption("Share your results")
+        st.code(share, language=None)
+    
+    st.button("Start over", type="secondary", key="start_over", on_click=nav.start_over)
+
+@st.fragment
+@careercraft_telemetry.timed("coach")
+def render_coach_panel(strengths, gaps, top_career):
+    st.markdown(tpl.COACH_HEADER.fill(), unsafe_allow_html=True)
     
     api_status = check_api_status()
     available_coaches = []
@@ -1733,7 +358,7 @@ def render_home_results():
         available_coaches.append("ChatGPT")
     if api_status["gemini"]:
         available_coaches.append("Gemini")
-    available_coaches.append("CareerCraft Coach")
+    available_coaches.append(FALLBACK_COACH)
     
     coach_choice = st.radio("Select coach:", available_coaches, horizontal=True, label_visibility="collapsed")
     
@@ -1741,65 +366,50 @@ def render_home_results():
     
     if st.button("Get advice", key="coach_btn"):
         if user_input.strip():
-            context = f"Strengths: {', '.join(strengths)}. Growth areas: {', '.join(gaps)}. Exploring: {top_career}."
+            context = build_coach_context(strengths, gaps, top_career)
             with st.spinner("Thinking..."):
-                response = None
+                started = time.perf_counter()
                 error = None
+                # Pre-generated answers skip the live provider call entirely
+                response = careercraft_pregen.lookup(coach_choice, context, user_input)
+                source = "pregen" if response is not None else "live"
+                if response is None:
+                    response, error = get_coach_response(coach_choice, user_input, context)
+                elapsed = time.perf_counter() - started
+                nav.event("coach_request", provider=coach_choice, source=source, ok=bool(response),
+                          seconds=round(elapsed, 3))
+                careercraft_analytics.record_coach(coach_choice, source, elapsed)
                 
-                if coach_choice == "Claude":
-                    response, error = get_claude_response(user_input, context)
-                elif coach_choice == "ChatGPT":
-                    response, error = get_chatgpt_response(user_input, context)
-                elif coach_choice == "Gemini":
-                    response, error = get_gemini_response(user_input, context)
-                else:
-                    response = get_fallback_response(user_input, context)
-                
+                session = nav.state()
                 if response:
-                    st.session_state.coach_response = response
-                    st.session_state.coach_provider = coach_choice
-                    st.session_state.coach_error = None
+                    session.coach_response = response
+                    session.coach_provider = coach_choice
+                    session.coach_error = None
                 elif error:
-                    st.session_state.coach_response = get_fallback_response(user_input, context)
-                    st.session_state.coach_provider = "CareerCraft Coach"
-                    st.session_state.coach_error = error
-            st.rerun()
-    
-    if st.session_state.get("coach_response"):
-        st.markdown(f'<div class="coach-response">{st.session_state.coach_response}</div>', unsafe_allow_html=True)
-        if st.session_state.get("coach_provider"):
-            st.markdown(f'<div class="coach-provider">Response from {st.session_state.coach_provider}</div>', unsafe_allow_html=True)
-        if st.session_state.get("coach_error"):
-            st.caption(f"Note: {st.session_state.coach_error}")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Save results CTA
-    st.markdown('''
-    <div class="cta-card">
-        <div class="cta-title">Save your results and join the community</div>
-        <div class="cta-body">Create an account to track progress, get updated recommendations, and connect with others on similar journeys.</div>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("Create free account", use_container_width=True, key="results_signup"):
-            st.session_state.show_signup = True
-            st.rerun()
-    
-    if st.button("Start over", type="secondary", key="start_over"):
-        st.session_state.step = "landing"
-        st.session_state.answers = {}
-        st.session_state.coach_response = None
-        st.rerun()
+                    careercraft_telemetry.record_fallback(coach_choice, error.split(":")[0])
+                    session.coach_response = get_fallback_response(user_input, context)
+                    session.coach_provider = FALLBACK_COACH
+                    session.coach_error = error
+    
+    coach_response = nav.state().coach_response
+    if coach_response:
+        st.markdown(tpl.COACH_RESPONSE.fill(
+            paragraphs=tpl.paragraphs(coach_response),
+            provider=nav.state().coach_provider or FALLBACK_COACH,
+        ), unsafe_allow_html=True)
+        if nav.state().coach_error:
+            st.caption(f"Note: {nav.state().coach_error}")
+    
+    nav.save_state()
 
 def render_home():
-    if st.session_state.step == "landing":
+    step = nav.state().step
+    if step == "landing":
         render_home_landing()
-    elif st.session_state.step == "questions":
+    elif step == "questions":
         render_home_questions()
-    elif st.session_state.step == "results":
+        render_question_nav()
+    elif step == "results":
         render_home_results()
 
 # =============================================================================
@@ -1807,186 +417,45 @@ def render_home():
 # =============================================================================
 
 def render_about():
-    st.markdown('''
-    <div class="section-header">
-        <div class="section-title">About CareerCraft</div>
-        <div class="section-subtitle">Career intelligence, not career guessing</div>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    st.markdown('''
-    <div class="about-body">
-        Most career advice is based on opinions, anecdotes, and gut feelings. We built CareerCraft because we believed career decisions deserve the same rigor as financial or medical decisions - grounded in data, transparent in methodology, and honest about uncertainty.
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # What makes us different
-    st.markdown('<div class="card">', unsafe_allow_html=True)
-    st.markdown('<div class="card-title">What makes us different</div>', unsafe_allow_html=True)
-    
-    diff_items = [
-        ("1", "Enterprise-grade data.", "We integrate verified labor market data covering 1,016 occupations with 62,580 skill ratings, wage data from 800+ occupations, hiring records updated monthly, and educational outcomes by institution. No surveys. No self-reported data. The same verified information used by Fortune 500 companies and research institutions."),
-        ("2", "Skill-level ROI.", "Everyone can tell you a CS degree has good ROI. We calculate the wage premium for individual skills: Python adds approximately $22,000 annually, project management adds $16,000, machine learning adds $35,000. You see exactly what to learn and what it's worth."),
-        ("3", "Research-backed methodology.", "Our matching uses hedonic wage regression (the same method labor economists use), causal inference for estimating treatment effects of career moves, and conformal prediction for honest uncertainty quantification. This isn't a personality quiz - it's the same quantitative rigor found in peer-reviewed academic research."),
-        ("4", "Transparent algorithms.", "Every recommendation includes explanations showing exactly why. No black boxes. If you want to see the math, you can. If you want to audit the logic, you can. We believe career decisions are too important for 'trust us.'"),
-        ("5", "A community that gets it.", "Career transitions are hard. You're not just navigating job markets - you're navigating identity, family expectations, financial constraints, and fear of the unknown. Our community connects you with others at every stage, from students to seasoned reinventors, sharing real stories and real accountability."),
-        ("6", "Longitudinal tracking.", "Your profile persists and evolves. As you build skills, as markets shift, as your priorities change - your recommendations update. Version control lets you see how your trajectory evolves over time."),
-    ]
-    
-    for num, title, desc in diff_items:
-        st.markdown(f'''
-        <div class="pitch-item">
-            <div class="pitch-num">{num}</div>
-            <div class="pitch-text"><strong>{title}</strong> {desc}</div>
-        </div>
-        ''', unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Our data - FIXED: descriptions not source names
-    st.markdown('<div class="card">', unsafe_allow_html=True)
-    st.markdown('<div class="card-title">Our data</div>', unsafe_allow_html=True)
-    st.markdown('<div class="about-body">Every number in CareerCraft comes from a verified source:</div>', unsafe_allow_html=True)
-    
-    st.markdown('''
-    <div class="data-grid">
-        <div class="data-card">
-            <div class="data-value" style="font-size: 1.1rem;">Occupations</div>
-            <div class="data-label">1,016 careers<br>62,580 skill ratings</div>
-        </div>
-        <div class="data-card">
-            <div class="data-value" style="font-size: 1.1rem;">Wages</div>
-            <div class="data-label">Salary data<br>800+ occupations</div>
-        </div>
-        <div class="data-card">
-            <div class="data-value" style="font-size: 1.1rem;">Hiring</div>
-            <div class="data-label">Job openings<br>Monthly updates</div>
-        </div>
-        <div class="data-card">
-            <div class="data-value" style="font-size: 1.1rem;">Education</div>
-            <div class="data-label">Graduate outcomes<br>By institution</div>
-        </div>
-    </div>
-    ''', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Community
-    st.markdown('''
-    <div class="community-card">
-        <div class="community-title">Join the community</div>
-        <div class="community-body">
-            Career change is personal, but you don't have to do it alone. Our community connects students figuring out their first path, early-career professionals optimizing for growth, mid-career pivoters rediscovering purpose, and skilled immigrants navigating new markets. Share your wins, find accountability partners, get advice from people who've been where you are.
-        </div>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # Team
-    st.markdown('''
-    <div class="card">
-        <div class="card-title">The team</div>
-        <div class="about-body">
-            CareerCraft is built by JN Advisory Group. We're a small team obsessed with bringing quantitative rigor to decisions that have historically been made on intuition. We believe everyone deserves access to the same quality of career intelligence that elite universities and top consulting firms provide to a select few.
-        </div>
-    </div>
-    ''', unsafe_allow_html=True)
+    for section in about_fragments():
+        st.markdown(section, unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("Try CareerCheck", use_container_width=True, key="about_cta"):
-            navigate_to("home", "landing")
-            st.rerun()
+        st.button("Try CareerCheck", use_container_width=True, key="about_cta",
+                  on_click=nav.go_to, args=("home", "landing"))
 
 # =============================================================================
 # USE CASES PAGE
 # =============================================================================
 
 def render_usecases():
-    # Initialize persona index in session state
-    if "persona_idx" not in st.session_state:
-        st.session_state.persona_idx = 0
-    
-    idx = st.session_state.persona_idx
+    idx = nav.state().persona_idx
     total = len(PERSONAS)
-    persona = PERSONAS[idx]
     
     # Header
-    st.markdown('''
-    <div class="section-header">
-        <div class="section-title">Problems We Solve</div>
-        <div class="section-subtitle">Real challenges. Real solutions.</div>
-    </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(tpl.SECTION_HEADER.fill(
+        title="Problems We Solve", subtitle="Real challenges. Real solutions."
+    ), unsafe_allow_html=True)
     
     # Tile selector - 4 clickable tiles
-    st.markdown('<div class="tile-grid">', unsafe_allow_html=True)
-    
     cols = st.columns(4)
     for i, p in enumerate(PERSONAS):
         with cols[i]:
             is_active = i == idx
-            tile_class = "tile active" if is_active else "tile"
-            if st.button(
-                f"{p['name']}", 
-                key=f"tile_{p['id']}", 
+            st.button(
+                f"{p['name']}",
+                key=f"tile_{p['id']}",
                 use_container_width=True,
-                type="primary" if is_active else "secondary"
-            ):
-                st.session_state.persona_idx = i
-                st.rerun()
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Progress dots
-    dots_html = "".join([f'<span class="dot {"active" if i == idx else ""}"></span>' for i in range(total)])
-    st.markdown(f'<div class="dots-container">{dots_html}</div>', unsafe_allow_html=True)
-    
-    # Main content card - broken into separate markdown calls
-    st.markdown('<div class="usecase-card">', unsafe_allow_html=True)
-    
-    # Header section
-    st.markdown(f'''
-    <div class="usecase-header">
-        <div class="usecase-name">{persona['name']}</div>
-        <div class="usecase-archetype">{persona['archetype']}</div>
-        <div class="usecase-meta">{persona['stage']} · Age {persona['age']}</div>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # Problem section
-    st.markdown(f'<div class="usecase-problem">', unsafe_allow_html=True)
-    st.markdown(f'<div class="usecase-label">The Problem</div>', unsafe_allow_html=True)
-    st.markdown(f'<div class="usecase-problem-text">{persona["problem"]}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Story
-    st.markdown(f'<div class="usecase-story">{persona["story"]}</div>', unsafe_allow_html=True)
+                type="primary" if is_active else "secondary",
+                on_click=nav.select_persona,
+                args=(i,),
+            )
     
-    st.markdown('</div>', unsafe_allow_html=True)  # Close usecase-card
-    
-    # Pain points
-    st.markdown('<div class="usecase-section">', unsafe_allow_html=True)
-    st.markdown('<div class="usecase-label">What\'s Not Working</div>', unsafe_allow_html=True)
-    for point in persona["pain_points"]:
-        st.markdown(f'<div class="usecase-pain-point">{point}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Solution - How CareerCraft helps
-    st.markdown('<div class="usecase-solution">', unsafe_allow_html=True)
-    st.markdown('<div class="usecase-solution-label">How CareerCraft Helps</div>', unsafe_allow_html=True)
-    st.markdown(f'<div class="usecase-solution-text">{persona["how_we_help"]}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Outcome
-    st.markdown('<div class="usecase-outcome">', unsafe_allow_html=True)
-    st.markdown('<div class="usecase-outcome-label">The Outcome</div>', unsafe_allow_html=True)
-    st.markdown(f'<div class="usecase-outcome-text">{persona["outcome"]}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Stats
-    st.markdown('<div class="usecase-stats">', unsafe_allow_html=True)
-    for stat in persona["stats"]:
-        st.markdown(f'<span class="usecase-stat">{stat}</span>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    # Progress dots, then persona card, pain points, solution, outcome and stats
+    dots_html, persona_html = persona_fragments(idx)
+    st.markdown(dots_html, unsafe_allow_html=True)
+    st.markdown(persona_html, unsafe_allow_html=True)
     
     # Navigation arrows
     st.markdown("<br>", unsafe_allow_html=True)
@@ -1995,27 +464,58 @@ def render_usecases():
     
     with col1:
         if idx > 0:
-            if st.button("Previous", type="secondary", use_container_width=True, key="persona_prev"):
-                st.session_state.persona_idx -= 1
-                st.rerun()
+            st.button("Previous", type="secondary", use_container_width=True, key="persona_prev",
+                      on_click=nav.previous_persona)
     
     with col3:
         if idx < total - 1:
-            if st.button("Next", use_container_width=True, key="persona_next"):
-                st.session_state.persona_idx += 1
-                st.rerun()
+            st.button("Next", use_container_width=True, key="persona_next",
+                      on_click=nav.next_persona)
         else:
-            if st.button("Try It Free", use_container_width=True, key="persona_start"):
-                navigate_to("home", "landing")
-                st.rerun()
+            st.button("Try It Free", use_container_width=True, key="persona_start",
+                      on_click=nav.go_to, args=("home", "landing"))
     
     # CTA at end
-    st.markdown('''
-    <div class="cta-card" style="margin-top: 2rem;">
-        <div class="cta-title">Sound familiar?</div>
-        <div class="cta-body">Take the free CareerCheck assessment and get your personalised career matches in 3 minutes.</div>
-    </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(tpl.CTA_CARD.fill(
+        style="margin-top: 2rem;",
+        title="Sound familiar?",
+        body="Take the free CareerCheck assessment and get your personalised career matches in 3 minutes.",
+    ), unsafe_allow_html=True)
+
+# =============================================================================
+# ADMIN
+# =============================================================================
+
+def render_admin():
+    import pandas as pd
+
+    summary = careercraft_analytics.merged(get_secret("ANALYTICS_DIR", "analytics")).summary()
+    st.markdown(tpl.SECTION_HEADER.fill(
+        title="Live analytics",
+        subtitle=f"{summary['results']:,} results across all workers",
+    ), unsafe_allow_html=True)
+
+    st.subheader("Match % by career")
+    titles = {career["id"]: career["title"] for career in CAREERS}
+    st.dataframe(pd.DataFrame([
+        {"career": titles[career_id], "results": row["count"],
+         "mean": None if row["mean"] is None else round(row["mean"], 1),
+         **{f"p{int(q * 100)}": row[q] for q in careercraft_analytics.QUANTILES}}
+        for career_id, row in summary["matches"].items()
+    ]), hide_index=True, use_container_width=True)
+
+    st.subheader("Answers by question")
+    st.bar_chart(pd.DataFrame(summary["answers"]).T)
+
+    st.subheader("Coach latency (seconds)")
+    if summary["coach"]:
+        st.dataframe(pd.DataFrame([
+            {"provider": provider, "requests": row["count"],
+             **{f"p{int(q * 100)}": round(row[q], 3) for q in careercraft_analytics.QUANTILES}}
+            for provider, row in summary["coach"].items()
+        ]), hide_index=True, use_container_width=True)
+    else:
+        st.caption("No coach requests yet.")
 
 # =============================================================================
 # MAIN
@@ -2024,18 +524,20 @@ def render_usecases():
 def main():
     render_nav()
     
-    if st.session_state.get("show_signup", False):
-        render_signup()
-        return
-    
-    page = st.session_state.get("page", "home")
+    page = nav.state().page
     
-    if page == "home":
+    if nav.admin_requested():
+        render_admin()
+    elif nav.state().show_signup:
+        render_signup()
+    elif page == "home":
         render_home()
     elif page == "about":
         render_about()
     elif page == "usecases":
         render_usecases()
+    
+    nav.save_state()
 
 if __name__ == "__main__":
-    main()
+    careercraft_telemetry.timed("app")(main)()
@@ -0,0 +1,148 @@
+"""
+CareerCraft – static assets
+Builds the stylesheet into a minified, content-hashed file under static/ so the
+browser fetches and caches it once; each rerun only sends a <link> tag. Servers
+that can't deliver it as text/css get the minified CSS inline instead.
+
+Fonts are self-hosted from static/fonts/, built by careercraft_fonts.py as a
+required setup and deploy step. Without that build (or without static serving)
+the stylesheet refuses to build, unless FONT_CDN_FALLBACK is set to load the
+fonts from Google Fonts instead.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(ROOT, "assets")
+STATIC_DIR = os.path.join(ROOT, "static")
+STYLESHEET_SOURCE = os.path.join(ASSETS_DIR, "careercraft.css")
+FONTS_SOURCE = os.path.join(ASSETS_DIR, "fonts.css")          # built by careercraft_fonts.py
+FONTS_MANIFEST = os.path.join(ASSETS_DIR, "fonts", "manifest.json")
+# Used only until the self-hosted subsets have been built
+GOOGLE_FONTS_IMPORT = "@import url('https://fonts.googleapis.com/css2?family=Fraunces:ital,opsz,wght@0,9..144,400;0,9..144,600;0,9..144,700;1,9..144,400&family=DM+Sans:wght@400;500;600&display=swap');"
+STATIC_URL = "app/static"
+
+_stylesheet = None
+log = logging.getLogger("careercraft.assets")
+
+class FontsUnavailable(RuntimeError):
+    """The self-hosted fonts are not built or cannot be served; the message says how to fix it."""
+
+def _cdn_fallback(reason):
+    """Google Fonts in place of the self-hosted build, only when explicitly allowed."""
+    from careercraft_config import get_secret
+
+    if str(get_secret("FONT_CDN_FALLBACK", "")).lower() not in ("1", "true", "yes"):
+        raise FontsUnavailable(f"{reason}. Set FONT_CDN_FALLBACK=1 to load the fonts from Google Fonts instead.")
+    log.warning("%s; loading fonts from Google Fonts (FONT_CDN_FALLBACK)", reason)
+    return GOOGLE_FONTS_IMPORT
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+def font_faces_css():
+    try:
+        with open(FONTS_SOURCE, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return _cdn_fallback(f"{os.path.relpath(FONTS_SOURCE, ROOT)} is missing: run python careercraft_fonts.py") + "\n"
+
+def font_preload_tags(base_url=STATIC_URL):
+    try:
+        with open(FONTS_MANIFEST, encoding="utf-8") as f:
+            faces = json.load(f).get("faces", [])
+    except (OSError, ValueError):
+        return ""
+    return "".join(
+        f'<link rel="preload" href="{base_url}/fonts/{face["file"]}" as="font" type="font/woff2" crossorigin>'
+        for face in faces if face.get("preload")
+    )
+
+def build_stylesheet():
+    """Write static/careercraft.<hash>.css and return (filename, minified css).
+
+    filename is None when the static directory is not writable.
+    """
+    with open(STYLESHEET_SOURCE, encoding="utf-8") as f:
+        css = minify_css(font_faces_css() + f.read())
+    data = css.encode("utf-8")
+    filename = f"careercraft.{content_hash(data)}.css"
+    path = os.path.join(STATIC_DIR, filename)
+    if not os.path.exists(path):
+        try:
+            os.makedirs(STATIC_DIR, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+            for stale in glob.glob(os.path.join(STATIC_DIR, "careercraft.*.css")):
+                if stale != path:
+                    os.remove(stale)
+        except OSError:
+            # Read-only deploys fall back to inlining the minified CSS
+            return None, css
+    return filename, css
+
+def inline_css(css):
+    """Inline CSS resolves url() against the page, not static/, so point fonts there."""
+    return css.replace("url('fonts/", f"url('{STATIC_URL}/fonts/")
+
+def static_serving_enabled():
+    import streamlit as st
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+def static_css_supported():
+    """Whether app/static/ serves .css as text/css.
+
+    The Tornado static handler (before the Starlette server) only keeps the
+    real MIME type for images and sends everything else as text/plain with
+    nosniff, which browsers refuse to apply as a stylesheet.
+    """
+    try:
+        from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    except ImportError:
+        pass
+    else:
+        return ".css" in SAFE_APP_STATIC_FILE_EXTENSIONS
+    try:
+        # The Starlette server guesses the type from the extension
+        import streamlit.web.server.starlette.starlette_routes  # noqa: F401
+    except ImportError:
+        # A server we don't know: inline CSS works everywhere
+        return False
+    return True
+
+def stylesheet_link(filename):
+    # The hash in the name and ?v= keep a new build from being served stale
+    return f'<link rel="stylesheet" href="{STATIC_URL}/{filename}?v={filename.split(".")[1]}">'
+
+def stylesheet_tag():
+    """The per-rerun payload: a link to the hashed file, or inline CSS when it can't be linked."""
+    global _stylesheet
+    if _stylesheet is None:
+        filename, css = build_stylesheet()
+        if not static_serving_enabled():
+            # Self-hosted fonts are unreachable without static serving
+            fonts = _cdn_fallback("server.enableStaticServing is off, so static/fonts/ can't be served")
+            with open(STYLESHEET_SOURCE, encoding="utf-8") as f:
+                css = minify_css(fonts + f.read())
+            _stylesheet = f"<style>{css}</style>"
+        elif filename and static_css_supported():
+            _stylesheet = font_preload_tags() + stylesheet_link(filename)
+        else:
+            _stylesheet = font_preload_tags() + f"<style>{inline_css(css)}</style>"
+    return _stylesheet
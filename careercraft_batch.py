@@ -0,0 +1,327 @@
+"""
+CareerCraft – batch scoring
+Scores a CSV or Parquet file of questionnaire responses (one column per
+QUESTIONS id) chunk by chunk and writes the top matches and strengths/gaps
+for every row. Only a few chunks are in memory at once, so file size is not
+bounded by RAM; --workers fans chunks out to a process pool, and with
+--shared-memory the pool scores each chunk's matches over shared memory
+instead of receiving pickled chunks.
+
+    python careercraft_batch.py responses.csv scored.parquet --top 3 --workers 8
+
+Answers are the option values (20, 40, 60, 80, 95), or 1-5 with --likert.
+Blank answers count as unanswered, as in the app. Every other column is
+copied through, so keep an id column in the input. Parquet needs pyarrow.
+"""
+
+import argparse
+import collections
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from careercraft_engine import ANSWER_VALUES, CAREERS, QUESTIONS, encode_answers, get_strengths_and_gaps
+
+CHUNK_ROWS = 50_000
+QUESTION_IDS = [q["id"] for q in QUESTIONS]
+VALUES = np.array(ANSWER_VALUES, dtype=np.float64)
+UNANSWERED = 50            # what calculate_career_matches assumes for a missing answer
+
+# Career fit as a (careers x questions) matrix, missing fits at 50 like the engine
+FIT = np.array([[c["fit"].get(qid, 50) for qid in QUESTION_IDS] for c in CAREERS], dtype=np.float64)
+TITLES = np.array([c["title"] for c in CAREERS], dtype=object)
+
+# =============================================================================
+# SCORING
+# =============================================================================
+
+def normalize(frame, likert=False):
+    """Answer matrix (NaN = unanswered) and per-row error text for bad values."""
+    answers = frame[QUESTION_IDS].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+    raw_blank = frame[QUESTION_IDS].isna().to_numpy()
+    if likert:
+        valid = np.isin(answers, np.arange(1, len(VALUES) + 1))
+        answers = np.where(valid, VALUES[np.clip(np.nan_to_num(answers, nan=1).astype(int), 1, len(VALUES)) - 1], np.nan)
+    else:
+        valid = np.isin(answers, VALUES)
+        answers = np.where(valid, answers, np.nan)
+    bad = ~valid & ~raw_blank
+    errors = np.full(len(frame), None, dtype=object)
+    for row in np.flatnonzero(bad.any(axis=1)):
+        errors[row] = "invalid answer: " + ", ".join(np.array(QUESTION_IDS)[bad[row]])
+    return answers, errors
+
+def top_matches(answers, k, fit=FIT):
+    """Vectorised calculate_career_matches: (indices, match %) of the top k careers per row."""
+    filled = np.where(np.isnan(answers), UNANSWERED, answers)
+    total_diff = np.abs(filled[:, None, :] - fit[None, :, :]).sum(axis=2)
+    max_diff = len(QUESTIONS) * 80
+    # Same float expression as the engine so int() truncation agrees exactly
+    match = np.maximum(0, 100 - np.trunc((total_diff / max_diff) * 100).astype(np.int64))
+    # Stable sort keeps catalogue order on ties, like sorted(..., reverse=True)
+    order = np.argsort(-match, axis=1, kind="stable")[:, :k]
+    return order, np.take_along_axis(match, order, axis=1)
+
+def _row_key(answers):
+    # Base-6 digit per question, 0 for unanswered: one key per distinct response
+    digits = np.where(np.isnan(answers), 0, np.searchsorted(VALUES, np.nan_to_num(answers)) + 1)
+    return digits @ (6 ** np.arange(len(QUESTIONS)))
+
+_strengths_cache = {}
+
+def strengths_and_gaps(answers):
+    """get_strengths_and_gaps per row, computed once per distinct response."""
+    keys, first, inverse = np.unique(_row_key(answers), return_index=True, return_inverse=True)
+    strengths = np.empty(len(keys), dtype=object)
+    gaps = np.empty(len(keys), dtype=object)
+    codes = np.empty(len(keys), dtype=object)
+    for i, key in enumerate(keys):
+        cached = _strengths_cache.get(key)
+        if cached is None:
+            row = answers[first[i]].tolist()
+            as_dict = {qid: int(v) for qid, v in zip(QUESTION_IDS, row) if v == v}
+            s, g = get_strengths_and_gaps(as_dict)
+            cached = _strengths_cache[key] = ("; ".join(s), "; ".join(g), encode_answers(as_dict))
+        strengths[i], gaps[i], codes[i] = cached
+    return strengths[inverse], gaps[inverse], codes[inverse]
+
+def score_chunk(frame, k=3, likert=False, matcher=top_matches):
+    """Input columns other than the answers, then top-k matches, strengths, gaps and code.
+
+    matcher computes the top matches; pass SharedScorer.top_matches to spread
+    that step over a pool.
+    """
+    answers, errors = normalize(frame, likert)
+    order, match = matcher(answers, k)
+    strengths, gaps, codes = strengths_and_gaps(answers)
+    out = frame.drop(columns=QUESTION_IDS).reset_index(drop=True)
+    for rank in range(k):
+        out[f"match_{rank + 1}"] = TITLES[order[:, rank]]
+        out[f"match_{rank + 1}_pct"] = match[:, rank]
+    out["strengths"] = strengths
+    out["gaps"] = gaps
+    out["code"] = codes
+    out["error"] = errors
+    failed = pd.notna(out["error"])
+    if failed.any():
+        result_columns = [c for c in out.columns if c.startswith("match_")] + ["strengths", "gaps", "code"]
+        out[result_columns] = out[result_columns].astype(object)
+        out.loc[failed, result_columns] = None
+    return out
+
+# =============================================================================
+# SHARED-MEMORY COHORTS
+# =============================================================================
+
+def _attach(name):
+    # Pool workers share the parent's resource tracker, so attaching only
+    # re-registers a name it already holds; the parent unlinks.
+    return shared_memory.SharedMemory(name=name)
+
+def _share(array):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, array.dtype, buffer=shm.buf)[:] = array
+    return shm
+
+_worker_fit = None
+
+def _init_worker(fit_name, fit_shape):
+    global _worker_fit
+    shm = _attach(fit_name)
+    _worker_fit = (shm, np.ndarray(fit_shape, np.float64, buffer=shm.buf))
+
+def _score_shard(names, rows, k, start, stop):
+    answers_shm, order_shm, match_shm = (_attach(name) for name in names)
+    try:
+        answers = np.ndarray((rows, len(QUESTIONS)), np.float64, buffer=answers_shm.buf)
+        order = np.ndarray((rows, k), np.int64, buffer=order_shm.buf)
+        match = np.ndarray((rows, k), np.int64, buffer=match_shm.buf)
+        order[start:stop], match[start:stop] = top_matches(answers[start:stop], k, _worker_fit[1])
+        del answers, order, match
+    finally:
+        for shm in (answers_shm, order_shm, match_shm):
+            shm.close()
+    return stop - start
+
+class SharedScorer:
+    """Scores answer matrices across worker processes.
+
+    The fit matrix is placed in shared memory once for the pool's lifetime.
+    Each call shares the answers and two result arrays the same way; workers
+    score contiguous row ranges in place, so nothing is pickled but names and
+    offsets and results come back in row order.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.fit = _share(FIT)
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.fit.name, FIT.shape))
+
+    def top_matches(self, answers, k=3):
+        rows = len(answers)
+        answers_shm = _share(np.ascontiguousarray(answers, dtype=np.float64))
+        order_shm = shared_memory.SharedMemory(create=True, size=max(rows * k * 8, 1))
+        match_shm = shared_memory.SharedMemory(create=True, size=max(rows * k * 8, 1))
+        try:
+            names = (answers_shm.name, order_shm.name, match_shm.name)
+            bounds = np.linspace(0, rows, self.workers + 1, dtype=int)
+            futures = [
+                self.pool.submit(_score_shard, names, rows, k, int(start), int(stop))
+                for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start
+            ]
+            for future in futures:
+                future.result()
+            order = np.ndarray((rows, k), np.int64, buffer=order_shm.buf).copy()
+            match = np.ndarray((rows, k), np.int64, buffer=match_shm.buf).copy()
+            return order, match
+        finally:
+            for shm in (answers_shm, order_shm, match_shm):
+                shm.close()
+                shm.unlink()
+
+    def close(self):
+        self.pool.shutdown()
+        self.fit.close()
+        self.fit.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# =============================================================================
+# STREAMING
+# =============================================================================
+
+def read_chunks(path, chunk_rows):
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_rows)
+
+# Result columns' Parquet types, fixed rather than inferred: a chunk with no
+# bad rows has an all-null error column, and failed rows null every result
+_RESULT_TYPES = (
+    (re.compile(r"match_\d+_pct"), "int64"),
+    (re.compile(r"match_\d+|strengths|gaps|code|error"), "string"),
+)
+
+def parquet_schema(schema):
+    """The first chunk's schema with result columns typed explicitly.
+
+    Copied-through columns keep their inferred type, except all-null ones,
+    which are written as strings.
+    """
+    import pyarrow as pa
+
+    fields = []
+    for field in schema:
+        kind = next((kind for pattern, kind in _RESULT_TYPES if pattern.fullmatch(field.name)), None)
+        if kind is None and pa.types.is_null(field.type):
+            kind = "string"
+        fields.append(field.with_type(pa.type_for_alias(kind)) if kind else field)
+    return pa.schema(fields)
+
+class ChunkWriter:
+    """Appends scored chunks to a .csv or .parquet file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.parquet = None
+        self.rows = 0
+
+    def write(self, frame):
+        if self.path.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self.parquet is None:
+                self.parquet = pq.ParquetWriter(self.path, parquet_schema(table.schema))
+            self.parquet.write_table(table.cast(self.parquet.schema))
+        else:
+            frame.to_csv(self.path, mode="a" if self.rows else "w", header=not self.rows, index=False)
+        self.rows += len(frame)
+
+    def close(self):
+        if self.parquet is not None:
+            self.parquet.close()
+
+def run(source, dest, k=3, likert=False, workers=1, chunk_rows=CHUNK_ROWS, shared=False):
+    """Score source into dest; returns the number of rows written.
+
+    With workers > 1, chunks are pickled to a process pool, or with shared=True
+    read and finished here while a SharedScorer computes their matches.
+    """
+    chunks = read_chunks(source, chunk_rows)
+    first = next(chunks, None)
+    if first is None:
+        raise SystemExit(f"{source} has no rows")
+    missing = [qid for qid in QUESTION_IDS if qid not in first.columns]
+    if missing:
+        raise SystemExit(f"{source} is missing answer columns: {', '.join(missing)}")
+
+    tmp = f"{dest}.tmp{os.path.splitext(dest)[1]}"
+    writer = ChunkWriter(tmp)
+    try:
+        try:
+            if workers <= 1:
+                writer.write(score_chunk(first, k, likert))
+                for chunk in chunks:
+                    writer.write(score_chunk(chunk, k, likert))
+            elif shared:
+                with SharedScorer(workers) as scorer:
+                    writer.write(score_chunk(first, k, likert, scorer.top_matches))
+                    for chunk in chunks:
+                        writer.write(score_chunk(chunk, k, likert, scorer.top_matches))
+            else:
+                # At most 2 chunks per worker in flight, written back in input order
+                with ProcessPoolExecutor(workers) as pool:
+                    pending = collections.deque([pool.submit(score_chunk, first, k, likert)])
+                    for chunk in chunks:
+                        pending.append(pool.submit(score_chunk, chunk, k, likert))
+                        while len(pending) >= 2 * workers:
+                            writer.write(pending.popleft().result())
+                    while pending:
+                        writer.write(pending.popleft().result())
+        finally:
+            writer.close()
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, dest)
+    return writer.rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV/Parquet file of questionnaire responses.")
+    parser.add_argument("source", help="Input .csv or .parquet with one column per question id")
+    parser.add_argument("dest", help="Output .csv or .parquet")
+    parser.add_argument("--top", type=int, default=3, help="Matches to keep per row")
+    parser.add_argument("--likert", action="store_true", help="Answers are 1-5 rather than option values")
+    parser.add_argument("--workers", type=int, default=1, help="Score chunks in a process pool")
+    parser.add_argument("--shared-memory", action="store_true",
+                        help="With --workers, share each chunk's answers with the pool instead of pickling the chunk")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args(argv)
+    if not 1 <= args.top <= len(CAREERS):
+        parser.error(f"--top must be between 1 and {len(CAREERS)}")
+
+    started = time.perf_counter()
+    rows = run(args.source, args.dest, args.top, args.likert, args.workers, args.chunk_rows, args.shared_memory)
+    elapsed = time.perf_counter() - started
+    print(f"scored {rows} rows in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s) -> {args.dest}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
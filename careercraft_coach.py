@@ -0,0 +1,234 @@
+"""
+CareerCraft – AI coaches
+Provider calls for the coach panel, shared by the app and offline jobs.
+"""
+
+import importlib.util
+import threading
+import time
+from collections import deque
+
+from careercraft_config import get_secret, secrets_snapshot
+from careercraft_telemetry import CoachCall
+
+# Optional LLM SDKs: detected without importing, imported on first coach use
+def _installed(module):
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+ANTHROPIC_AVAILABLE = _installed("anthropic")
+OPENAI_AVAILABLE = _installed("openai")
+GEMINI_AVAILABLE = _installed("google.generativeai")
+
+FALLBACK_COACH = "CareerCraft Coach"
+
+# =============================================================================
+# MODEL ROUTING
+# =============================================================================
+
+# Models per provider, preferred first. expected_p95 (seconds) is the prior used
+# until enough live samples exist; later entries are faster, smaller fallbacks.
+MODEL_REGISTRY = {
+    "Claude": [
+        {"model": "claude-sonnet-4-20250514", "max_tokens": 350, "expected_p95": 8.0},
+        {"model": "claude-3-5-haiku-20241022", "max_tokens": 300, "expected_p95": 4.0},
+    ],
+    "ChatGPT": [
+        {"model": "gpt-4o-mini", "max_tokens": 350, "expected_p95": 6.0},
+        {"model": "gpt-4.1-nano", "max_tokens": 300, "expected_p95": 3.0},
+    ],
+    "Gemini": [
+        {"model": "gemini-1.5-flash", "max_tokens": 350, "expected_p95": 5.0},
+        {"model": "gemini-1.5-flash-8b", "max_tokens": 300, "expected_p95": 3.0},
+    ],
+}
+
+DEFAULT_P95_BUDGET = 8.0      # seconds, for the "Get advice" action
+LATENCY_WINDOW = 200          # most recent samples kept per model
+LATENCY_MAX_AGE = 600         # seconds; older samples no longer count
+LATENCY_MIN_SAMPLES = 5       # below this, the registry prior is used
+ERROR_PENALTY = 30.0          # seconds a failed call counts as, so fast failures aren't preferred
+
+_latency_samples = {}
+_latency_lock = threading.Lock()
+
+def get_p95_budget():
+    try:
+        return float(get_secret("COACH_P95_BUDGET_SECONDS", DEFAULT_P95_BUDGET))
+    except (TypeError, ValueError):
+        return DEFAULT_P95_BUDGET
+
+def record_latency(provider, model, seconds, failed=False):
+    if failed:
+        # A bad key or refused connection fails in milliseconds; that is not a fast model
+        seconds = max(seconds, ERROR_PENALTY)
+    with _latency_lock:
+        samples = _latency_samples.setdefault((provider, model), deque(maxlen=LATENCY_WINDOW))
+        samples.append((time.monotonic(), seconds))
+
+def observed_p95(provider, spec):
+    cutoff = time.monotonic() - LATENCY_MAX_AGE
+    with _latency_lock:
+        samples = _latency_samples.get((provider, spec["model"]), ())
+        recent = sorted(s for t, s in samples if t >= cutoff)
+    # Once samples age out the prior applies again, so a model that was
+    # downshifted away from gets retried after it had time to recover.
+    if len(recent) < LATENCY_MIN_SAMPLES:
+        return spec["expected_p95"]
+    return recent[min(len(recent) - 1, int(len(recent) * 0.95))]
+
+def select_model(provider, budget=None):
+    """Preferred model within the p95 budget, else the fastest one."""
+    budget = get_p95_budget() if budget is None else budget
+    specs = MODEL_REGISTRY[provider]
+    profiled = [(observed_p95(provider, spec), spec) for spec in specs]
+    for p95, spec in profiled:
+        if p95 <= budget:
+            return spec
+    return min(profiled, key=lambda item: item[0])[1]
+
+# =============================================================================
+# PROVIDERS
+# =============================================================================
+
+COACH_SYSTEM = """You are a thoughtful career coach. Help people think through career decisions with:
+1. What matters most right now
+2. How to frame the next 3-6 months
+3. 1-3 concrete, low-risk experiments
+Keep responses under 200 words. Be warm but direct."""
+
+def get_fallback_response(user_msg, context):
+    return """Based on your profile, here's how I'd approach this:
+
+Start with conversations, not courses. Before investing in any training, talk to 2-3 people actually doing the work you're considering. Ask them: What surprised you about this role? What do you wish you'd known?
+
+Run a small experiment. Pick one thing you can try in the next 2 weeks that tests your interest. Could be a side project, volunteering for a task at work, or taking a free introductory course.
+
+Your strengths are your foundation. Build from what already works for you rather than trying to fix every gap at once. Look for roles that let you use your existing strengths while gradually building new skills.
+
+The goal isn't to have perfect clarity - it's to learn enough to take the next small step with confidence.
+
+What specific aspect would you like to explore further?"""
+
+def get_claude_response(user_msg, context):
+    api_key = get_secret("ANTHROPIC_API_KEY")
+    if not api_key:
+        return None, "ANTHROPIC_API_KEY not configured"
+    if not ANTHROPIC_AVAILABLE:
+        return None, "anthropic package not installed"
+    spec = select_model("Claude")
+    call = CoachCall("Claude", spec["model"])
+    try:
+        import anthropic
+        client = anthropic.Anthropic(api_key=api_key)
+        chunks = []
+        with client.messages.stream(
+            model=spec["model"],
+            max_tokens=spec["max_tokens"],
+            system=COACH_SYSTEM,
+            messages=[{"role": "user", "content": f"{context}\n\nUser question: {user_msg}"}]
+        ) as stream:
+            for text in stream.text_stream:
+                call.first_token()
+                chunks.append(text)
+            usage = stream.get_final_message().usage
+        call.usage(usage.input_tokens, usage.output_tokens)
+        return "".join(chunks).strip(), None
+    except Exception as e:
+        call.fail(e)
+        return None, f"Claude error: {str(e)}"
+    finally:
+        record_latency("Claude", spec["model"], call.finish(), failed=call.error_class is not None)
+
+def get_chatgpt_response(user_msg, context):
+    api_key = get_secret("OPENAI_API_KEY")
+    if not api_key:
+        return None, "OPENAI_API_KEY not configured"
+    if not OPENAI_AVAILABLE:
+        return None, "openai package not installed"
+    spec = select_model("ChatGPT")
+    call = CoachCall("ChatGPT", spec["model"])
+    try:
+        from openai import OpenAI
+        client = OpenAI(api_key=api_key)
+        stream = client.chat.completions.create(
+            model=spec["model"],
+            max_tokens=spec["max_tokens"],
+            messages=[
+                {"role": "system", "content": COACH_SYSTEM},
+                {"role": "user", "content": f"{context}\n\nUser question: {user_msg}"}
+            ],
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        chunks = []
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                call.first_token()
+                chunks.append(chunk.choices[0].delta.content)
+            if chunk.usage:
+                call.usage(chunk.usage.prompt_tokens, chunk.usage.completion_tokens)
+        return "".join(chunks).strip(), None
+    except Exception as e:
+        call.fail(e)
+        return None, f"ChatGPT error: {str(e)}"
+    finally:
+        record_latency("ChatGPT", spec["model"], call.finish(), failed=call.error_class is not None)
+
+def get_gemini_response(user_msg, context):
+    api_key = get_secret("GOOGLE_API_KEY")
+    if not api_key:
+        return None, "GOOGLE_API_KEY not configured"
+    if not GEMINI_AVAILABLE:
+        return None, "google-generativeai package not installed"
+    spec = select_model("Gemini")
+    call = CoachCall("Gemini", spec["model"])
+    try:
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+        model = genai.GenerativeModel(spec["model"])
+        prompt = f"{COACH_SYSTEM}\n\n{context}\n\nUser question: {user_msg}"
+        resp = model.generate_content(
+            prompt, generation_config={"max_output_tokens": spec["max_tokens"]}, stream=True
+        )
+        chunks = []
+        for chunk in resp:
+            call.first_token()
+            chunks.append(chunk.text)
+        usage = resp.usage_metadata
+        call.usage(usage.prompt_token_count, usage.candidates_token_count)
+        return "".join(chunks).strip(), None
+    except Exception as e:
+        call.fail(e)
+        return None, f"Gemini error: {str(e)}"
+    finally:
+        record_latency("Gemini", spec["model"], call.finish(), failed=call.error_class is not None)
+
+_api_status = (None, None)
+
+def check_api_status():
+    """Provider availability, recomputed only when the secrets snapshot changes."""
+    global _api_status
+    version = secrets_snapshot()[0]
+    cached_version, status = _api_status
+    if cached_version != version:
+        status = {}
+        status["claude"] = bool(get_secret("ANTHROPIC_API_KEY")) and ANTHROPIC_AVAILABLE
+        status["chatgpt"] = bool(get_secret("OPENAI_API_KEY")) and OPENAI_AVAILABLE
+        status["gemini"] = bool(get_secret("GOOGLE_API_KEY")) and GEMINI_AVAILABLE
+        _api_status = (version, status)
+    return dict(status)
+
+COACH_PROVIDERS = {
+    "Claude": get_claude_response,
+    "ChatGPT": get_chatgpt_response,
+    "Gemini": get_gemini_response,
+}
+
+def get_coach_response(coach_choice, user_msg, context):
+    provider = COACH_PROVIDERS.get(coach_choice)
+    if provider is None:
+        return get_fallback_response(user_msg, context), None
+    return provider(user_msg, context)
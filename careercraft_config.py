@@ -0,0 +1,68 @@
+"""
+CareerCraft – configuration
+A process-wide snapshot of st.secrets, resolved once and refreshed only when a
+secrets file changes on disk, so lookups on the rerun path are dict reads.
+"""
+
+import os
+import threading
+import time
+
+import streamlit as st
+
+# Streamlit's default secrets locations, global first so the project file wins
+SECRETS_FILES = [
+    os.path.join(os.path.expanduser("~"), ".streamlit", "secrets.toml"),
+    os.path.join(os.getcwd(), ".streamlit", "secrets.toml"),
+]
+RECHECK_INTERVAL = 1.0  # seconds between stat() checks of the secrets files
+
+_lock = threading.Lock()
+_snapshot = None
+_signature = None
+_checked_at = 0.0
+_version = 0
+
+def _files_signature():
+    signature = []
+    for path in SECRETS_FILES:
+        try:
+            info = os.stat(path)
+            signature.append((path, info.st_mtime_ns, info.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+def _resolve(reload=False):
+    try:
+        if reload:
+            # st.secrets only re-parses once its own file watcher (polling every
+            # 0.2 s) has fired; reset it so this read sees the file as it is now
+            st.secrets._reset()
+        return dict(st.secrets)
+    except:
+        return {}
+
+def secrets_snapshot():
+    """Return (version, secrets dict); version changes whenever the dict does."""
+    global _snapshot, _signature, _checked_at, _version
+    now = time.monotonic()
+    if _snapshot is not None and now - _checked_at < RECHECK_INTERVAL:
+        return _version, _snapshot
+    with _lock:
+        _checked_at = now
+        signature = _files_signature()
+        if _snapshot is None or signature != _signature:
+            _snapshot = _resolve(reload=_snapshot is not None)
+            # Keep the signature only if nothing changed during the read;
+            # otherwise the next check reads again
+            _signature = signature if _files_signature() == signature else None
+            _version += 1
+        return _version, _snapshot
+
+def get_secret(key, default=None):
+    value = secrets_snapshot()[1].get(key)
+    if value is None:
+        # Offline jobs run outside Streamlit, where keys come from the environment
+        value = os.environ.get(key, default)
+    return value
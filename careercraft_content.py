@@ -0,0 +1,216 @@
+"""
+CareerCraft – page content
+Static persona and About page copy, plus their rendered HTML. Fragments are
+built once per process on first use and cached under a hash of the data, so
+page switches only send cached strings. Results pages are cached by answer
+code, the same key their share link carries.
+"""
+
+import functools
+import hashlib
+import json
+
+from careercraft_engine import calculate_career_matches, decode_answers, encode_answers, get_strengths_and_gaps
+import careercraft_templates as tpl
+
+# =============================================================================
+# DATA
+# =============================================================================
+
+# Personas - focused on problems CareerCraft solves
+PERSONAS = [
+    {
+        "id": "maya",
+        "name": "Maya",
+        "archetype": "The Undecided Graduate",
+        "age": "19-22",
+        "stage": "Student / Recent Grad",
+        "problem": "Too many options, no clear direction",
+        "story": "Maya is finishing her business degree but isn't sure what career to pursue. She's interested in several fields but doesn't know which one suits her best or pays well.",
+        "pain_points": [
+            "Doesn't know which careers match her strengths",
+            "Can't compare salaries across different paths",
+            "Generic career quizzes haven't helped",
+            "No way to see what skills she should develop"
+        ],
+        "how_we_help": "CareerCheck identifies Maya's strengths and matches her to careers with real salary data. Skills Lab shows exactly which skills to develop and their value. Pathways recommends courses and certifications ranked by earning potential. Sessions gives her a structured pack to discuss options with her uni career advisor.",
+        "outcome": "From confused to confident with a 12-month plan",
+        "stats": ["75% of students change their major", "67% need help with career decisions", "Only 27% feel prepared for job market"]
+    },
+    {
+        "id": "darius",
+        "name": "Darius",
+        "archetype": "The Strategic Climber",
+        "age": "26-30",
+        "stage": "Early Career (3-5 years)",
+        "problem": "Wants to grow income but can't compare paths",
+        "story": "Darius earns $85K but sees peers earning $120K+. He wants to break into the property market but can't figure out whether to push for promotion, switch companies, or change fields entirely.",
+        "pain_points": [
+            "Can't compare earning potential across different moves",
+            "Doesn't know which skills would boost his salary most",
+            "No clear data on what top performers did differently",
+            "Making decisions based on guesswork and LinkedIn posts"
+        ],
+        "how_we_help": "Skills Lab shows Darius exactly which of his current skills are undervalued in his role but command premiums in adjacent fields. Careers lets him compare salary ceilings across paths. Pathways identifies the fastest credential to close his income gap. Sessions creates a mentor brief so he can get targeted advice from senior colleagues.",
+        "outcome": "From guessing to data-driven career moves",
+        "stats": ["Property prices are 8x average income", "Right skills can add $20K+ to salary", "Strategic moves double income growth rate"]
+    },
+    {
+        "id": "rachel",
+        "name": "Rachel",
+        "archetype": "The Career Pivoter",
+        "age": "36-44",
+        "stage": "Mid-Career (12-18 years)",
+        "problem": "Wants to change careers without starting over",
+        "story": "Rachel is a Marketing Director who's ready for a change. She has valuable skills but doesn't know which industries would value them or how to transition without a huge pay cut.",
+        "pain_points": [
+            "Doesn't know where her skills transfer to",
+            "Worried about taking a pay cut to switch",
+            "Can't find realistic transition paths",
+            "Every option seems to require starting from scratch"
+        ],
+        "how_we_help": "Skills Lab maps Rachel's 15 years of experience into transferable skills and shows which industries pay more for them. Careers reveals roles she'd never considered where her skills are in demand. Pathways shows bridge credentials that legitimise her pivot without a full degree. Sessions prepares her for informational interviews with a clear story of her value.",
+        "outcome": "From stuck to seeing a clear path forward",
+        "stats": ["Average career changer is 39", "73% of skills transfer across industries", "Targeted pivots maintain 85% of income"]
+    },
+    {
+        "id": "emmanuel",
+        "name": "Emmanuel",
+        "archetype": "The New Australian",
+        "age": "28-34",
+        "stage": "Skilled Professional (5-10 years)",
+        "problem": "Overseas experience not recognised properly",
+        "story": "Emmanuel moved to Australia with an accounting degree and experience, but earns 40% less than local peers. He's unsure whether to keep climbing in accounting or pivot to a higher-growth field.",
+        "pain_points": [
+            "Australian employers undervalue his overseas experience",
+            "Doesn't know which local qualifications are worth getting",
+            "Can't tell if pivoting to tech would pay off",
+            "Limited network to get insider career advice"
+        ],
+        "how_we_help": "Skills Lab quantifies Emmanuel's transferable skills and identifies roles where international experience is actually valued more. Careers shows him fields with the fastest salary catch-up for migrants. Pathways ranks Australian certifications by their actual impact on earnings. Sessions creates a networking brief he can share with professional mentors to get strategic introductions.",
+        "outcome": "From undervalued to strategically positioned",
+        "stats": ["Migrants earn 25% less on average", "Right certifications close the gap by 60%", "17% of business owners are migrants"]
+    },
+]
+
+# About page - what makes us different
+ABOUT_DIFF_ITEMS = [
+    ("1", "Enterprise-grade data.", "We integrate verified labor market data covering 1,016 occupations with 62,580 skill ratings, wage data from 800+ occupations, hiring records updated monthly, and educational outcomes by institution. No surveys. No self-reported data. The same verified information used by Fortune 500 companies and research institutions."),
+    ("2", "Skill-level ROI.", "Everyone can tell you a CS degree has good ROI. We calculate the wage premium for individual skills: Python adds approximately $22,000 annually, project management adds $16,000, machine learning adds $35,000. You see exactly what to learn and what it's worth."),
+    ("3", "Research-backed methodology.", "Our matching uses hedonic wage regression (the same method labor economists use), causal inference for estimating treatment effects of career moves, and conformal prediction for honest uncertainty quantification. This isn't a personality quiz - it's the same quantitative rigor found in peer-reviewed academic research."),
+    ("4", "Transparent algorithms.", "Every recommendation includes explanations showing exactly why. No black boxes. If you want to see the math, you can. If you want to audit the logic, you can. We believe career decisions are too important for 'trust us.'"),
+    ("5", "A community that gets it.", "Career transitions are hard. You're not just navigating job markets - you're navigating identity, family expectations, financial constraints, and fear of the unknown. Our community connects you with others at every stage, from students to seasoned reinventors, sharing real stories and real accountability."),
+    ("6", "Longitudinal tracking.", "Your profile persists and evolves. As you build skills, as markets shift, as your priorities change - your recommendations update. Version control lets you see how your trajectory evolves over time."),
+]
+
+ABOUT_DATA_SOURCES = [
+    ("Occupations", "1,016 careers", "62,580 skill ratings"),
+    ("Wages", "Salary data", "800+ occupations"),
+    ("Hiring", "Job openings", "Monthly updates"),
+    ("Education", "Graduate outcomes", "By institution"),
+]
+
+ABOUT_INTRO = "Most career advice is based on opinions, anecdotes, and gut feelings. We built CareerCraft because we believed career decisions deserve the same rigor as financial or medical decisions - grounded in data, transparent in methodology, and honest about uncertainty."
+
+ABOUT_COMMUNITY = "Career change is personal, but you don't have to do it alone. Our community connects students figuring out their first path, early-career professionals optimizing for growth, mid-career pivoters rediscovering purpose, and skilled immigrants navigating new markets. Share your wins, find accountability partners, get advice from people who've been where you are."
+
+ABOUT_TEAM = "CareerCraft is built by JN Advisory Group. We're a small team obsessed with bringing quantitative rigor to decisions that have historically been made on intuition. We believe everyone deserves access to the same quality of career intelligence that elite universities and top consulting firms provide to a select few."
+
+# Distinct answer codes whose results HTML is kept (out of 5**7 possible)
+RESULTS_CACHE_SIZE = 2048
+
+CONTENT_VERSION = hashlib.sha256(json.dumps(
+    [PERSONAS, ABOUT_DIFF_ITEMS, ABOUT_DATA_SOURCES, ABOUT_INTRO, ABOUT_COMMUNITY, ABOUT_TEAM]
+).encode("utf-8")).hexdigest()[:12]
+
+# =============================================================================
+# FRAGMENTS
+# =============================================================================
+
+def persona_fragments(idx):
+    """(progress dots, persona body) HTML for PERSONAS[idx]."""
+    return tpl.cached(("persona", CONTENT_VERSION, idx), lambda: _build_persona(idx))
+
+def _build_persona(idx):
+    persona = PERSONAS[idx]
+    dots = tpl.DOT.fill_each({"active": "active" if i == idx else ""} for i in range(len(PERSONAS)))
+    body = tpl.PERSONA.fill(
+        name=persona["name"],
+        archetype=persona["archetype"],
+        stage=persona["stage"],
+        age=persona["age"],
+        problem=persona["problem"],
+        story=persona["story"],
+        pain_points=tpl.PAIN_POINT.fill_each({"point": point} for point in persona["pain_points"]),
+        how_we_help=persona["how_we_help"],
+        outcome=persona["outcome"],
+        stats=tpl.STAT.fill_each({"stat": stat} for stat in persona["stats"]),
+    )
+    return tpl.DOTS.fill(dots=dots), body
+
+def about_fragments():
+    """The About page sections above the call to action, in order."""
+    return tpl.cached(("about", CONTENT_VERSION), _build_about)
+
+def _build_about():
+    items = tpl.PITCH_ITEM.fill_each({"num": num, "title": title, "desc": desc} for num, title, desc in ABOUT_DIFF_ITEMS)
+    cards = tpl.DATA_CARD.fill_each(
+        {"value": value, "line1": line1, "line2": line2} for value, line1, line2 in ABOUT_DATA_SOURCES
+    )
+    data_body = tpl.Markup(tpl.ABOUT_BODY.fill(text="Every number in CareerCraft comes from a verified source:") + tpl.DATA_GRID.fill(cards=cards))
+    return (
+        tpl.SECTION_HEADER.fill(title="About CareerCraft", subtitle="Career intelligence, not career guessing"),
+        tpl.ABOUT_BODY.fill(text=ABOUT_INTRO),
+        tpl.CARD.fill(title="What makes us different", body=items),
+        tpl.CARD.fill(title="Our data", body=data_body),
+        tpl.COMMUNITY_CARD.fill(title="Join the community", body=ABOUT_COMMUNITY),
+        tpl.CARD.fill(title="The team", body=tpl.ABOUT_BODY.fill(text=ABOUT_TEAM)),
+    )
+
+def results_fragments(answers):
+    """Rendered results for an answer set: a dict with strengths, gaps,
+    top_career and the header, strengths, gaps, matches and roadmap HTML."""
+    code = encode_answers(answers)
+    if code is None:
+        return _build_results(answers)
+    return _results_for_code(code)
+
+@functools.lru_cache(maxsize=RESULTS_CACHE_SIZE)
+def _results_for_code(code):
+    return _build_results(decode_answers(code))
+
+def _build_results(answers):
+    matches = calculate_career_matches(answers)
+    strengths, gaps = get_strengths_and_gaps(answers)
+    top_career = matches[0]["career"]["title"]
+    directions = tpl.DIRECTION_CARD.fill_each(
+        {
+            "variant": variant,
+            "kind": kind,
+            "title": match["career"]["title"],
+            "range": match["career"]["range"],
+            "subtitle": match["career"]["subtitle"],
+            "match": match["match"],
+        }
+        for match, variant, kind in [
+            (matches[0], "direction-primary", "Best match"),
+            (matches[1], "direction-secondary", "Strong fit"),
+            (matches[2], "direction-tertiary", "Consider"),
+        ]
+    )
+    return {
+        "strengths": strengths,
+        "gaps": gaps,
+        "top_career": top_career,
+        "header": tpl.SECTION_HEADER.fill(title="Your Results", subtitle="Based on your 7 answers"),
+        "strengths_card": tpl.PILL_CARD.fill(
+            label="Your Strengths",
+            pills=tpl.PILL.fill_each({"variant": "pill-green", "label": s} for s in strengths),
+        ),
+        "gaps_card": tpl.PILL_CARD.fill(
+            label="Growth Areas",
+            pills=tpl.PILL.fill_each({"variant": "pill-amber", "label": s} for s in gaps),
+        ),
+        "matches": tpl.MATCHES_CARD.fill(directions=directions),
+        "roadmap": tpl.ROADMAP.fill(career=top_career),
+    }
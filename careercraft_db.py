@@ -0,0 +1,71 @@
+"""
+CareerCraft – SQLite plumbing
+Shared by the session store, accounts and profile history: per-thread
+connections to a WAL-mode file, a background thread that commits queued
+writes in batches, and the locked process-wide instance behind each get_*().
+"""
+
+import atexit
+import functools
+import logging
+import sqlite3
+import threading
+
+log = logging.getLogger("careercraft.db")
+
+class SQLiteFile:
+    """One connection per thread to a SQLite file; sqlite3 connections can't be shared across threads."""
+
+    def __init__(self, path, **connect_args):
+        self.path = path
+        self._connect_args = connect_args
+        self._local = threading.local()
+        self.connection().execute("PRAGMA journal_mode=WAL")
+
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=10, **self._connect_args)
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+class WriteBehind:
+    """Calls flush() on a daemon thread every interval seconds, or sooner after wake().
+
+    A failed round is logged and the next one retries, so flush() should
+    requeue what it could not write. flush() runs once more at exit.
+    """
+
+    def __init__(self, name, flush, interval, periodic=None):
+        self.name = name
+        self.interval = interval
+        self._flush = flush
+        self._periodic = periodic or flush
+        self._wake = threading.Event()
+        threading.Thread(target=self._run, name=name, daemon=True).start()
+        atexit.register(flush)
+
+    def wake(self):
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self._periodic()
+            except Exception:
+                log.exception("%s flush failed", self.name)
+
+def process_wide(factory):
+    """get_*() for one instance per process, built by factory(...) on the first call."""
+    lock = threading.Lock()
+    instance = []
+
+    @functools.wraps(factory)
+    def get(*args, **kwargs):
+        with lock:
+            if not instance:
+                instance.append(factory(*args, **kwargs))
+            return instance[0]
+    return get
@@ -0,0 +1,194 @@
+"""
+CareerCraft – matching engine
+Questionnaire data, career catalogue and scoring, with no Streamlit dependency
+so offline jobs can share them with the app.
+"""
+
+# =============================================================================
+# DATA
+# =============================================================================
+
+QUESTIONS = [
+    {
+        "id": "technical",
+        "question": "How comfortable are you with data, spreadsheets, and technical tools?",
+        "dimension": "Technical aptitude",
+        "low_label": "I prefer to avoid them",
+        "high_label": "I work with them daily",
+    },
+    {
+        "id": "people_energy",
+        "question": "How energized are you after a day of meetings and collaboration versus deep solo work?",
+        "dimension": "Social energy",
+        "low_label": "Solo work energizes me",
+        "high_label": "Collaboration energizes me",
+    },
+    {
+        "id": "people_style",
+        "question": "When working with others, do you prefer supporting the team or taking the lead?",
+        "dimension": "Interaction style",
+        "low_label": "I prefer supporting",
+        "high_label": "I naturally lead",
+    },
+    {
+        "id": "analysis",
+        "question": "When making decisions, do you rely more on data or intuition?",
+        "dimension": "Decision-making",
+        "low_label": "Intuition and experience",
+        "high_label": "Data and analysis",
+    },
+    {
+        "id": "structure",
+        "question": "Do you prefer clear processes and plans or figuring things out as you go?",
+        "dimension": "Work structure",
+        "low_label": "Flexible and adaptive",
+        "high_label": "Structured and planned",
+    },
+    {
+        "id": "learning",
+        "question": "How quickly do you typically pick up new skills and domains?",
+        "dimension": "Learning velocity",
+        "low_label": "I take my time to master",
+        "high_label": "I learn very quickly",
+    },
+    {
+        "id": "client_facing",
+        "question": "How much do you enjoy working directly with clients or external stakeholders?",
+        "dimension": "External orientation",
+        "low_label": "Prefer internal work",
+        "high_label": "Love client interaction",
+    },
+]
+
+ANSWER_OPTIONS = [
+    {"label": "1", "value": 20},
+    {"label": "2", "value": 40},
+    {"label": "3", "value": 60},
+    {"label": "4", "value": 80},
+    {"label": "5", "value": 95},
+]
+
+ANSWER_VALUES = [option["value"] for option in ANSWER_OPTIONS]
+
+CAREERS = [
+    {
+        "id": "pm", "title": "Product Manager", "subtitle": "Shape what gets built", 
+        "range": "$95k-$180k", "median": 137000,
+        "fit": {"technical": 60, "people_energy": 80, "people_style": 75, "analysis": 70, "structure": 60, "learning": 80, "client_facing": 70},
+    },
+    {
+        "id": "dev", "title": "Software Developer", "subtitle": "Build and create",
+        "range": "$80k-$200k", "median": 132000,
+        "fit": {"technical": 95, "people_energy": 40, "people_style": 45, "analysis": 80, "structure": 70, "learning": 90, "client_facing": 30},
+    },
+    {
+        "id": "data", "title": "Data Analyst", "subtitle": "Find insights in numbers",
+        "range": "$65k-$130k", "median": 86000,
+        "fit": {"technical": 85, "people_energy": 45, "people_style": 40, "analysis": 95, "structure": 80, "learning": 70, "client_facing": 50},
+    },
+    {
+        "id": "ux", "title": "UX Designer", "subtitle": "Design for humans",
+        "range": "$70k-$150k", "median": 98000,
+        "fit": {"technical": 50, "people_energy": 70, "people_style": 55, "analysis": 60, "structure": 50, "learning": 80, "client_facing": 75},
+    },
+    {
+        "id": "marketing", "title": "Marketing Manager", "subtitle": "Tell compelling stories",
+        "range": "$75k-$160k", "median": 140000,
+        "fit": {"technical": 40, "people_energy": 85, "people_style": 70, "analysis": 50, "structure": 50, "learning": 70, "client_facing": 85},
+    },
+    {
+        "id": "consultant", "title": "Consultant", "subtitle": "Solve business problems",
+        "range": "$80k-$170k", "median": 99000,
+        "fit": {"technical": 60, "people_energy": 80, "people_style": 75, "analysis": 75, "structure": 70, "learning": 90, "client_facing": 95},
+    },
+    {
+        "id": "analyst", "title": "Business Analyst", "subtitle": "Bridge tech and business",
+        "range": "$70k-$130k", "median": 95000,
+        "fit": {"technical": 70, "people_energy": 65, "people_style": 50, "analysis": 85, "structure": 75, "learning": 75, "client_facing": 60},
+    },
+    {
+        "id": "manager", "title": "People Manager", "subtitle": "Lead and develop teams",
+        "range": "$90k-$170k", "median": 120000,
+        "fit": {"technical": 45, "people_energy": 90, "people_style": 95, "analysis": 55, "structure": 70, "learning": 65, "client_facing": 60},
+    },
+]
+
+# =============================================================================
+# SCORING
+# =============================================================================
+
+def calculate_career_matches(answers):
+    matches = []
+    for career in CAREERS:
+        total_diff = 0
+        for q in QUESTIONS:
+            user_val = answers.get(q["id"], 50)
+            career_val = career["fit"].get(q["id"], 50)
+            total_diff += abs(user_val - career_val)
+        max_diff = len(QUESTIONS) * 80
+        match_pct = max(0, 100 - int((total_diff / max_diff) * 100))
+        matches.append({"career": career, "match": match_pct})
+    return sorted(matches, key=lambda x: x["match"], reverse=True)
+
+def get_strengths_and_gaps(answers):
+    if not answers:
+        return ["Problem solving", "Communication"], ["Technical skills"]
+    dimension_names = {
+        "technical": "Technical skills",
+        "people_energy": "Collaboration",
+        "people_style": "Leadership",
+        "analysis": "Analytical thinking",
+        "structure": "Organization",
+        "learning": "Learning agility",
+        "client_facing": "Client relations",
+    }
+    sorted_answers = sorted(answers.items(), key=lambda x: x[1], reverse=True)
+    strengths = [dimension_names.get(k, k) for k, v in sorted_answers[:2] if v >= 60]
+    gaps = [dimension_names.get(k, k) for k, v in sorted_answers if v <= 40][:2]
+    if not strengths:
+        strengths = [dimension_names.get(sorted_answers[0][0], "Problem solving")]
+    if not gaps:
+        gaps = [dimension_names.get(sorted_answers[-1][0], "Growth area")]
+    return strengths, gaps
+
+def build_coach_context(strengths, gaps, top_career):
+    return f"Strengths: {', '.join(strengths)}. Growth areas: {', '.join(gaps)}. Exploring: {top_career}."
+
+# =============================================================================
+# ANSWER CODES
+# =============================================================================
+
+# A complete answer set is one of 5**7 combinations: packed as a base-5 number
+# and written in base 36 it fits in 4 characters, short enough for a URL.
+ANSWER_CODE_LENGTH = 4
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+def encode_answers(answers):
+    """Short code for a complete answer set, or None if any answer is missing."""
+    number = 0
+    for q in reversed(QUESTIONS):
+        value = answers.get(q["id"])
+        if value not in ANSWER_VALUES:
+            return None
+        number = number * len(ANSWER_VALUES) + ANSWER_VALUES.index(value)
+    code = ""
+    while number:
+        number, digit = divmod(number, len(_DIGITS))
+        code = _DIGITS[digit] + code
+    return code.rjust(ANSWER_CODE_LENGTH, "0")
+
+def decode_answers(code):
+    """Answers dict (in question order) for a code, or None if it isn't valid."""
+    if not isinstance(code, str) or len(code) != ANSWER_CODE_LENGTH or not code.isalnum():
+        return None
+    try:
+        number = int(code, len(_DIGITS))
+    except ValueError:
+        return None
+    if number < 0 or number >= len(ANSWER_VALUES) ** len(QUESTIONS):
+        return None
+    answers = {}
+    for q in QUESTIONS:
+        number, index = divmod(number, len(ANSWER_VALUES))
+        answers[q["id"]] = ANSWER_VALUES[index]
+    return answers
@@ -0,0 +1,105 @@
+"""
+CareerCraft – interaction events
+Questionnaire and coach events for funnel analytics. emit() only appends a
+tuple to an in-memory ring buffer under a short lock, so the rerun path pays
+about a microsecond per event; a background thread drains the buffer every second
+and appends the batch as JSON lines to a per-process file with size-based
+rotation. If the flusher falls behind, the oldest events are overwritten
+and counted as dropped.
+"""
+
+import atexit
+import collections
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+
+import careercraft_telemetry
+
+BUFFER_SIZE = 65536
+FLUSH_INTERVAL = 1.0
+
+# Ring buffer of (unix time, name, session id, fields), plus the number of
+# events it has overwritten; _lock guards both. flush() swaps in an empty
+# buffer rather than draining under the lock, so emit() never waits on a
+# write. Until the pipeline starts it holds nothing, so events cost no memory.
+_buffer = collections.deque(maxlen=0)
+_overwritten = 0
+_lock = threading.Lock()
+_started = False
+
+WRITTEN = careercraft_telemetry.Counter("careercraft_events_written_total", "Interaction events written to disk")
+DROPPED = careercraft_telemetry.Counter(
+    "careercraft_events_dropped_total", "Interaction events overwritten before the flusher reached them"
+)
+careercraft_telemetry.METRICS.extend([WRITTEN, DROPPED])
+
+def emit(name, sid=None, **fields):
+    """Record an event; safe to call from any script thread or callback."""
+    global _overwritten
+    event = (time.time(), name, sid, fields)
+    with _lock:
+        # A full buffer drops its oldest event on append; count it as it happens
+        if _buffer.maxlen and len(_buffer) == _buffer.maxlen:
+            _overwritten += 1
+        _buffer.append(event)
+
+# =============================================================================
+# FLUSHING
+# =============================================================================
+
+def drain():
+    """Take everything buffered; returns (events oldest first, overwritten since last drain)."""
+    global _buffer, _overwritten
+    with _lock:
+        events, dropped = _buffer, _overwritten
+        _buffer, _overwritten = collections.deque(maxlen=events.maxlen), 0
+    return events, dropped
+
+def to_json(event):
+    ts, name, sid, fields = event
+    return json.dumps({"ts": round(ts, 3), "event": name, "sid": sid, **fields}, separators=(",", ":"))
+
+def flush(logger):
+    """Write whatever is buffered as one batch; returns the number written."""
+    events, dropped = drain()
+    if dropped:
+        DROPPED.inc((), dropped)
+    if events:
+        # One record per batch: a single write and rotation check
+        logger.info("\n".join(to_json(event) for event in events))
+        WRITTEN.inc((), len(events))
+    return len(events)
+
+def _flush_forever(logger, interval):
+    while True:
+        time.sleep(interval)
+        try:
+            flush(logger)
+        except Exception:
+            logging.getLogger("careercraft").exception("event flush failed")
+
+def start_pipeline(directory="events", interval=FLUSH_INTERVAL, max_bytes=20_000_000, backups=10):
+    """Start the flusher once per process; directory=None or "" disables it.
+
+    Each worker writes its own events-<pid>.jsonl, since several processes
+    rotating one file would clobber each other.
+    """
+    global _buffer, _started
+    with _lock:
+        if _started or not directory:
+            return
+        _started = True
+        _buffer = collections.deque(maxlen=BUFFER_SIZE)
+    os.makedirs(directory, exist_ok=True)
+    logger = logging.getLogger("careercraft.events")
+    logger.propagate = False
+    logger.addHandler(logging.handlers.RotatingFileHandler(
+        os.path.join(directory, f"events-{os.getpid()}.jsonl"), maxBytes=int(max_bytes), backupCount=int(backups),
+    ))
+    logger.setLevel(logging.INFO)
+    threading.Thread(target=_flush_forever, args=(logger, float(interval)), name="events-flush", daemon=True).start()
+    atexit.register(flush, logger)
@@ -0,0 +1,207 @@
+"""
+CareerCraft – self-hosted web fonts
+Build step that subsets Fraunces and DM Sans to the glyphs the app can show and
+writes WOFF2 files to static/fonts/ plus the matching @font-face rules to
+assets/fonts.css. The stylesheet build picks those up, so the app renders
+without any external round trip. Running it is a required setup and deploy
+step: without assets/fonts.css the app stops with FontsUnavailable rather
+than quietly loading Google Fonts (FONT_CDN_FALLBACK=1 allows that).
+
+Source fonts (OFL, from github.com/google/fonts) go in assets/fonts/src/.
+Needs fonttools and brotli at build time only:
+
+    pip install fonttools brotli
+    python careercraft_fonts.py          # rebuild if the font list or glyphs changed
+    python careercraft_fonts.py --check  # exit 1 if the built fonts are stale
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(ROOT, "assets", "fonts", "src")
+OUTPUT_DIR = os.path.join(ROOT, "static", "fonts")
+FONTS_CSS = os.path.join(ROOT, "assets", "fonts.css")
+MANIFEST = os.path.join(ROOT, "assets", "fonts", "manifest.json")
+STYLESHEET = os.path.join(ROOT, "assets", "careercraft.css")
+# Every file holding copy the app renders, including CSS content: glyphs
+TEXT_SOURCES = [
+    "careercraft_appV7.py",
+    "careercraft_engine.py",
+    "careercraft_coach.py",
+    "careercraft_content.py",
+    "careercraft_templates.py",
+    os.path.join("assets", "careercraft.css"),
+]
+
+# One entry per @font-face. axes pins or narrows variable-font axes to what
+# the stylesheet uses; preload marks the faces needed for first paint.
+FONT_FACES = [
+    {
+        "family": "Fraunces", "style": "normal", "weight": "400 700", "preload": True,
+        "source": "Fraunces[SOFT,WONK,opsz,wght].ttf",
+        "axes": {"wght": (400, 700), "SOFT": 0, "WONK": 0},
+    },
+    {
+        "family": "Fraunces", "style": "italic", "weight": "400", "preload": False,
+        "source": "Fraunces-Italic[SOFT,WONK,opsz,wght].ttf",
+        "axes": {"wght": 400, "SOFT": 0, "WONK": 0},
+    },
+    {
+        "family": "DM Sans", "style": "normal", "weight": "400 600", "preload": True,
+        "source": "DMSans[opsz,wght].ttf",
+        "axes": {"wght": (400, 600)},
+    },
+]
+
+# Coach answers are free text, so keep all of Latin-1 and common punctuation
+# on top of whatever the app's own copy uses.
+BASE_RANGES = [(0x20, 0x7E), (0xA0, 0xFF), (0x2010, 0x2027), (0x2030, 0x203A), (0x20AC, 0x20AC)]
+
+# =============================================================================
+# INPUTS
+# =============================================================================
+
+def stylesheet_families(path=STYLESHEET):
+    """Quoted font families the stylesheet asks for, e.g. {'DM Sans', 'Fraunces'}."""
+    with open(path, encoding="utf-8") as f:
+        css = f.read()
+    families = set()
+    for value in re.findall(r"font-family\s*:\s*([^;}]+)", css):
+        for single, double in re.findall(r"'([^']+)'|\"([^\"]+)\"", value):
+            families.add(single or double)
+    return families
+
+def glyph_text():
+    codepoints = set()
+    for start, end in BASE_RANGES:
+        codepoints.update(range(start, end + 1))
+    for name in TEXT_SOURCES:
+        path = os.path.join(ROOT, name)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                codepoints.update(ord(ch) for ch in f.read() if ord(ch) >= 0x20)
+    return "".join(chr(cp) for cp in sorted(codepoints))
+
+def build_signature(families, text):
+    digest = hashlib.sha256()
+    digest.update(json.dumps(sorted(families)).encode())
+    digest.update(json.dumps(FONT_FACES, sort_keys=True).encode())
+    digest.update(text.encode("utf-8"))
+    for face in FONT_FACES:
+        path = os.path.join(SOURCE_DIR, face["source"])
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+def load_manifest():
+    try:
+        with open(MANIFEST, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def subset_face(face, text):
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+
+    font = TTFont(os.path.join(SOURCE_DIR, face["source"]))
+    if "fvar" in font:
+        font = instancer.instantiateVariableFont(font, face["axes"])
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["kern", "liga", "calt", "locl", "mark", "mkmk"]
+    options.name_IDs = [1, 2]
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+
+    slug = face["family"].lower().replace(" ", "-") + ("-italic" if face["style"] == "italic" else "")
+    tmp = os.path.join(OUTPUT_DIR, f"{slug}.tmp.woff2")
+    subset.save_font(font, tmp, options)
+    with open(tmp, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:12]
+    filename = f"{slug}.{digest}.woff2"
+    os.replace(tmp, os.path.join(OUTPUT_DIR, filename))
+    return filename
+
+def font_face_css(face, filename):
+    # The stylesheet is served from app/static/, so fonts resolve relative to it
+    return (
+        "@font-face {\n"
+        f"    font-family: '{face['family']}';\n"
+        f"    font-style: {face['style']};\n"
+        f"    font-weight: {face['weight']};\n"
+        "    font-display: swap;\n"
+        f"    src: url('fonts/{filename}') format('woff2');\n"
+        "}\n"
+    )
+
+def build(force=False):
+    families = stylesheet_families()
+    missing = families - {face["family"] for face in FONT_FACES}
+    if missing:
+        raise SystemExit(f"No FONT_FACES entry for {', '.join(sorted(missing))}; add one with its source file")
+    text = glyph_text()
+    signature = build_signature(families, text)
+    manifest = load_manifest()
+    if not force and manifest.get("signature") == signature:
+        print("fonts up to date", file=sys.stderr)
+        return manifest
+
+    sources = [os.path.join(SOURCE_DIR, face["source"]) for face in FONT_FACES]
+    absent = [path for path in sources if not os.path.exists(path)]
+    if absent:
+        raise SystemExit("Missing source fonts:\n  " + "\n  ".join(absent))
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    old_files = {entry["file"] for entry in manifest.get("faces", [])}
+    faces = []
+    css = ["/* Generated by careercraft_fonts.py – do not edit */\n"]
+    for face in FONT_FACES:
+        filename = subset_face(face, text)
+        size = os.path.getsize(os.path.join(OUTPUT_DIR, filename))
+        print(f"{face['family']} {face['style']}: {filename} ({size} bytes)", file=sys.stderr)
+        faces.append({"family": face["family"], "style": face["style"], "file": filename, "preload": face["preload"]})
+        css.append(font_face_css(face, filename))
+    for stale in old_files - {entry["file"] for entry in faces}:
+        try:
+            os.remove(os.path.join(OUTPUT_DIR, stale))
+        except OSError:
+            pass
+
+    with open(FONTS_CSS, "w", encoding="utf-8") as f:
+        f.write("\n".join(css))
+    manifest = {"signature": signature, "faces": faces}
+    os.makedirs(os.path.dirname(MANIFEST), exist_ok=True)
+    with open(MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    return manifest
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Subset and self-host the app's web fonts.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the built fonts are stale")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if nothing changed")
+    args = parser.parse_args(argv)
+    if args.check:
+        current = build_signature(stylesheet_families(), glyph_text())
+        stale = load_manifest().get("signature") != current
+        print("fonts stale, run python careercraft_fonts.py" if stale else "fonts up to date", file=sys.stderr)
+        return 1 if stale else 0
+    build(force=args.force)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""
+CareerCraft – profile history
+Every questionnaire an account completes, kept as a compact snapshot: one
+byte per answer, then (career, match %) byte pairs for the top matches,
+tagged with the data version that produced them. Snapshots are stored as
+deltas against the previous one, with a full keyframe every few entries so a
+time-range query reads at most KEYFRAME_EVERY - 1 rows before its start.
+Snapshots taken from the app are queued and written by a background thread,
+so finishing the questionnaire never waits on the database.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import careercraft_db
+from careercraft_engine import ANSWER_VALUES, CAREERS, QUESTIONS, calculate_career_matches
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles.db")
+TOP_K = 3
+KEYFRAME_EVERY = 16
+FLUSH_INTERVAL = 0.5
+
+# Changes whenever the questions or career catalogue do; a new version always
+# starts with a keyframe and carries its own career list for decoding
+DATA_VERSION = hashlib.sha256(json.dumps([QUESTIONS, CAREERS]).encode("utf-8")).hexdigest()[:12]
+
+_CAREER_INDEX = {career["id"]: i for i, career in enumerate(CAREERS)}
+WIDTH = len(QUESTIONS) + 2 * TOP_K
+_MASK_BYTES = (WIDTH + 7) // 8
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def pack(answers):
+    """Snapshot bytes for an answer dict: answers, then the top TOP_K matches."""
+    out = bytearray(ANSWER_VALUES.index(answers[q["id"]]) + 1 if q["id"] in answers else 0 for q in QUESTIONS)
+    for match in calculate_career_matches(answers)[:TOP_K]:
+        out += bytes((_CAREER_INDEX[match["career"]["id"]], match["match"]))
+    return bytes(out)
+
+def unpack(data, careers):
+    """(answers, [(career id, match %), ...]) from snapshot bytes and its version's career ids."""
+    answers = {q["id"]: ANSWER_VALUES[b - 1] for q, b in zip(QUESTIONS, data) if b}
+    tail = data[len(QUESTIONS):]
+    return answers, [(careers[tail[i]], tail[i + 1]) for i in range(0, len(tail), 2)]
+
+def delta(previous, current):
+    """Bitmask of the bytes that changed, followed by their new values."""
+    mask, changed = 0, bytearray()
+    for i, (old, new) in enumerate(zip(previous, current)):
+        if old != new:
+            mask |= 1 << i
+            changed.append(new)
+    return mask.to_bytes(_MASK_BYTES, "little") + bytes(changed)
+
+def apply_delta(previous, data):
+    mask = int.from_bytes(data[:_MASK_BYTES], "little")
+    out, changed = bytearray(previous), iter(data[_MASK_BYTES:])
+    for i in range(len(out)):
+        if mask >> i & 1:
+            out[i] = next(changed)
+    return bytes(out)
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class ProfileHistory:
+    """Snapshots per account in a WAL-mode SQLite file shared by every worker."""
+
+    def __init__(self, path=DEFAULT_PATH, keyframe_every=KEYFRAME_EVERY, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.keyframe_every = keyframe_every
+        self._lock = threading.Lock()
+        self._pending = []   # (account, snapshot bytes, taken) waiting for the flusher
+        self._versions = {}
+        self._career_ids = {}
+        self._db = careercraft_db.SQLiteFile(path, isolation_level=None)
+        conn = self._db.connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS versions "
+            "(id INTEGER PRIMARY KEY, version TEXT NOT NULL UNIQUE, careers TEXT NOT NULL)"
+        )
+        # seq counts up per account; taken is indexed for time-range queries
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots (account TEXT NOT NULL, seq INTEGER NOT NULL, "
+            "taken REAL NOT NULL, version INTEGER NOT NULL, keyframe INTEGER NOT NULL, data BLOB NOT NULL, "
+            "PRIMARY KEY (account, seq)) WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS snapshots_taken ON snapshots (account, taken)")
+        self._writer = careercraft_db.WriteBehind("profile-history", self.flush, flush_interval)
+
+    def _version_id(self, conn, version=DATA_VERSION):
+        if version not in self._versions:
+            conn.execute(
+                "INSERT OR IGNORE INTO versions (version, careers) VALUES (?, ?)",
+                (version, json.dumps([career["id"] for career in CAREERS])),
+            )
+            self._versions[version] = conn.execute(
+                "SELECT id FROM versions WHERE version = ?", (version,)
+            ).fetchone()[0]
+        return self._versions[version]
+
+    def _careers(self, conn, version_id):
+        if version_id not in self._career_ids:
+            row = conn.execute("SELECT careers FROM versions WHERE id = ?", (version_id,)).fetchone()
+            self._career_ids[version_id] = json.loads(row[0])
+        return self._career_ids[version_id]
+
+    def _replay(self, rows):
+        """Full snapshot bytes for rows that start at a keyframe."""
+        current = None
+        for seq, taken, version, keyframe, data in rows:
+            current = data if keyframe else apply_delta(current, data)
+            yield seq, taken, version, current
+
+    def _keyframe(self, conn, account, before_seq=None):
+        """seq of the last keyframe at or before before_seq (default: the latest)."""
+        bound = "AND seq <= ?" if before_seq is not None else ""
+        params = (account,) + ((before_seq,) if before_seq is not None else ())
+        row = conn.execute(
+            f"SELECT MAX(seq) FROM snapshots WHERE account = ? AND keyframe = 1 {bound}", params
+        ).fetchone()
+        return row[0]
+
+    def _append(self, conn, account, current, taken):
+        """Insert one snapshot inside the caller's transaction; returns its seq."""
+        version = self._version_id(conn)
+        last = conn.execute(
+            "SELECT seq, version FROM snapshots WHERE account = ? ORDER BY seq DESC LIMIT 1", (account,)
+        ).fetchone()
+        if last is None:
+            seq, keyframe = 0, True
+        else:
+            seq = last[0] + 1
+            keyframe = last[1] != version or seq % self.keyframe_every == 0
+        if keyframe:
+            data = current
+        else:
+            rows = conn.execute(
+                "SELECT seq, taken, version, keyframe, data FROM snapshots "
+                "WHERE account = ? AND seq >= ? ORDER BY seq",
+                (account, self._keyframe(conn, account)),
+            ).fetchall()
+            previous = list(self._replay(rows))[-1][3]
+            data = delta(previous, current)
+        conn.execute(
+            "INSERT INTO snapshots (account, seq, taken, version, keyframe, data) VALUES (?, ?, ?, ?, ?, ?)",
+            (account, seq, taken, version, int(keyframe), data),
+        )
+        return seq
+
+    def _write(self, batch):
+        """Append (account, snapshot bytes, taken) rows in one transaction; returns their seqs."""
+        conn = self._db.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            seqs = [self._append(conn, account, current, taken) for account, current, taken in batch]
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            self._versions.clear()
+            raise
+        return seqs
+
+    def record(self, account, answers, now=None):
+        """Append a snapshot of answers and their top matches now; returns its seq."""
+        return self._write([(account, pack(answers), time.time() if now is None else now)])[0]
+
+    def record_later(self, account, answers, now=None):
+        """Queue a snapshot for the background writer; it shows up in queries once flushed."""
+        snapshot = (account, pack(answers), time.time() if now is None else now)
+        with self._lock:
+            self._pending.append(snapshot)
+
+    def flush(self):
+        """Write every queued snapshot in one transaction; returns the number written."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+        try:
+            self._write(batch)
+        except BaseException:
+            # Put them back ahead of anything queued since, and retry next round
+            with self._lock:
+                self._pending = batch + self._pending
+            raise
+        return len(batch)
+
+    def history(self, account, start=None, end=None):
+        """Snapshots taken in [start, end), oldest first, as dicts.
+
+        Only the rows in the range and the run back to the keyframe before it
+        are read, however long the account's history is.
+        """
+        conn = self._db.connection()
+        clauses, params = ["account = ?"], [account]
+        if start is not None:
+            clauses.append("taken >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("taken < ?")
+            params.append(end)
+        first = conn.execute(f"SELECT MIN(seq), MAX(seq) FROM snapshots WHERE {' AND '.join(clauses)}", params).fetchone()
+        if first[0] is None:
+            return []
+        rows = conn.execute(
+            "SELECT seq, taken, version, keyframe, data FROM snapshots "
+            "WHERE account = ? AND seq >= ? AND seq <= ? ORDER BY seq",
+            (account, self._keyframe(conn, account, first[0]), first[1]),
+        ).fetchall()
+        out = []
+        for seq, taken, version, data in self._replay(rows):
+            if seq < first[0]:
+                continue
+            answers, matches = unpack(data, self._careers(conn, version))
+            out.append({"seq": seq, "taken": taken, "answers": answers, "matches": matches})
+        return out
+
+    def latest(self, account):
+        row = self._db.connection().execute("SELECT MAX(taken) FROM snapshots WHERE account = ?", (account,)).fetchone()
+        if row[0] is None:
+            return None
+        return self.history(account, start=row[0])[-1]
+
+    def match_changes(self, account, start=None, end=None):
+        """(taken, top matches) for each snapshot in range whose matches differ from the one before."""
+        changes, previous = [], None
+        for snapshot in self.history(account, start, end):
+            if snapshot["matches"] != previous:
+                changes.append((snapshot["taken"], snapshot["matches"]))
+                previous = snapshot["matches"]
+        return changes
+
+# =============================================================================
+# SELECTION
+# =============================================================================
+
+@careercraft_db.process_wide
+def get_history(path=None):
+    """The process-wide profile history."""
+    return ProfileHistory(path or DEFAULT_PATH)
@@ -0,0 +1,205 @@
+"""
+CareerCraft – landing page media
+Publishes the landing videos under static/media/ with content-hashed names.
+Streamlit's static handler answers Range requests and sends ETag/Last-Modified,
+so the browser can seek, revalidate and reuse them; the hash in the name means
+a new cut never plays from a stale copy. The page embeds a <video> tag with a
+poster instead of pushing the file through st.video on every render.
+
+Optional pre-transcode to a smaller web rendition (needs ffmpeg on PATH):
+
+    python careercraft_media.py --transcode
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+from careercraft_assets import static_serving_enabled
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MEDIA_DIR = os.path.join(ROOT, "static", "media")
+MANIFEST = os.path.join(MEDIA_DIR, "manifest.json")
+STATIC_URL = "app/static/media"
+RECHECK_INTERVAL = 5.0  # seconds between stat() checks of the source videos
+
+# preload: "metadata" for the video under the hero, "none" below the fold so
+# no bytes are fetched until the visitor presses play.
+VIDEOS = {
+    "intro": {"source": "Untitled video (1).mp4", "preload": "metadata"},
+    "results-explained": {"source": "VIDEO 1.mp4", "preload": "none"},
+}
+
+TRANSCODE_ARGS = [
+    "-vf", "scale='min(1280,iw)':-2", "-c:v", "libx264", "-preset", "slow", "-crf", "28",
+    "-c:a", "aac", "-b:a", "96k", "-movflags", "+faststart",
+]
+
+log = logging.getLogger("careercraft.media")
+
+_lock = threading.Lock()
+_manifest = None
+_checked_at = 0.0
+_refreshing = False
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:12]
+
+def _place(src, dest):
+    if os.path.exists(dest):
+        return
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+def _poster(video_path, poster_path):
+    if os.path.exists(poster_path) or not shutil.which("ffmpeg"):
+        return os.path.exists(poster_path)
+    result = subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-ss", "1", "-i", video_path,
+         "-frames:v", "1", "-vf", "scale='min(1280,iw)':-2", "-q:v", "4", poster_path],
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+def _source_signature(slug):
+    """[mtime_ns, size] of a video's source file, or None if it is absent."""
+    try:
+        info = os.stat(os.path.join(ROOT, VIDEOS[slug]["source"]))
+    except OSError:
+        return None
+    return [info.st_mtime_ns, info.st_size]
+
+def _stale(manifest):
+    """True if a source present on disk is missing from the manifest or has changed since it was published."""
+    for slug in VIDEOS:
+        signature = _source_signature(slug)
+        if signature is not None and (manifest.get(slug) or {}).get("source") != signature:
+            return True
+    return False
+
+def _write_manifest(manifest):
+    tmp = f"{MANIFEST}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, MANIFEST)
+
+def publish(transcode=False, write_empty=True):
+    """Place each video (and poster) under static/media/ and write the manifest.
+
+    write_empty=False leaves the manifest on disk alone when no source was found.
+    """
+    os.makedirs(MEDIA_DIR, exist_ok=True)
+    manifest = {}
+    for slug, video in VIDEOS.items():
+        source = os.path.join(ROOT, video["source"])
+        signature = _source_signature(slug)
+        if signature is None:
+            continue
+        if transcode:
+            if not shutil.which("ffmpeg"):
+                raise SystemExit("ffmpeg not found on PATH")
+            tmp = os.path.join(MEDIA_DIR, f"{slug}.transcode.mp4")
+            subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-i", source, *TRANSCODE_ARGS, tmp], check=True)
+            digest = _file_hash(tmp)
+            filename = f"{slug}.{digest}.mp4"
+            os.replace(tmp, os.path.join(MEDIA_DIR, filename))
+        else:
+            digest = _file_hash(source)
+            filename = f"{slug}.{digest}.mp4"
+            _place(source, os.path.join(MEDIA_DIR, filename))
+        poster = f"{slug}.{digest}.jpg"
+        has_poster = _poster(os.path.join(MEDIA_DIR, filename), os.path.join(MEDIA_DIR, poster))
+        manifest[slug] = {
+            "file": filename, "poster": poster if has_poster else None, "version": digest, "source": signature,
+        }
+        print(f"{slug}: {filename} ({os.path.getsize(os.path.join(MEDIA_DIR, filename))} bytes)", file=sys.stderr)
+    if manifest or write_empty:
+        _write_manifest(manifest)
+    return manifest
+
+def _refresh():
+    """Republish off the script thread and swap the result in; one at a time per process."""
+    global _manifest, _refreshing
+    try:
+        manifest = publish(write_empty=False)
+        with _lock:
+            _manifest = manifest
+    except (OSError, subprocess.SubprocessError):
+        log.exception("media publish failed")
+    finally:
+        with _lock:
+            _refreshing = False
+
+def load_manifest(wait=False):
+    """Published media, republished if a source video is new or has changed.
+
+    Sources are stat()ed at most every RECHECK_INTERVAL seconds. A stale or
+    missing manifest is rebuilt on a background thread while the current one
+    keeps being served, so hashing and ffmpeg never run on a script thread;
+    wait=True rebuilds it before returning, for offline callers.
+    """
+    global _manifest, _checked_at, _refreshing
+    with _lock:
+        now = time.monotonic()
+        if not wait and _manifest is not None and now - _checked_at < RECHECK_INTERVAL:
+            return _manifest
+        _checked_at = now
+        if _manifest is None:
+            try:
+                with open(MANIFEST, encoding="utf-8") as f:
+                    _manifest = json.load(f)
+            except (OSError, ValueError):
+                _manifest = {}
+        if not _stale(_manifest) or (_refreshing and not wait):
+            return _manifest
+        if not wait:
+            _refreshing = True
+            threading.Thread(target=_refresh, name="media-publish", daemon=True).start()
+            return _manifest
+    manifest = publish(write_empty=False)
+    with _lock:
+        _manifest = manifest
+        return _manifest
+
+def video_markup(slug, base_url):
+    """<video> markup for a published video served from base_url, or None."""
+    entry = load_manifest().get(slug)
+    if not entry:
+        return None
+    version = entry["version"]
+    poster = f' poster="{base_url}/{entry["poster"]}?v={version}"' if entry.get("poster") else ""
+    return (
+        f'<video class="cc-video" controls playsinline preload="{VIDEOS[slug]["preload"]}"{poster}>'
+        f'<source src="{base_url}/{entry["file"]}?v={version}" type="video/mp4">'
+        "</video>"
+    )
+
+def video_tag(slug):
+    """<video> markup for the app, or None to fall back to st.video."""
+    if not static_serving_enabled():
+        return None
+    return video_markup(slug, STATIC_URL)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Publish landing page videos as static assets.")
+    parser.add_argument("--transcode", action="store_true", help="Re-encode to a smaller web rendition with ffmpeg")
+    args = parser.parse_args(argv)
+    publish(transcode=args.transcode)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""
+CareerCraft – navigation
+The per-session model and every page/step transition, written as on_click
+callbacks. Streamlit runs callbacks before the rerun a click triggers, so a
+click costs one script run instead of a run plus an st.rerun().
+"""
+
+import functools
+import hmac
+import logging
+import secrets
+
+import streamlit as st
+
+from careercraft_config import get_secret
+from careercraft_engine import QUESTIONS, decode_answers, encode_answers
+from careercraft_session import Session
+import careercraft_analytics
+import careercraft_events
+import careercraft_history
+import careercraft_store
+
+log = logging.getLogger("careercraft.nav")
+
+# All app state lives in one careercraft_session.Session under this key
+SESSION_KEY = "careercraft"
+
+# Query parameter carrying the session store key, so a reload or any worker
+# can resume. It is a bearer token for the session, so links meant for other
+# people (share_url()) carry only the ?r= answer code, never the key.
+SESSION_PARAM = "sid"
+
+PAGES = ("home", "about", "usecases")
+
+# Query parameter of a shared results link: the answer code and nothing else
+RESULTS_PARAM = "r"
+
+# Allowed step changes on the home page; go_to() may always reset to landing
+STEP_TRANSITIONS = {
+    "landing": {"questions"},
+    "questions": {"landing", "results"},
+    "results": {"landing"},
+}
+
+def init_state():
+    if SESSION_KEY not in st.session_state:
+        st.session_state[SESSION_KEY] = _resume()
+    state()
+
+def state():
+    """This visitor's Session, reloaded first if idle eviction reset it.
+
+    Widget callbacks run before the script reaches init_state(), so the
+    reload happens here, where every callback gets its session from.
+    """
+    session = st.session_state[SESSION_KEY]
+    if session.evicted:
+        record = session_store().get(session.sid)
+        if record:
+            session.load_record(record)
+    session.touch()
+    return session
+
+def event(name, **fields):
+    """Emit an interaction event tagged with this session's id."""
+    careercraft_events.emit(name, state().sid, **fields)
+
+def save_state():
+    """Write the session to the store; call at the end of every full or fragment run."""
+    session = state()
+    session_store().put(session.sid, session.to_record())
+
+def session_store():
+    return careercraft_store.get_store(get_secret("SESSION_STORE", "memory"), get_secret("SESSION_STORE_PATH"))
+
+def _resume():
+    sid = st.query_params.get(SESSION_PARAM)
+    record = session_store().get(sid, fresh=True) if sid else None
+    if record is None:
+        return _new_session()
+    return Session(sid=sid).load_record(record)
+
+def _new_session():
+    sid = secrets.token_urlsafe(16)
+    st.query_params[SESSION_PARAM] = sid
+    return Session(sid=sid)
+
+def admin_requested():
+    """True when ?admin= carries the ADMIN_TOKEN secret; no token, no admin view."""
+    token = get_secret("ADMIN_TOKEN")
+    given = st.query_params.get("admin")
+    return bool(token and given) and hmac.compare_digest(given.encode("utf-8"), str(token).encode("utf-8"))
+
+def apply_handoff():
+    """Enter the app where a static page's link pointed (?go=start, signup, about...)."""
+    target = st.query_params.get("go")
+    if target is None:
+        return
+    del st.query_params["go"]
+    if target == "start":
+        go_to("home")
+        # Called directly, not clicked: an invalid transition here is a bug
+        start_questionnaire.__wrapped__()
+    elif target == "signup":
+        go_to("home")
+        open_signup()
+    elif target in PAGES:
+        go_to(target)
+
+def apply_permalink():
+    """Open a shared results link: show the results encoded in ?r=, then swap
+    it for this session's ?sid= so a reload resumes the session, coach answer
+    included, rather than rebuilding the results from the code again."""
+    code = st.query_params.get(RESULTS_PARAM)
+    if code is None:
+        return
+    del st.query_params[RESULTS_PARAM]
+    answers = decode_answers(code)
+    if answers is None:
+        return
+    session = state()
+    if session.step == "results" and session.answers == answers:
+        return
+    if session.answers:
+        # Don't overwrite a session that already holds answers; the link gets its own
+        fresh = _new_session()
+        fresh.account_id = session.account_id
+        st.session_state[SESSION_KEY] = session = fresh
+    session.page = "home"
+    session.step = "results"
+    session.answers = answers
+    session.coach_response = None
+
+def share_url():
+    """Link to the current results for other people: the answer code, without ?sid=."""
+    code = encode_answers(state().answers)
+    if not code:
+        return None
+    return f"{st.context.url or ''}?{RESULTS_PARAM}={code}"
+
+class TransitionError(ValueError):
+    """A step change STEP_TRANSITIONS does not allow."""
+
+def _set_step(step):
+    session = state()
+    if step != session.step and step not in STEP_TRANSITIONS[session.step]:
+        raise TransitionError(f"Cannot move from {session.step} to {step}")
+    session.step = step
+
+def _on_click(fn):
+    """For step-changing callbacks: a stale click (say Exit, then See results
+    before the rerun) is logged and ignored instead of showing a traceback.
+    Transitions raise before changing anything, so nothing is half-applied."""
+    @functools.wraps(fn)
+    def callback(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except TransitionError as e:
+            log.info("ignored stale click %s: %s", fn.__name__, e)
+    return callback
+
+# =============================================================================
+# PAGES
+# =============================================================================
+
+def go_to(page, step="landing"):
+    if page not in PAGES:
+        raise ValueError(f"Unknown page: {page}")
+    session = state()
+    session.page = page
+    session.step = step
+    session.show_signup = False
+
+def open_signup():
+    state().show_signup = True
+
+def close_signup():
+    state().show_signup = False
+
+# =============================================================================
+# QUESTIONNAIRE
+# =============================================================================
+
+@_on_click
+def start_questionnaire():
+    _set_step("questions")
+    state().question_idx = 0
+    state().answers = {}
+    event("questionnaire_start")
+    _question_view()
+
+def answer(question_id, value):
+    state().set_answer(question_id, value)
+    event("answer", question=question_id, value=value)
+
+def next_question():
+    session = state()
+    if session.answer(QUESTIONS[session.question_idx]["id"]) is None:
+        st.toast("Pick an answer to continue.")
+        return
+    session.question_idx = min(session.question_idx + 1, len(QUESTIONS) - 1)
+    _question_view()
+
+def previous_question():
+    state().question_idx = max(state().question_idx - 1, 0)
+    _question_view()
+
+@_on_click
+def exit_questions():
+    _set_step("landing")
+    # Where people give up: the question on screen and how many they answered
+    event("questionnaire_exit", index=state().question_idx, answered=len(state().answers))
+
+def _question_view():
+    idx = state().question_idx
+    event("question_view", question=QUESTIONS[idx]["id"], index=idx)
+
+@_on_click
+def finish_questions():
+    """See results, or go to the first unanswered question if there is one."""
+    session = state()
+    unanswered = [i for i, q in enumerate(QUESTIONS) if session.answer(q["id"]) is None]
+    if unanswered:
+        session.question_idx = unanswered[0]
+        st.toast("Answer every question to see your results.")
+        _question_view()
+        return
+    show_results()
+
+@_on_click
+def show_results():
+    _set_step("results")
+    event("results", answered=len(state().answers), code=encode_answers(state().answers))
+    if state().answers:
+        careercraft_analytics.record_results(state().answers)
+    record_profile()
+
+def record_profile():
+    """Queue the current answers for the signed-in account's profile history."""
+    session = state()
+    if session.account_id and session.answers:
+        history = careercraft_history.get_history(get_secret("PROFILE_DB_PATH"))
+        history.record_later(session.account_id, session.answers)
+
+@_on_click
+def start_over():
+    _set_step("landing")
+    state().answers = {}
+    state().coach_response = None
+    event("start_over")
+
+# =============================================================================
+# USE CASES
+# =============================================================================
+
+def select_persona(idx):
+    state().persona_idx = idx
+
+def next_persona():
+    state().persona_idx += 1
+
+def previous_persona():
+    state().persona_idx -= 1
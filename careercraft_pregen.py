@@ -0,0 +1,158 @@
+"""
+CareerCraft – pre-generated coach answers
+The coach context only depends on the top career, two strengths and two gaps,
+so every reachable context can be answered offline for the common questions.
+The app consults this store before making a live provider call.
+
+Usage:
+    python careercraft_pregen.py --providers Claude ChatGPT --workers 8
+"""
+
+import argparse
+import hashlib
+import itertools
+import os
+import re
+import sqlite3
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from careercraft_engine import (
+    ANSWER_VALUES,
+    QUESTIONS,
+    build_coach_context,
+    calculate_career_matches,
+    get_strengths_and_gaps,
+)
+
+STORE_PATH = os.environ.get(
+    "CAREERCRAFT_PREGEN_STORE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "coach_answers.db"),
+)
+
+# Questions people actually type into the coach panel, starting with its placeholder
+COACH_QUESTION_TEMPLATES = [
+    "What should I focus on first?",
+    "How do I get started?",
+    "What skills should I build next?",
+    "How do I switch careers without a pay cut?",
+    "Is this career a good fit for me?",
+    "What should I do in the next 3 months?",
+]
+
+# =============================================================================
+# KEYS
+# =============================================================================
+
+def normalize_question(question):
+    return " ".join(re.sub(r"[^a-z0-9 ]", " ", question.lower()).split())
+
+def answer_key(provider, context, question):
+    raw = "\x1f".join([provider, context, normalize_question(question)])
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+def enumerate_contexts():
+    """Every distinct coach context reachable from a completed questionnaire."""
+    contexts = set()
+    ids = [q["id"] for q in QUESTIONS]
+    for combo in itertools.product(ANSWER_VALUES, repeat=len(ids)):
+        answers = dict(zip(ids, combo))
+        top_career = calculate_career_matches(answers)[0]["career"]["title"]
+        strengths, gaps = get_strengths_and_gaps(answers)
+        contexts.add(build_coach_context(strengths, gaps, top_career))
+    return sorted(contexts)
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+_TEMPLATE_KEYS = {normalize_question(q) for q in COACH_QUESTION_TEMPLATES}
+_reader = None
+
+def _connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("CREATE TABLE IF NOT EXISTS answers (key BLOB PRIMARY KEY, answer BLOB NOT NULL)")
+    return conn
+
+def lookup(provider, context, question):
+    """Return a pre-generated answer, or None if the store has no entry."""
+    global _reader
+    if normalize_question(question) not in _TEMPLATE_KEYS:
+        return None
+    if _reader is None:
+        if not os.path.exists(STORE_PATH):
+            return None
+        _reader = sqlite3.connect(f"file:{STORE_PATH}?mode=ro", uri=True, check_same_thread=False)
+    try:
+        row = _reader.execute(
+            "SELECT answer FROM answers WHERE key = ?", (answer_key(provider, context, question),)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+# =============================================================================
+# BATCH JOB
+# =============================================================================
+
+def _generate(provider, context, question):
+    from careercraft_coach import get_coach_response
+    response, error = get_coach_response(provider, question, context)
+    return provider, context, question, response, error
+
+def run(providers, workers, use_processes=False, path=STORE_PATH, limit=None):
+    contexts = enumerate_contexts()
+    if limit:
+        contexts = contexts[:limit]
+    conn = _connect(path)
+    done = {row[0] for row in conn.execute("SELECT key FROM answers")}
+    jobs = [
+        (provider, context, question)
+        for provider in providers
+        for context in contexts
+        for question in COACH_QUESTION_TEMPLATES
+        if answer_key(provider, context, question) not in done
+    ]
+    print(f"{len(contexts)} contexts, {len(jobs)} answers to generate", file=sys.stderr)
+
+    pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    started = time.perf_counter()
+    stored = failed = 0
+    with pool_cls(max_workers=workers) as pool:
+        futures = [pool.submit(_generate, *job) for job in jobs]
+        for future in as_completed(futures):
+            provider, context, question, response, error = future.result()
+            if not response:
+                failed += 1
+                print(f"{provider}: {error}", file=sys.stderr)
+                continue
+            conn.execute(
+                "INSERT OR REPLACE INTO answers (key, answer) VALUES (?, ?)",
+                (answer_key(provider, context, question), zlib.compress(response.encode("utf-8"), 9)),
+            )
+            stored += 1
+            if stored % 100 == 0:
+                conn.commit()
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+    elapsed = time.perf_counter() - started
+    print(f"stored {stored}, failed {failed} in {elapsed:.1f}s -> {path}", file=sys.stderr)
+    return stored, failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-generate coach answers for every reachable context.")
+    parser.add_argument("--providers", nargs="+", default=["CareerCraft Coach"],
+                        help="Coach names as shown in the app (Claude, ChatGPT, Gemini, CareerCraft Coach)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--processes", action="store_true", help="Use a process pool instead of threads")
+    parser.add_argument("--out", default=STORE_PATH)
+    parser.add_argument("--limit", type=int, help="Only the first N contexts (for dry runs)")
+    args = parser.parse_args(argv)
+    _, failed = run(args.providers, args.workers, args.processes, args.out, args.limit)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
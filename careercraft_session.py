@@ -0,0 +1,257 @@
+"""
+CareerCraft – session model
+Per-visitor state packed into one slotted object: answers in a bytearray (one
+byte per question), interned page/step/provider names, and the coach answer
+kept zlib-compressed. Live sessions are tracked weakly so the metrics endpoint
+can report how much memory they hold, for sizing workers, and a sweeper
+thread resets sessions that have been idle longer than a TTL and drops their
+records from the session store's memory.
+"""
+
+import logging
+import sys
+import threading
+import time
+import weakref
+import zlib
+
+from careercraft_engine import ANSWER_VALUES, QUESTIONS
+import careercraft_telemetry
+
+_QUESTION_INDEX = {q["id"]: i for i, q in enumerate(QUESTIONS)}
+
+DEFAULT_IDLE_TTL = 1800      # seconds without a script run before a session is evicted
+DEFAULT_SWEEP_INTERVAL = 60
+
+_lock = threading.Lock()
+_live = weakref.WeakSet()
+log = logging.getLogger("careercraft.sessions")
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+class Session:
+    # Answer bytes: 0 = unanswered, otherwise 1 + index into ANSWER_OPTIONS
+    __slots__ = (
+        "sid", "_page", "_step", "_coach_provider", "question_idx", "persona_idx", "show_signup",
+        "account_id", "coach_error", "_answers", "_coach_response", "last_seen", "evicted", "__weakref__",
+    )
+
+    def __init__(self, page="home", step="landing", question_idx=0, answers=None, coach_response=None,
+                 coach_provider=None, coach_error=None, show_signup=False, persona_idx=0, sid=None,
+                 account_id=None):
+        self.sid = sid
+        self.page = page
+        self.step = step
+        self.question_idx = question_idx
+        self._answers = bytearray(len(QUESTIONS))
+        self.answers = answers or {}
+        self.coach_response = coach_response
+        self.coach_provider = coach_provider
+        self.coach_error = coach_error
+        self.show_signup = show_signup
+        self.persona_idx = persona_idx
+        self.account_id = account_id
+        self.last_seen = time.monotonic()
+        self.evicted = False
+        with _lock:
+            _live.add(self)
+
+    # Page, step and provider come from a handful of names; interning makes
+    # every session point at the same string objects.
+    @property
+    def page(self):
+        return self._page
+
+    @page.setter
+    def page(self, value):
+        self._page = _intern(value)
+
+    @property
+    def step(self):
+        return self._step
+
+    @step.setter
+    def step(self, value):
+        self._step = _intern(value)
+
+    @property
+    def coach_provider(self):
+        return self._coach_provider
+
+    @coach_provider.setter
+    def coach_provider(self, value):
+        self._coach_provider = _intern(value)
+
+    @property
+    def answers(self):
+        """Answered questions as {question id: value}, in question order."""
+        return {q["id"]: ANSWER_VALUES[b - 1] for q, b in zip(QUESTIONS, self._answers) if b}
+
+    @answers.setter
+    def answers(self, answers):
+        self._answers[:] = bytes(len(QUESTIONS))
+        for question_id, value in answers.items():
+            self.set_answer(question_id, value)
+
+    def answer(self, question_id):
+        b = self._answers[_QUESTION_INDEX[question_id]]
+        return ANSWER_VALUES[b - 1] if b else None
+
+    def set_answer(self, question_id, value):
+        self._answers[_QUESTION_INDEX[question_id]] = ANSWER_VALUES.index(value) + 1
+
+    @property
+    def coach_response(self):
+        if self._coach_response is None:
+            return None
+        return zlib.decompress(self._coach_response).decode("utf-8")
+
+    @coach_response.setter
+    def coach_response(self, value):
+        self._coach_response = None if value is None else zlib.compress(value.encode("utf-8"))
+
+    def to_record(self):
+        """The resumable part of the session as JSON-safe data, for a session store.
+
+        account_id is left out: records are keyed by a token that travels in
+        the URL, and holding it must not sign anyone in.
+        """
+        return {
+            "page": self.page,
+            "step": self.step,
+            "question_idx": self.question_idx,
+            "answers": self._answers.hex(),
+            "coach_response": self.coach_response,
+            "coach_provider": self.coach_provider,
+            "coach_error": self.coach_error,
+            "show_signup": self.show_signup,
+            "persona_idx": self.persona_idx,
+        }
+
+    def load_record(self, record):
+        answers = bytes.fromhex(record.get("answers", ""))
+        if len(answers) == len(QUESTIONS):
+            self._answers[:] = answers
+        for name in ("page", "step", "question_idx", "coach_response", "coach_provider",
+                     "coach_error", "show_signup", "persona_idx"):
+            if name in record:
+                setattr(self, name, record[name])
+        return self
+
+    def touch(self):
+        """Mark activity; called at the start of every script run."""
+        self.last_seen = time.monotonic()
+        self.evicted = False
+
+    def evict(self):
+        """Drop everything but the object itself and who is signed in; returns the bytes freed.
+
+        The store record it is reloaded from carries no account, so account_id stays.
+        """
+        before = self.nbytes()
+        self.page = "home"
+        self.step = "landing"
+        self.question_idx = 0
+        self.answers = {}
+        self.coach_response = None
+        self.coach_provider = None
+        self.coach_error = None
+        self.show_signup = False
+        self.persona_idx = 0
+        self.evicted = True
+        return before - self.nbytes()
+
+    def nbytes(self):
+        """Bytes this session holds on its own; interned names are shared and not counted."""
+        size = sys.getsizeof(self) + sys.getsizeof(self._answers)
+        if self._coach_response is not None:
+            size += sys.getsizeof(self._coach_response)
+        if self.coach_error is not None:
+            size += sys.getsizeof(self.coach_error)
+        if self.account_id is not None:
+            size += sys.getsizeof(self.account_id)
+        return size
+
+# =============================================================================
+# MEMORY ACCOUNTING
+# =============================================================================
+
+def memory_stats():
+    """Live session count and their total, mean and largest footprint in bytes."""
+    with _lock:
+        sizes = [session.nbytes() for session in list(_live)]
+    total = sum(sizes)
+    return {
+        "sessions": len(sizes),
+        "total": total,
+        "mean": total / len(sizes) if sizes else 0.0,
+        "max": max(sizes, default=0),
+    }
+
+def _memory_series():
+    stats = memory_stats()
+    return {(("stat", stat),): stats[stat] for stat in ("total", "mean", "max")}
+
+SESSIONS = careercraft_telemetry.Gauge(
+    "careercraft_sessions", "Live sessions in this process",
+    lambda: {(): memory_stats()["sessions"]},
+)
+SESSION_BYTES = careercraft_telemetry.Gauge(
+    "careercraft_session_memory_bytes", "Memory held by session state", _memory_series,
+)
+careercraft_telemetry.METRICS.extend([SESSIONS, SESSION_BYTES])
+
+# =============================================================================
+# IDLE EVICTION
+# =============================================================================
+
+EVICTIONS = careercraft_telemetry.Counter(
+    "careercraft_session_evictions_total", "Sessions reset after sitting idle past the TTL"
+)
+RECLAIMED_BYTES = careercraft_telemetry.Counter(
+    "careercraft_session_reclaimed_bytes_total", "Session memory freed by idle eviction"
+)
+careercraft_telemetry.METRICS.extend([EVICTIONS, RECLAIMED_BYTES])
+
+_sweeper = None
+
+def sweep(ttl=DEFAULT_IDLE_TTL, now=None, store=None):
+    """Evict sessions idle for at least ttl seconds; returns (evicted, bytes freed).
+
+    With a store, each session's record is evicted from it too, and the bytes
+    it held in memory count towards those freed.
+    """
+    now = time.monotonic() if now is None else now
+    with _lock:
+        idle = [s for s in list(_live) if not s.evicted and now - s.last_seen >= ttl]
+    freed = 0
+    for session in idle:
+        freed += session.evict()
+        if store is not None and session.sid:
+            freed += store.evict(session.sid)
+    if idle:
+        EVICTIONS.inc((), len(idle))
+        RECLAIMED_BYTES.inc((), freed)
+        log.info("evicted %d idle session(s), reclaimed %d bytes", len(idle), freed)
+    return len(idle), freed
+
+def _sweep_forever(ttl, interval, store):
+    while True:
+        time.sleep(interval)
+        try:
+            sweep(ttl, store=store)
+        except Exception:
+            log.exception("session sweep failed")
+
+def start_sweeper(ttl=DEFAULT_IDLE_TTL, interval=DEFAULT_SWEEP_INTERVAL, store=None):
+    """Start the idle-session sweeper once per process; ttl=0 disables it."""
+    global _sweeper
+    ttl = float(ttl or 0)
+    with _lock:
+        if _sweeper is not None or not ttl:
+            return
+        _sweeper = threading.Thread(
+            target=_sweep_forever, args=(ttl, min(float(interval), ttl), store), name="session-sweeper", daemon=True,
+        )
+    _sweeper.start()
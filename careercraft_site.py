@@ -0,0 +1,160 @@
+"""
+CareerCraft – static site export
+Renders the landing, About and Use Cases pages to plain HTML/CSS under site/,
+from the same templates and content the app uses. Serve site/ from any web
+server or CDN; the Start, Sign up and Try buttons link into the Streamlit app
+with ?go=..., so only visitors who start the questionnaire open a session.
+
+    python careercraft_site.py --app-url https://app.example.com/
+"""
+
+import argparse
+import os
+import shutil
+import sys
+
+import careercraft_assets
+import careercraft_media
+import careercraft_templates as tpl
+from careercraft_content import PERSONAS, about_fragments, persona_fragments
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(ROOT, "site")
+SITE_CSS = os.path.join(careercraft_assets.ASSETS_DIR, "site.css")
+FONTS_DIR = os.path.join(careercraft_assets.STATIC_DIR, "fonts")
+DEFAULT_APP_URL = "/app/"
+
+NAV = [("Home", "index.html"), ("About", "about.html"), ("Use Cases", "usecases.html")]
+
+# =============================================================================
+# PAGES
+# =============================================================================
+
+def persona_page(idx):
+    return "usecases.html" if idx == 0 else f"usecases-{PERSONAS[idx]['id']}.html"
+
+def app_link(app_url, go):
+    return f"{app_url}{'&' if '?' in app_url else '?'}go={go}"
+
+def button(href, label, variant=""):
+    return tpl.LINK_BUTTON.fill(href=href, label=label, variant=variant)
+
+def centered(markup):
+    return tpl.BUTTON_ROW.fill(left="", center=markup, right="")
+
+def nav(current, app_url):
+    links = [button(href, label, "" if href == current else "secondary") for label, href in NAV]
+    links.append(button(app_link(app_url, "signup"), "Sign up", "secondary"))
+    return tpl.Markup(tpl.LOGO.fill() + tpl.SITE_NAV.fill(links=tpl.Markup("".join(links))))
+
+def video(slug):
+    return careercraft_media.video_markup(slug, "media") or ""
+
+def landing_body(app_url):
+    start = centered(button(app_link(app_url, "start"), "Start CareerCheck"))
+    return "".join([
+        tpl.LANDING_HERO.fill(),
+        video("intro"),
+        tpl.VIDEO_CAPTION.fill(caption="See how CareerCraft matches you to careers"),
+        tpl.LANDING_DATA_GRID.fill(),
+        start,
+        tpl.FOOTER_NOTE.fill(text="No signup required to start."),
+        tpl.LANDING_FEATURES.fill(),
+        tpl.VIDEO_TITLE.fill(title="Your results, explained"),
+        video("results-explained"),
+        tpl.VIDEO_CAPTION.fill(caption="How we turn your answers into actionable insights"),
+        tpl.CTA_CARD.fill(style="margin-top: 1.5rem;", title="Ready to find your path?", body="Takes 3 minutes. No signup required."),
+        start,
+    ])
+
+def about_body():
+    return "".join(about_fragments()) + centered(button("index.html", "Try CareerCheck"))
+
+def usecases_body(idx):
+    tiles = tpl.TILE_ROW.fill(tiles=tpl.Markup("".join(
+        button(persona_page(i), p["name"], "" if i == idx else "secondary") for i, p in enumerate(PERSONAS)
+    )))
+    dots_html, persona_html = persona_fragments(idx)
+    previous = button(persona_page(idx - 1), "Previous", "secondary") if idx > 0 else ""
+    if idx < len(PERSONAS) - 1:
+        following = button(persona_page(idx + 1), "Next")
+    else:
+        following = button("index.html", "Try It Free")
+    return "".join([
+        tpl.SECTION_HEADER.fill(title="Problems We Solve", subtitle="Real challenges. Real solutions."),
+        tiles,
+        dots_html,
+        persona_html,
+        tpl.BUTTON_ROW.fill(left=previous, center="", right=following),
+        tpl.CTA_CARD.fill(
+            style="margin-top: 2rem;",
+            title="Sound familiar?",
+            body="Take the free CareerCheck assessment and get your personalised career matches in 3 minutes.",
+        ),
+    ])
+
+def render_pages(app_url, head):
+    """{filename: html} for every exported page."""
+    pages = {
+        "index.html": ("CareerCraft", "index.html", landing_body(app_url)),
+        "about.html": ("About – CareerCraft", "about.html", about_body()),
+    }
+    for idx, persona in enumerate(PERSONAS):
+        title = f"{persona['name']}: {persona['archetype']} – CareerCraft"
+        pages[persona_page(idx)] = (title, "usecases.html", usecases_body(idx))
+    return {
+        filename: tpl.SITE_PAGE.fill(title=title, head=head, body=tpl.Markup(nav(section, app_url) + body))
+        for filename, (title, section, body) in pages.items()
+    }
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def write_stylesheet(out_dir):
+    _, css = careercraft_assets.build_stylesheet()
+    with open(SITE_CSS, encoding="utf-8") as f:
+        css += careercraft_assets.minify_css(f.read())
+    data = css.encode("utf-8")
+    filename = f"careercraft.{careercraft_assets.content_hash(data)}.css"
+    with open(os.path.join(out_dir, filename), "wb") as f:
+        f.write(data)
+    return filename
+
+def copy_assets(out_dir):
+    if os.path.isdir(FONTS_DIR):
+        shutil.copytree(FONTS_DIR, os.path.join(out_dir, "fonts"))
+    media_dir = os.path.join(out_dir, "media")
+    for entry in careercraft_media.load_manifest(wait=True).values():
+        os.makedirs(media_dir, exist_ok=True)
+        for name in (entry["file"], entry.get("poster")):
+            if name:
+                shutil.copyfile(os.path.join(careercraft_media.MEDIA_DIR, name), os.path.join(media_dir, name))
+
+def export(out_dir=OUTPUT_DIR, app_url=DEFAULT_APP_URL):
+    """Write the static pages and their assets to out_dir, replacing it."""
+    tmp = f"{out_dir}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    stylesheet = write_stylesheet(tmp)
+    copy_assets(tmp)
+    head = tpl.Markup(careercraft_assets.font_preload_tags(".") + f'<link rel="stylesheet" href="{stylesheet}">')
+    pages = render_pages(app_url, head)
+    for filename, page in pages.items():
+        with open(os.path.join(tmp, filename), "w", encoding="utf-8") as f:
+            f.write(page)
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp, out_dir)
+    return sorted(pages)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the marketing pages as a static site.")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="Output directory (replaced)")
+    parser.add_argument("--app-url", default=DEFAULT_APP_URL, help="URL of the Streamlit app the Start buttons open")
+    args = parser.parse_args(argv)
+    for filename in export(args.out, args.app_url):
+        print(os.path.join(args.out, filename), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
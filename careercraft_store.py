@@ -0,0 +1,186 @@
+"""
+CareerCraft – session store
+Keeps each session's resumable state (answers, step, question index, coach
+answer) outside st.session_state, keyed by the ?sid= token in the URL, so a
+reload or any other worker can pick the session up.
+
+Backends: "memory" (this process only) and "sqlite" (a WAL database shared by
+every worker on the host). Writes are buffered and flushed in batches by a
+background thread; reads go through a small LRU cache.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+import careercraft_db
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sessions.db")
+CACHE_SIZE = 4096
+FLUSH_INTERVAL = 0.5        # seconds a write may wait before it is committed
+BATCH_SIZE = 256            # pending writes that trigger an early flush
+RETENTION = 7 * 24 * 3600   # sqlite rows untouched this long are pruned
+
+def encode(record):
+    return zlib.compress(json.dumps(record, separators=(",", ":")).encode("utf-8"))
+
+def decode(data):
+    return json.loads(zlib.decompress(data))
+
+class _LRU:
+    def __init__(self, size):
+        self.size = size
+        self.items = OrderedDict()
+
+    def get(self, key):
+        value = self.items.get(key)
+        if value is not None:
+            self.items.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.items[key] = value
+        self.items.move_to_end(key)
+        while len(self.items) > self.size:
+            self.items.popitem(last=False)
+
+    def pop(self, key):
+        return self.items.pop(key, None)
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class MemoryStore:
+    """Records for sessions served by this process; survives a page reload, not idle eviction."""
+
+    def __init__(self, size=CACHE_SIZE):
+        self._lock = threading.Lock()
+        self._records = _LRU(size)
+
+    def get(self, sid, fresh=False):
+        with self._lock:
+            data = self._records.get(sid)
+        return decode(data) if data is not None else None
+
+    def put(self, sid, record):
+        data = encode(record)
+        with self._lock:
+            self._records.put(sid, data)
+
+    def evict(self, sid):
+        """Forget an idle session's record; returns the bytes freed."""
+        with self._lock:
+            data = self._records.pop(sid)
+        return 0 if data is None else sys.getsizeof(data)
+
+    def flush(self):
+        pass
+
+class SQLiteStore:
+    """Records in a WAL-mode SQLite file that every worker on the host shares."""
+
+    def __init__(self, path=DEFAULT_PATH, cache_size=CACHE_SIZE,
+                 flush_interval=FLUSH_INTERVAL, batch_size=BATCH_SIZE, retention=RETENTION):
+        self.path = path
+        self.batch_size = batch_size
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._cache = _LRU(cache_size)
+        self._db = careercraft_db.SQLiteFile(path)
+        conn = self._db.connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions "
+            "(sid TEXT PRIMARY KEY, data BLOB NOT NULL, updated REAL NOT NULL)"
+        )
+        conn.commit()
+        self._last_prune = 0.0
+        self._writer = careercraft_db.WriteBehind("session-store", self.flush, flush_interval, self._maintain)
+
+    def get(self, sid, fresh=False):
+        """Pending write, then cache, then the database.
+
+        fresh=True skips the cache: use it when resuming a session another
+        worker may have written since this process last saw it.
+        """
+        with self._lock:
+            data = self._pending.get(sid) or (None if fresh else self._cache.get(sid))
+        if data is None:
+            row = self._db.connection().execute("SELECT data FROM sessions WHERE sid = ?", (sid,)).fetchone()
+            if row is None:
+                return None
+            data = row[0]
+            with self._lock:
+                self._cache.put(sid, data)
+        return decode(data)
+
+    def put(self, sid, record):
+        data = encode(record)
+        with self._lock:
+            if self._cache.get(sid) == data:
+                return
+            self._pending[sid] = data
+            self._cache.put(sid, data)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._writer.wake()
+
+    def evict(self, sid):
+        """Drop an idle session's cached copy; the database keeps it. Returns the bytes freed."""
+        with self._lock:
+            data = self._cache.pop(sid)
+        return 0 if data is None else sys.getsizeof(data)
+
+    def flush(self):
+        """Commit every pending write in one transaction."""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return 0
+        now = time.time()
+        conn = self._db.connection()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO sessions (sid, data, updated) VALUES (?, ?, ?) "
+                    "ON CONFLICT(sid) DO UPDATE SET data = excluded.data, updated = excluded.updated",
+                    [(sid, data, now) for sid, data in batch.items()],
+                )
+        except sqlite3.Error:
+            # Requeue whatever hasn't been superseded and retry next round
+            with self._lock:
+                self._pending = {**batch, **self._pending}
+            raise
+        return len(batch)
+
+    def prune(self, now=None):
+        cutoff = (time.time() if now is None else now) - self.retention
+        conn = self._db.connection()
+        with conn:
+            return conn.execute("DELETE FROM sessions WHERE updated < ?", (cutoff,)).rowcount
+
+    def _maintain(self):
+        """Background round: flush, and prune at most once an hour."""
+        self.flush()
+        if time.monotonic() - self._last_prune > 3600:
+            self._last_prune = time.monotonic()
+            self.prune()
+
+# =============================================================================
+# SELECTION
+# =============================================================================
+
+BACKENDS = {"memory": MemoryStore, "sqlite": SQLiteStore}
+
+@careercraft_db.process_wide
+def get_store(backend="memory", path=None):
+    """The process-wide store; the first call decides the backend."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown session store: {backend}")
+    return SQLiteStore(path or DEFAULT_PATH) if backend == "sqlite" else MemoryStore()
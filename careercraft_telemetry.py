@@ -0,0 +1,254 @@
+"""
+CareerCraft – coach telemetry
+Latency, time-to-first-token, token, error and fallback metrics per provider
+and model, plus script and session gauges, exported in Prometheus text format
+over HTTP and to a rotating file.
+"""
+
+import bisect
+import functools
+import logging
+import logging.handlers
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 21.0, 34.0)
+SCRIPT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+QUANTILES = (0.5, 0.95, 0.99)
+
+_lock = threading.Lock()
+
+# =============================================================================
+# METRIC TYPES
+# =============================================================================
+
+class Histogram:
+    def __init__(self, name, help_text, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = buckets
+        self.series = {}
+
+    def observe(self, labels, value):
+        with _lock:
+            counts, total = self.series.get(labels, (None, 0.0))
+            if counts is None:
+                counts = [0] * (len(self.buckets) + 1)
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.series[labels] = (counts, total + value)
+
+    def quantile(self, labels, q):
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        with _lock:
+            counts, _ = self.series.get(labels, (None, 0.0))
+            counts = list(counts) if counts else None
+        if not counts or not sum(counts):
+            return None
+        rank = q * sum(counts)
+        seen = 0
+        for i, count in enumerate(counts):
+            if seen + count >= rank and count:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with _lock:
+            series = {labels: (list(c), t) for labels, (c, t) in self.series.items()}
+        for labels, (counts, total) in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_fmt(labels, le=le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_fmt(labels)} {total:.6f}")
+            lines.append(f"{self.name}_count{_fmt(labels)} {cumulative}")
+        quantile_name = f"{self.name}_quantile"
+        lines += [f"# HELP {quantile_name} Estimated {self.name} quantiles", f"# TYPE {quantile_name} gauge"]
+        for labels in sorted(series):
+            for q in QUANTILES:
+                lines.append(f"{quantile_name}{_fmt(labels, quantile=str(q))} {self.quantile(labels, q):.6f}")
+        return lines
+
+class Counter:
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.series = {}
+
+    def inc(self, labels, amount=1):
+        with _lock:
+            self.series[labels] = self.series.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with _lock:
+            series = dict(self.series)
+        for labels, value in sorted(series.items()):
+            lines.append(f"{self.name}{_fmt(labels)} {value}")
+        return lines
+
+class Gauge:
+    """Value read at scrape time: collect() returns {labels: value}."""
+
+    def __init__(self, name, help_text, collect):
+        self.name = name
+        self.help = help_text
+        self.collect = collect
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        for labels, value in sorted(self.collect().items()):
+            lines.append(f"{self.name}{_fmt(labels)} {value:g}")
+        return lines
+
+def _fmt(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ""
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return "{" + body + "}"
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# =============================================================================
+# COACH METRICS
+# =============================================================================
+
+REQUEST_SECONDS = Histogram("careercraft_coach_request_seconds", "Coach provider call latency")
+TTFT_SECONDS = Histogram("careercraft_coach_ttft_seconds", "Time to first streamed token")
+TOKENS = Counter("careercraft_coach_tokens_total", "Tokens consumed by coach calls")
+ERRORS = Counter("careercraft_coach_errors_total", "Coach provider errors by exception class")
+FALLBACKS = Counter("careercraft_coach_fallbacks_total", "Coach requests answered by the fallback coach")
+
+METRICS = [REQUEST_SECONDS, TTFT_SECONDS, TOKENS, ERRORS, FALLBACKS]
+
+class CoachCall:
+    """Timing and usage for one provider call; finish() records it."""
+
+    def __init__(self, provider, model):
+        self.labels = (("provider", provider), ("model", model))
+        self.started = time.perf_counter()
+        self.ttft = None
+        self.input_tokens = None
+        self.output_tokens = None
+        self.error_class = None
+
+    def first_token(self):
+        if self.ttft is None:
+            self.ttft = time.perf_counter() - self.started
+
+    def usage(self, input_tokens, output_tokens):
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+
+    def fail(self, exc):
+        self.error_class = type(exc).__name__
+
+    def finish(self):
+        elapsed = time.perf_counter() - self.started
+        REQUEST_SECONDS.observe(self.labels, elapsed)
+        if self.ttft is not None:
+            TTFT_SECONDS.observe(self.labels, self.ttft)
+        if self.input_tokens is not None:
+            TOKENS.inc(self.labels + (("direction", "input"),), self.input_tokens)
+        if self.output_tokens is not None:
+            TOKENS.inc(self.labels + (("direction", "output"),), self.output_tokens)
+        if self.error_class:
+            ERRORS.inc(self.labels + (("error_class", self.error_class),))
+        return elapsed
+
+def record_fallback(provider, reason):
+    FALLBACKS.inc((("provider", provider), ("reason", reason)))
+
+# =============================================================================
+# SCRIPT RUNS
+# =============================================================================
+
+SCRIPT_SECONDS = Histogram(
+    "careercraft_script_run_seconds", "Script execution time per rerun scope", SCRIPT_BUCKETS
+)
+METRICS.append(SCRIPT_SECONDS)
+
+def timed(scope):
+    """Record each call's duration, including ones cut short by st.rerun()."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                SCRIPT_SECONDS.observe((("scope", scope),), time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+def render_prometheus():
+    lines = []
+    for metric in METRICS:
+        lines += metric.render()
+    return "\n".join(lines) + "\n"
+
+# =============================================================================
+# EXPORTERS
+# =============================================================================
+
+_started = False
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def _write_snapshots(path, interval, max_bytes, backups):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    logger = logging.getLogger("careercraft.metrics")
+    logger.propagate = False
+    handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    while True:
+        time.sleep(interval)
+        logger.info("# snapshot %d\n%s", int(time.time()), render_prometheus())
+
+def start_exporters(port=9464, path="metrics/coach.prom", interval=60, max_bytes=5_000_000, backups=5):
+    """Start the /metrics endpoint and file exporter once per process.
+
+    port=0 or path=None disables the corresponding exporter. When several
+    workers share a host only the first to bind the port serves it.
+    """
+    global _started
+    with _lock:
+        if _started:
+            return
+        _started = True
+    port = int(port or 0)
+    if port:
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", port), _MetricsHandler)
+            threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        except OSError:
+            pass
+    if path:
+        threading.Thread(
+            target=_write_snapshots, args=(path, interval, max_bytes, backups),
+            name="metrics-file", daemon=True,
+        ).start()
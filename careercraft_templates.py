@@ -0,0 +1,303 @@
+"""
+CareerCraft – HTML templates
+Page sections compiled once at import and filled with escaped data, so each
+section goes to the frontend as a single st.markdown element.
+"""
+
+import html
+from string import Formatter
+
+class Markup(str):
+    """Already-rendered HTML that fill() must not escape again."""
+
+class Template:
+    def __init__(self, source):
+        # One line per template: markdown would treat indented lines after a
+        # blank line as a code block, and whitespace is wasted bytes anyway.
+        flat = " ".join(line.strip() for line in source.strip().splitlines() if line.strip())
+        self.parts = []
+        for literal, field, _, _ in Formatter().parse(flat):
+            if literal:
+                self.parts.append((True, literal))
+            if field is not None:
+                self.parts.append((False, field))
+
+    def fill(self, **data):
+        out = []
+        for is_literal, part in self.parts:
+            if is_literal:
+                out.append(part)
+            else:
+                value = data[part]
+                out.append(value if isinstance(value, Markup) else html.escape(str(value)))
+        return Markup("".join(out))
+
+    def fill_each(self, rows):
+        return Markup("".join(self.fill(**row) for row in rows))
+
+_fragments = {}
+
+def cached(key, build):
+    """Process-wide cache of rendered HTML; include a data hash in key."""
+    html_out = _fragments.get(key)
+    if html_out is None:
+        html_out = _fragments[key] = build()
+    return html_out
+
+def paragraphs(text):
+    return Markup("".join(f"<p>{html.escape(p.strip())}</p>" for p in text.split("\n\n") if p.strip()))
+
+# =============================================================================
+# SHARED
+# =============================================================================
+
+SECTION_HEADER = Template('''
+    <div class="section-header">
+        <div class="section-title">{title}</div>
+        <div class="section-subtitle">{subtitle}</div>
+    </div>
+''')
+
+PITCH_ITEM = Template('''
+    <div class="pitch-item">
+        <div class="pitch-num">{num}</div>
+        <div class="pitch-text"><strong>{title}</strong> {desc}</div>
+    </div>
+''')
+
+CARD = Template('''
+    <div class="card">
+        <div class="card-title">{title}</div>
+        {body}
+    </div>
+''')
+
+CTA_CARD = Template('''
+    <div class="cta-card" style="{style}">
+        <div class="cta-title">{title}</div>
+        <div class="cta-body">{body}</div>
+    </div>
+''')
+
+COMMUNITY_CARD = Template('''
+    <div class="community-card">
+        <div class="community-title">{title}</div>
+        <div class="community-body">{body}</div>
+    </div>
+''')
+
+ABOUT_BODY = Template('<div class="about-body">{text}</div>')
+
+DATA_CARD = Template('''
+    <div class="data-card">
+        <div class="data-value" style="font-size: 1.1rem;">{value}</div>
+        <div class="data-label">{line1}<br>{line2}</div>
+    </div>
+''')
+
+DATA_GRID = Template('<div class="data-grid">{cards}</div>')
+
+LOGO = Template('''
+    <div class="logo" style="margin-bottom: 0.75rem;">
+        <div class="logo-mark">C</div>
+        <div class="logo-text">CareerCraft</div>
+    </div>
+''')
+
+FOOTER_NOTE = Template('<p class="footer-note">{text}</p>')
+
+# =============================================================================
+# HOME
+# =============================================================================
+
+LANDING_HERO = Template('''
+    <div class="hero">
+        <div class="hero-badge">
+            <span class="hero-dot"></span>
+            Free assessment, 3 minutes
+        </div>
+        <h1 class="hero-title">Get <em>clarity</em> on your career.</h1>
+        <p class="hero-sub">
+            Answer 7 questions. Get matched to careers with real salary data.
+            Talk to AI coaches. Walk away with a 4-week plan.
+        </p>
+    </div>
+''')
+
+LANDING_DATA_GRID = Template('''
+    <div class="data-grid">
+        <div class="data-card">
+            <div class="data-value">7</div>
+            <div class="data-label">Questions</div>
+        </div>
+        <div class="data-card">
+            <div class="data-value">8+</div>
+            <div class="data-label">Career Matches</div>
+        </div>
+        <div class="data-card">
+            <div class="data-value">3</div>
+            <div class="data-label">AI Coaches</div>
+        </div>
+    </div>
+''')
+
+LANDING_FEATURES = Template('''
+    <div class="card" style="margin-top: 1.5rem;">
+        <div class="card-title">What you'll get</div>
+        <div class="pitch-item">
+            <div class="pitch-num">1</div>
+            <div class="pitch-text"><strong>Personalised career matches</strong> based on your work style, not just your resume</div>
+        </div>
+        <div class="pitch-item">
+            <div class="pitch-num">2</div>
+            <div class="pitch-text"><strong>Real salary data</strong> from 800+ occupations so you know what to expect</div>
+        </div>
+        <div class="pitch-item">
+            <div class="pitch-num">3</div>
+            <div class="pitch-text"><strong>AI career coaches</strong> to help you think through your next move</div>
+        </div>
+        <div class="pitch-item">
+            <div class="pitch-num">4</div>
+            <div class="pitch-text"><strong>A 4-week action plan</strong> with concrete steps to get started</div>
+        </div>
+    </div>
+''')
+
+VIDEO_TITLE = Template('<div class="card-title" style="text-align: center; margin-top: 2rem;">{title}</div>')
+
+VIDEO_CAPTION = Template('<p class="video-caption">{caption}</p>')
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+PILL = Template('<span class="pill {variant}">{label}</span>')
+
+PILL_CARD = Template('''
+    <div class="card">
+        <div class="result-label">{label}</div>
+        {pills}
+    </div>
+''')
+
+DIRECTION_CARD = Template('''
+    <div class="direction-card {variant}">
+        <div class="direction-type">{kind}</div>
+        <div class="direction-title">{title}</div>
+        <div class="direction-meta">{range} | {subtitle}</div>
+        <div class="direction-match">{match}%</div>
+    </div>
+''')
+
+MATCHES_CARD = Template('''
+    <div class="card">
+        <div class="result-label">Career Matches</div>
+        {directions}
+    </div>
+''')
+
+ROADMAP = Template('''
+    <div class="timeline-card">
+        <div class="timeline-header">Your 12-Month Roadmap</div>
+        <div class="timeline">
+            <div class="tl-item tl-week1">
+                <div class="tl-label">Next 4 weeks</div>
+                <div class="tl-title">Talk to 2 {career}s, start 1 small project, sample 1 short course or YouTube playlist.</div>
+            </div>
+            <div class="tl-item tl-6months">
+                <div class="tl-label">By 6 months</div>
+                <div class="tl-title">Commit to one pathway: a specific course, project, or role shift you are actively working towards.</div>
+            </div>
+            <div class="tl-item tl-8months">
+                <div class="tl-label">By 8 months</div>
+                <div class="tl-title">Ship something real that others can see - a portfolio piece, case study, internal project, or certification.</div>
+            </div>
+            <div class="tl-item tl-12months">
+                <div class="tl-label">By 12 months</div>
+                <div class="tl-title">Review your skills, income, and satisfaction. Decide whether to double down on {career} or pivot with what you've learned.</div>
+            </div>
+        </div>
+    </div>
+''')
+
+COACH_HEADER = Template('''
+    <div class="coach-section">
+        <div class="coach-title">Talk to a Career Coach</div>
+        <div class="coach-subtitle">Get personalized advice powered by AI</div>
+    </div>
+''')
+
+COACH_RESPONSE = Template('''
+    <div class="coach-response">{paragraphs}</div>
+    <div class="coach-provider">Response from {provider}</div>
+''')
+
+# =============================================================================
+# USE CASES
+# =============================================================================
+
+DOT = Template('<span class="dot {active}"></span>')
+
+DOTS = Template('<div class="dots-container">{dots}</div>')
+
+PAIN_POINT = Template('<div class="usecase-pain-point">{point}</div>')
+
+STAT = Template('<span class="usecase-stat">{stat}</span>')
+
+PERSONA = Template('''
+    <div class="usecase-card">
+        <div class="usecase-header">
+            <div class="usecase-name">{name}</div>
+            <div class="usecase-archetype">{archetype}</div>
+            <div class="usecase-meta">{stage} · Age {age}</div>
+        </div>
+        <div class="usecase-problem">
+            <div class="usecase-label">The Problem</div>
+            <div class="usecase-problem-text">{problem}</div>
+        </div>
+        <div class="usecase-story">{story}</div>
+    </div>
+    <div class="usecase-section">
+        <div class="usecase-label">What's Not Working</div>
+        {pain_points}
+    </div>
+    <div class="usecase-solution">
+        <div class="usecase-solution-label">How CareerCraft Helps</div>
+        <div class="usecase-solution-text">{how_we_help}</div>
+    </div>
+    <div class="usecase-outcome">
+        <div class="usecase-outcome-label">The Outcome</div>
+        <div class="usecase-outcome-text">{outcome}</div>
+    </div>
+    <div class="usecase-stats">{stats}</div>
+''')
+
+# =============================================================================
+# STATIC SITE
+# =============================================================================
+
+SITE_PAGE = Template('''
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <title>{title}</title>
+        {head}
+    </head>
+    <body>
+        <main class="cc-page">{body}</main>
+    </body>
+    </html>
+''')
+
+SITE_NAV = Template('''
+    <nav class="cc-nav">{links}</nav>
+    <hr style="margin: 0.75rem 0 1.5rem; border: none; border-top: 1px solid #e8e5e0;">
+''')
+
+LINK_BUTTON = Template('<a class="cc-button {variant}" href="{href}">{label}</a>')
+
+BUTTON_ROW = Template('<div class="cc-button-row"><div>{left}</div><div>{center}</div><div>{right}</div></div>')
+
+TILE_ROW = Template('<div class="cc-tiles">{tiles}</div>')